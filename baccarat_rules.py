@@ -2,15 +2,9 @@
 """
 Defines the rules, card values, hand calculations, and win conditions for Baccarat.
 """
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Optional
 
-from card import Card
-
-# --- Baccarat Card Values ---
-BACCARAT_VALUES: Dict[str, int] = {
-    "A": 1, "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8, "9": 9,
-    "T": 0, "J": 0, "Q": 0, "K": 0
-}
+from card import Card, BACCARAT_VALUES # Baccarat card values, also precomputed on every card
 
 # --- Payout Constants ---
 # Standard payouts: Player 1:1, Banker 1:1 (with 5% commission on win), Tie 8:1
@@ -21,6 +15,10 @@ TIE_PAYOUT = 8.0
 LOSS_PAYOUT = -1.0
 PUSH_PAYOUT = 0.0 # For Tie when bet is on Player/Banker
 
+# --- Shoe (see shoe.py) ---
+SHOE_NUM_DECKS = 8
+SHOE_PENETRATION = 0.85 # Fraction of the shoe dealt before the cut card
+
 # --- Bet Types ---
 BET_PLAYER = "Player"
 BET_BANKER = "Banker"
@@ -28,7 +26,9 @@ BET_TIE = "Tie"
 
 def get_baccarat_hand_value(hand: List[Card]) -> int:
     """Calculates the value of a Baccarat hand (sum modulo 10)."""
-    value = sum(BACCARAT_VALUES.get(card.rank, 0) for card in hand)
+    value = 0
+    for card in hand:
+        value += card.baccarat_value
     return value % 10
 
 def is_natural(hand: List[Card]) -> bool:
@@ -53,7 +53,7 @@ def should_banker_draw(banker_hand: List[Card], player_third_card: Optional[Card
         return banker_value <= 5
     else:
         # Player DID draw a third card. Banker's draw depends on complex rules:
-        player_third_card_value = BACCARAT_VALUES.get(player_third_card.rank, 0)
+        player_third_card_value = player_third_card.baccarat_value
 
         if banker_value <= 2:
             return True
@@ -0,0 +1,175 @@
+# /bench.py
+"""
+Micro-benchmarks of the rules engines, with a baseline regression gate.
+
+Each benchmark calls one hot path over a fixed batch of inputs generated from
+a fixed seed, so every run times the same work. A batch is timed `--repeat`
+times with the garbage collector off (as timeit does); the best time per call
+is the figure compared, the median is reported alongside it. Timings vary
+between interpreter processes (hash seeds, memory layout), so each benchmark
+runs in `--processes` fresh processes, one after another, and the best of
+them is kept.
+
+Results are written as JSON. With a stored baseline (recorded on the same
+machine with --save-baseline), the run fails (exit status 1) when a benchmark
+is slower than its baseline by more than `--margin` (a fraction, 0.25 = 25%).
+
+Usage:  python bench.py --save-baseline          # Record the baseline
+        python bench.py [--margin 0.25] [--only evaluate_hand Deck.shuffle]
+"""
+import argparse
+import gc
+import multiprocessing
+import platform
+import random
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from baccarat_rules import get_baccarat_hand_value, should_banker_draw
+from bench_baseline import add_baseline_arguments, finish_run, format_ratio
+from blackjack_rules import determine_winner, get_hand_value
+from deck import Deck, fresh_codes
+from poker_rules import evaluate_hand
+from rng import RngService
+from roulette_rules import get_winning_numbers_for_bet
+from slots_rules import SLOTS_COST_PER_SPIN, calculate_winnings, spin_reels
+
+BENCH_SEED = 20240501 # Inputs are the same on every run
+BATCH_SIZE = 2_000 # Calls per timed batch
+DEFAULT_REPEAT = 25 # Timed batches per process
+DEFAULT_PROCESSES = 5
+DEFAULT_MARGIN = 0.25
+RESULTS_FILENAME = "bench_results.json"
+BASELINE_FILENAME = "bench_baseline.json"
+
+# Every roulette bet key the table offers
+ROULETTE_BET_KEYS = ([f"number_{n}" for n in range(37)] + ["color_red", "color_black", "parity_even", "parity_odd",
+                     "half_low", "half_high"] + [f"dozen_{d}" for d in (1, 2, 3)] + [f"column_{c}" for c in (1, 2, 3)])
+
+# --- Benchmarks ---
+# Each takes its input stream and returns (batch, reset): `batch` makes BATCH_SIZE calls,
+# `reset` (untimed, may be None) restores the inputs before each repeat.
+Benchmark = Callable[[random.Random], Tuple[Callable[[], Any], Optional[Callable[[], Any]]]]
+
+def _deals(rng: random.Random, sizes: Sequence[int]) -> List[List]:
+    """BATCH_SIZE hands, each from a freshly shuffled deck, with sizes cycling through `sizes`."""
+    return [Deck(rng=rng).deal(sizes[i % len(sizes)]) for i in range(BATCH_SIZE)]
+
+def _bench_evaluate_hand(rng: random.Random):
+    hands = _deals(rng, (5,))
+    return lambda: [evaluate_hand(hand) for hand in hands], None
+
+def _bench_get_hand_value(rng: random.Random):
+    hands = _deals(rng, (2, 3, 4, 5))
+    return lambda: [get_hand_value(hand) for hand in hands], None
+
+def _bench_determine_winner(rng: random.Random):
+    pairs = [(deal[:2 + i % 3], deal[5:7 + i % 2]) for i, deal in enumerate(_deals(rng, (10,)))]
+    return lambda: [determine_winner(player, dealer) for player, dealer in pairs], None
+
+def _bench_get_baccarat_hand_value(rng: random.Random):
+    hands = _deals(rng, (2, 3))
+    return lambda: [get_baccarat_hand_value(hand) for hand in hands], None
+
+def _bench_should_banker_draw(rng: random.Random):
+    # Banker's two cards, and the player's third card or None (player stood) one time in four
+    cases = [(deal[:2], None if i % 4 == 0 else deal[2]) for i, deal in enumerate(_deals(rng, (3,)))]
+    return lambda: [should_banker_draw(banker, third) for banker, third in cases], None
+
+def _bench_get_winning_numbers_for_bet(rng: random.Random):
+    bet_keys = [rng.choice(ROULETTE_BET_KEYS) for _ in range(BATCH_SIZE)]
+    return lambda: [get_winning_numbers_for_bet(bet_key) for bet_key in bet_keys], None
+
+def _bench_calculate_winnings(rng: random.Random):
+    paylines = [spin_reels(rng) for _ in range(BATCH_SIZE)]
+    return lambda: [calculate_winnings(payline, SLOTS_COST_PER_SPIN) for payline in paylines], None
+
+def _bench_deck_deal(rng: random.Random):
+    # Deals five cards from each of BATCH_SIZE full decks (unshuffled: dealing doesn't depend on the order)
+    decks: List[Deck] = []
+    def reset():
+        decks[:] = [Deck(rng=rng, codes=fresh_codes()) for _ in range(BATCH_SIZE)]
+    return lambda: [deck.deal(5) for deck in decks], reset
+
+def _bench_deck_shuffle(rng: random.Random):
+    deck = Deck(rng=rng)
+    shuffle = deck.shuffle
+    return lambda: [shuffle() for _ in range(BATCH_SIZE)], None
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    "evaluate_hand": _bench_evaluate_hand,
+    "get_hand_value": _bench_get_hand_value,
+    "determine_winner": _bench_determine_winner,
+    "get_baccarat_hand_value": _bench_get_baccarat_hand_value,
+    "should_banker_draw": _bench_should_banker_draw,
+    "get_winning_numbers_for_bet": _bench_get_winning_numbers_for_bet,
+    "calculate_winnings": _bench_calculate_winnings,
+    "Deck.deal": _bench_deck_deal,
+    "Deck.shuffle": _bench_deck_shuffle,
+}
+
+# --- Running and Comparing ---
+def time_benchmark(name: str, repeat: int = DEFAULT_REPEAT) -> Dict[str, float]:
+    """Times one benchmark; returns the best and median nanoseconds per call."""
+    batch, reset = BENCHMARKS[name](RngService(BENCH_SEED).stream(f"bench/{name}"))
+    if reset is not None:
+        reset()
+    batch() # Warm-up (lazy tables, caches)
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            if reset is not None:
+                reset()
+            start = time.perf_counter_ns()
+            batch()
+            samples.append((time.perf_counter_ns() - start) / BATCH_SIZE)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return {"best_ns": min(samples), "median_ns": statistics.median(samples)}
+
+def _time_in_process(task: Tuple[str, int]) -> Dict[str, float]:
+    return time_benchmark(*task)
+
+def run_benchmarks(names: Sequence[str], repeat: int = DEFAULT_REPEAT, processes: int = DEFAULT_PROCESSES) -> Dict[str, Any]:
+    """Runs the named benchmarks, each in `processes` fresh processes, and returns the results as a dict."""
+    benchmarks = {}
+    # One worker, replaced after every task: the runs never overlap and each starts a new interpreter
+    with multiprocessing.get_context("spawn").Pool(1, maxtasksperchild=1) as pool:
+        for name in names:
+            runs = pool.map(_time_in_process, [(name, repeat)] * processes, chunksize=1)
+            benchmarks[name] = {"best_ns": min(run["best_ns"] for run in runs),
+                                "median_ns": statistics.median(run["median_ns"] for run in runs)}
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "batch_size": BATCH_SIZE,
+        "repeat": repeat,
+        "processes": processes,
+        "benchmarks": benchmarks,
+    }
+
+def _best_ns(result: Dict[str, Any]) -> float:
+    return result["best_ns"]
+
+def format_results(results: Dict[str, Any]) -> str:
+    lines = [f"Benchmarks (Python {results['python']}, {results['batch_size']} calls x {results['repeat']} repeats x {results['processes']} processes)"]
+    for name, result in results["benchmarks"].items():
+        line = f"  {name:<28} {result['best_ns']:>10.1f} ns/call (median {result['median_ns']:.1f})"
+        lines.append(line + format_ratio(name, result, results))
+    return "\n".join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Micro-benchmarks of the rules engines with a baseline regression gate.")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS), help="Benchmarks to run.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed batches per benchmark.")
+    parser.add_argument("--processes", type=int, default=DEFAULT_PROCESSES, help="Fresh processes per benchmark.")
+    add_baseline_arguments(parser, DEFAULT_MARGIN, BASELINE_FILENAME, RESULTS_FILENAME, "per-call time")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.only, args.repeat, args.processes)
+    finish_run(args, results, "benchmarks", _best_ns, "baseline_ns", format_results, "benchmark")
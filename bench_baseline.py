@@ -0,0 +1,77 @@
+# /bench_baseline.py
+"""
+Baseline regression gate shared by bench.py and bench_render.py.
+
+A benchmark run's results dict holds one entry per benchmark (or scenario)
+under a section key. A baseline is the results of an earlier run on the same
+machine, stored with --save-baseline; a later run fails (exit status 1) when an
+entry's metric is higher than its baseline's by more than `--margin`.
+"""
+import argparse
+import json
+import sys
+from typing import Any, Callable, Dict, List
+
+Metric = Callable[[Dict[str, Any]], float] # One entry of the results -> the figure compared (lower is better)
+
+def add_baseline_arguments(parser: argparse.ArgumentParser, default_margin: float, baseline_filename: str,
+                           results_filename: str, compared: str):
+    """Adds --margin, --baseline, --save-baseline and --output to a benchmark's command line."""
+    parser.add_argument("--margin", type=float, default=default_margin,
+                        help=f"Allowed {compared} slowdown over the baseline (0.25 = 25%%).")
+    parser.add_argument("--baseline", default=baseline_filename, help="Baseline JSON path.")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline instead of comparing.")
+    parser.add_argument("--output", default=results_filename, help="JSON results path.")
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], margin: float, section: str,
+            metric: Metric, baseline_key: str) -> List[str]:
+    """
+    Adds each entry's baseline figure (as `baseline_key`) and its ratio to the
+    results[section] entries, and returns the names of those slower than the
+    baseline by more than `margin`.
+    """
+    regressions = []
+    for name, result in results[section].items():
+        base = baseline.get(section, {}).get(name)
+        if base is None:
+            continue # New entry, nothing to compare against
+        result[baseline_key] = metric(base)
+        result["ratio"] = metric(result) / metric(base)
+        if result["ratio"] > 1 + margin:
+            regressions.append(name)
+    results["margin"] = margin
+    results["regressions"] = regressions
+    return regressions
+
+def format_ratio(name: str, result: Dict[str, Any], results: Dict[str, Any]) -> str:
+    """The ' 1.02x baseline' suffix of a result line (flagged if it regressed), or '' without a baseline."""
+    if "ratio" not in result:
+        return ""
+    flag = "  SLOWER" if name in results["regressions"] else ""
+    return f"  {result['ratio']:.2f}x baseline{flag}"
+
+def finish_run(args: argparse.Namespace, results: Dict[str, Any], section: str, metric: Metric, baseline_key: str,
+               format_results: Callable[[Dict[str, Any]], str], noun: str):
+    """
+    Saves the run as the baseline or compares it against the stored one, prints
+    and writes the results, and exits with status 1 on a regression.
+    """
+    regressions: List[str] = []
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    else:
+        try:
+            with open(args.baseline, encoding="utf-8") as f:
+                regressions = compare(results, json.load(f), args.margin, section, metric, baseline_key)
+        except FileNotFoundError:
+            print(f"No baseline at {args.baseline}; run with --save-baseline to record one.")
+    print(format_results(results))
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+    if args.save_baseline:
+        print(f"Baseline written to {args.baseline}")
+    if regressions:
+        print(f"FAIL: {len(regressions)} {noun}(s) slower than the baseline by more than {args.margin:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
@@ -0,0 +1,198 @@
+# /bench_render.py
+"""
+Headless render benchmark of every screen.
+
+Runs pygame on SDL's dummy video driver (no window), puts the game in a set of
+canned states by playing fixed input scripts through process_input and
+update_game with a fixed seed, then renders each state offscreen for N frames.
+For each scenario it times:
+- the screen's draw function alone (draw_*_screen, or a menu's draw function),
+- the whole frame: draw_frame (fill, draw function, fairness overlay) plus the display flip.
+Spinning scenarios advance their spin timer every frame, so the wheel and reels
+are drawn at every point of the animation.
+
+Reports p50/p99 milliseconds per scenario and per draw function, and writes them
+as JSON. As with bench.py, a baseline recorded with --save-baseline turns the
+run into a regression gate on the p50 frame time (exit status 1 past --margin;
+see bench_baseline.py).
+
+Usage:  python bench_render.py [--frames 300] [--only slots_spinning roulette_wheel]
+        python bench_render.py --save-baseline
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # Before pygame is imported
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import platform
+import statistics
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import pygame
+
+import config_actions as actions
+import config_animations as anim
+import config_display as display
+from baccarat_rules import BET_BANKER
+from bench_baseline import add_baseline_arguments, finish_run, format_ratio
+from fairness import set_session_log
+from game_state import GameState
+from game_functions.load_sounds import load_sounds
+from game_functions.new_game_state import new_game_state
+from game_functions.process_input import process_input
+from game_functions.update_game import update_game
+from renderer_functions.draw_frame import draw_frame, get_screen_drawer
+from renderer_functions.load_render_assets import load_render_assets
+from rng import seed_rng
+from shuffle_queue import stop_shuffle_queues
+
+RENDER_SEED = 20240501 # Same deals and spins on every run
+DEFAULT_FRAMES = 300 # Frames per scenario (10 seconds at 30 FPS)
+DEFAULT_MARGIN = 0.25
+RESULTS_FILENAME = "bench_render_results.json"
+BASELINE_FILENAME = "bench_render_baseline.json"
+
+# --- Canned States ---
+# A script is played from the top menu: an (action, payload) tuple is one input,
+# an int runs update_game for that many frames (timers, animations, dealer turns).
+ScriptStep = Union[Tuple[str, Any], int]
+
+_PLAY = (actions.ACTION_GOTO_PLAY, None)
+_DEAL = (actions.ACTION_DEAL_DRAW, None)
+_RED = (actions.ACTION_ROULETTE_BET, {'type': 'color', 'value': 'red'})
+_NUMBER = (actions.ACTION_ROULETTE_BET, {'type': 'number', 'value': 17})
+_DOZEN = (actions.ACTION_ROULETTE_BET, {'type': 'dozen', 'value': 2})
+_SPIN_FRAMES = anim.ROULETTE_SPIN_DURATION + anim.ROULETTE_RESULT_PAUSE_DURATION + 2 * anim.ROULETTE_FLASH_COUNT * anim.ROULETTE_FLASH_INTERVAL + 10
+
+# Scenario name -> (draw function timed, script, spin timer advanced while rendering or None).
+# The draw function is the screen's drawer from draw_frame (while spinning, draw_roulette_screen
+# draws the wheel through draw_spinning_wheel).
+SCENARIOS: Dict[str, Tuple[str, List[ScriptStep], Optional[Tuple[str, int]]]] = {
+    "top_menu": ("draw_top_menu", [], None),
+    "game_selection": ("draw_game_selection_menu", [_PLAY], None),
+    "settings": ("draw_settings_menu", [(actions.ACTION_GOTO_SETTINGS, None)], None),
+    "confirm_exit": ("draw_confirm_exit", [(actions.ACTION_QUIT, None)], None),
+    "draw_poker_hold": ("draw_game_screen", [_PLAY, (actions.ACTION_CHOOSE_DRAW_POKER, None), _DEAL,
+                                             (actions.ACTION_HOLD_TOGGLE, 0), (actions.ACTION_HOLD_TOGGLE, 2)], None),
+    "draw_poker_result": ("draw_game_screen", [_PLAY, (actions.ACTION_CHOOSE_DRAW_POKER, None), _DEAL,
+                                               (actions.ACTION_HOLD_TOGGLE, 0), _DEAL], None),
+    "multi_poker_hold": ("draw_game_screen", [_PLAY, (actions.ACTION_CHOOSE_MULTI_POKER, None), _DEAL,
+                                              (actions.ACTION_HOLD_TOGGLE, 1)], None),
+    "multi_poker_result": ("draw_game_screen", [_PLAY, (actions.ACTION_CHOOSE_MULTI_POKER, None), _DEAL,
+                                                (actions.ACTION_HOLD_TOGGLE, 1), _DEAL], None),
+    "blackjack_player_turn": ("draw_blackjack_screen", [_PLAY, (actions.ACTION_CHOOSE_BLACKJACK, None), _DEAL], None),
+    "blackjack_result": ("draw_blackjack_screen", [_PLAY, (actions.ACTION_CHOOSE_BLACKJACK, None), _DEAL,
+                                                   (actions.ACTION_BLACKJACK_STAND, None), 5], None),
+    "roulette_betting": ("draw_roulette_screen", [_PLAY, (actions.ACTION_CHOOSE_ROULETTE, None), _RED, _RED, _NUMBER, _DOZEN], None),
+    "roulette_wheel": ("draw_roulette_screen", [_PLAY, (actions.ACTION_CHOOSE_ROULETTE, None), _RED, _NUMBER,
+                                                 (actions.ACTION_ROULETTE_SPIN, None)],
+                       ('roulette_spin_timer', anim.ROULETTE_SPIN_DURATION)),
+    "roulette_result": ("draw_roulette_screen", [_PLAY, (actions.ACTION_CHOOSE_ROULETTE, None), _RED, _NUMBER,
+                                                 (actions.ACTION_ROULETTE_SPIN, None), _SPIN_FRAMES], None),
+    "slots_idle": ("draw_slots_screen", [_PLAY, (actions.ACTION_CHOOSE_SLOTS, None)], None),
+    "slots_spinning": ("draw_slots_screen", [_PLAY, (actions.ACTION_CHOOSE_SLOTS, None), (actions.ACTION_SLOTS_SPIN, None)],
+                       ('slots_spin_timer', anim.SLOTS_SPIN_DURATION)),
+    "slots_result": ("draw_slots_screen", [_PLAY, (actions.ACTION_CHOOSE_SLOTS, None), (actions.ACTION_SLOTS_SPIN, None),
+                                           anim.SLOTS_SPIN_DURATION + 1], None),
+    "baccarat_betting": ("draw_baccarat_screen", [_PLAY, (actions.ACTION_CHOOSE_BACCARAT, None),
+                                                  (actions.ACTION_BACCARAT_BET, {'type': BET_BANKER})], None),
+    "baccarat_result": ("draw_baccarat_screen", [_PLAY, (actions.ACTION_CHOOSE_BACCARAT, None),
+                                                 (actions.ACTION_BACCARAT_BET, {'type': BET_BANKER}),
+                                                 (actions.ACTION_BACCARAT_DEAL, None), 5], None),
+}
+
+def build_state(script: Sequence[ScriptStep], sounds: Dict[str, Any]) -> Tuple[Dict[str, Any], GameState]:
+    """Plays a script from the top menu of a new session; returns the game state and the bankroll."""
+    seed_rng(RENDER_SEED)
+    game_state = new_game_state(sound_enabled=False)
+    game_state_manager = GameState(starting_money=1000)
+    for step in script:
+        if isinstance(step, int):
+            for _ in range(step):
+                game_state = update_game(game_state, game_state_manager, sounds)
+        else:
+            game_state = process_input([step], game_state, game_state_manager, sounds)
+    return game_state, game_state_manager
+
+# --- Timing ---
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    cuts = statistics.quantiles(samples, n=100, method='inclusive')
+    return {"p50_ms": statistics.median(samples), "p99_ms": cuts[98], "max_ms": max(samples)}
+
+def time_scenario(name: str, screen: pygame.Surface, render_assets: Dict[str, Any], sounds: Dict[str, Any],
+                  frames: int = DEFAULT_FRAMES) -> Tuple[List[float], List[float]]:
+    """Renders one scenario for `frames` frames; returns the draw function and whole frame times (ms)."""
+    _, script, spin_timer = SCENARIOS[name]
+    game_state, game_state_manager = build_state(script, sounds)
+    drawer = get_screen_drawer(game_state['current_state'])
+    draw_ms, frame_ms = [], []
+    for frame in range(frames):
+        if spin_timer is not None:
+            timer_key, duration = spin_timer
+            game_state[timer_key] = duration - frame % duration # Counts down as in update_game, never 0
+        start = time.perf_counter()
+        drawer(screen, render_assets, game_state, game_state_manager)
+        draw_ms.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        draw_frame(screen, render_assets, game_state, game_state_manager)
+        pygame.display.flip()
+        frame_ms.append((time.perf_counter() - start) * 1000)
+    return draw_ms, frame_ms
+
+def run_render_benchmark(names: Sequence[str], frames: int = DEFAULT_FRAMES) -> Dict[str, Any]:
+    """Renders every named scenario offscreen and returns the results as a dict."""
+    pygame.init()
+    screen = pygame.display.set_mode((display.SCREEN_WIDTH, display.SCREEN_HEIGHT))
+    render_assets = load_render_assets()
+    sounds = load_sounds(False)
+    set_session_log(None) # Nothing to prove: don't write a session log
+
+    scenarios: Dict[str, Any] = {}
+    per_function: Dict[str, List[float]] = {}
+    try:
+        for name in names:
+            draw_function = SCENARIOS[name][0]
+            draw_ms, frame_ms = time_scenario(name, screen, render_assets, sounds, frames)
+            scenarios[name] = {"draw_function": draw_function, "draw": _percentiles(draw_ms), "frame": _percentiles(frame_ms)}
+            per_function.setdefault(draw_function, []).extend(draw_ms)
+    finally:
+        stop_shuffle_queues()
+        pygame.quit()
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "video_driver": os.environ["SDL_VIDEODRIVER"],
+        "resolution": [display.SCREEN_WIDTH, display.SCREEN_HEIGHT],
+        "frames": frames,
+        "scenarios": scenarios,
+        "draw_functions": {name: _percentiles(samples) for name, samples in per_function.items()},
+    }
+
+def _frame_p50_ms(result: Dict[str, Any]) -> float:
+    return result["frame"]["p50_ms"]
+
+def format_results(results: Dict[str, Any]) -> str:
+    budget_ms = 1000 / 30 # main.py runs at 30 FPS
+    lines = [f"Render benchmark ({results['video_driver']} driver, {results['resolution'][0]}x{results['resolution'][1]}, "
+             f"{results['frames']} frames each; frame budget {budget_ms:.1f} ms)",
+             f"  {'scenario':<22} {'draw p50':>9} {'draw p99':>9} {'frame p50':>10} {'frame p99':>10}"]
+    for name, result in results["scenarios"].items():
+        line = (f"  {name:<22} {result['draw']['p50_ms']:>9.2f} {result['draw']['p99_ms']:>9.2f} "
+                f"{result['frame']['p50_ms']:>10.2f} {result['frame']['p99_ms']:>10.2f}")
+        lines.append(line + format_ratio(name, result, results))
+    lines.append(f"  {'draw function':<28} {'p50':>7} {'p99':>7}  (ms)")
+    for name, result in results["draw_functions"].items():
+        lines.append(f"  {name:<28} {result['p50_ms']:>7.2f} {result['p99_ms']:>7.2f}")
+    return "\n".join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Offscreen render benchmark of every screen (SDL dummy video driver).")
+    parser.add_argument("--only", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS), help="Scenarios to render.")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="Frames per scenario.")
+    add_baseline_arguments(parser, DEFAULT_MARGIN, BASELINE_FILENAME, RESULTS_FILENAME, "p50 frame time")
+    args = parser.parse_args()
+
+    results = run_render_benchmark(args.only, args.frames)
+    finish_run(args, results, "scenarios", _frame_p50_ms, "baseline_p50_ms", format_results, "scenario")
@@ -1,30 +1,29 @@
 import collections
 from typing import List, Tuple
 
-from card import Card
+from card import Card, BLACKJACK_VALUES # Blackjack card values (Ace initially counts as 11)
 
 # Using namedtuple for lightweight, immutable card objects if not already imported elsewhere
 # Card = collections.namedtuple("Card", ["rank", "suit"]) # Assuming Card is imported
 
-# Blackjack card values
-BLACKJACK_VALUES = {
-    "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8, "9": 9,
-    "T": 10, "J": 10, "Q": 10, "K": 10, "A": 11 # Ace initially counts as 11
-}
-
 # Payout constants
 BLACKJACK_PAYOUT = 1.5 # 3:2 payout for Blackjack
 WIN_PAYOUT = 1.0      # 1:1 payout for regular win
 PUSH_PAYOUT = 0.0     # 0 payout for a push
 LOSS_PAYOUT = -1.0    # Player loses their bet
 
+# Shoe (see shoe.py): kept across rounds, reshuffled once the cut card comes out
+SHOE_NUM_DECKS = 6
+SHOE_PENETRATION = 0.75 # Fraction of the shoe dealt before the cut card
+
 def get_hand_value(hand: List[Card]) -> int:
     """Calculates the value of a Blackjack hand, handling Aces optimally."""
     value = 0
     num_aces = 0
     for card in hand:
-        value += BLACKJACK_VALUES[card.rank]
-        if card.rank == "A":
+        card_value = card.blackjack_value # Precomputed on the interned card
+        value += card_value
+        if card_value == 11: # Ace
             num_aces += 1
 
     # Adjust for Aces if value is over 21
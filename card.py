@@ -1,7 +1,5 @@
 import collections
-
-# Using namedtuple for lightweight, immutable card objects
-Card = collections.namedtuple("Card", ["rank", "suit"])
+from typing import Dict, List, Tuple
 
 SUITS = ["♣", "♦", "♥", "♠"] # Clubs, Diamonds, Hearts, Spades
 # Using strings for ranks for easier display. Special ranks first for sorting.
@@ -10,6 +8,116 @@ RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "T", "J", "Q", "K", "A"]
 # Map ranks to values for easier comparison/evaluation later
 RANK_VALUES = {rank: i for i, rank in enumerate(RANKS, 2)} # 2=2, ..., T=10, J=11, Q=12, K=13, A=14
 
+# Letter aliases so Card("A", "S") means the same card as Card("A", "♠")
+SUIT_ALIASES = {"C": "♣", "D": "♦", "H": "♥", "S": "♠"}
+SUIT_LETTERS = {symbol: letter for letter, symbol in SUIT_ALIASES.items()}
+
+# Game values per rank, precomputed on every card (see blackjack_rules, baccarat_rules)
+BLACKJACK_VALUES = {
+    "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8, "9": 9,
+    "T": 10, "J": 10, "Q": 10, "K": 10, "A": 11 # Ace initially counts as 11
+}
+BACCARAT_VALUES = {
+    "A": 1, "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8, "9": 9,
+    "T": 0, "J": 0, "Q": 0, "K": 0
+}
+
+# --- Integer Card Encoding ---
+# Every card is also packed into a single int so the rules modules can work with
+# bit operations instead of string/dict lookups:
+#
+#   xxxbbbbb bbbbbbbb ssssrrrr xxpppppp
+#
+#   p = prime number of the rank (2=2, 3=3, 4=5, ..., A=41)
+#   r = rank index (2=0, ..., A=12)
+#   s = suit bit (one bit per suit, in SUITS order)
+#   b = rank bit (one bit per rank, in RANKS order)
+#
+# ANDing the suit bits of a hand detects a flush, ORing the rank bits gives the
+# set of ranks, and multiplying the primes identifies the rank multiset.
+RANK_PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+SUIT_MASK = 0xF000
+PRIME_MASK = 0x3F
+# The joker (Joker Poker) sets only the otherwise unused top bit: no rank, suit or prime
+JOKER_CODE = 1 << 29
+
+def encode_card(rank_index: int, suit_index: int) -> int:
+    """Packs a rank index and suit index into the integer card encoding."""
+    return (1 << (16 + rank_index)) | (1 << (12 + suit_index)) | (rank_index << 8) | RANK_PRIMES[rank_index]
+
+def card_rank_index(code: int) -> int:
+    """Returns the rank index (2=0, ..., A=12) of an encoded card."""
+    return (code >> 8) & 0xF
+
+def card_suit_index(code: int) -> int:
+    """Returns the suit index (position in SUITS) of an encoded card."""
+    return ((code >> 12) & 0xF).bit_length() - 1
+
+def card_prime(code: int) -> int:
+    """Returns the rank prime of an encoded card."""
+    return code & PRIME_MASK
+
+def card_rank_bit(code: int) -> int:
+    """Returns the single rank bit of an encoded card."""
+    return code >> 16
+
+
+# Using namedtuple for lightweight, immutable card objects.
+# rank/suit are the display-level view, code is the integer encoding above and
+# index is the card's position (0-51) in CARDS. The remaining fields are
+# precomputed once per card so hot paths (hand values, per-frame image lookups)
+# read an attribute instead of building keys or looking up dicts:
+#   rank_value      2..14 (RANK_VALUES)
+#   suit_index      position in SUITS
+#   blackjack_value Blackjack points (Ace = 11)
+#   baccarat_value  Baccarat points
+#   image_key       card image name in assets/cards, e.g. "AS", "TH", "JK"
+_CardTuple = collections.namedtuple("Card", ["rank", "suit", "code", "index", "rank_value", "suit_index",
+                                             "blackjack_value", "baccarat_value", "image_key"])
+
+class Card(_CardTuple):
+    """
+    An immutable playing card. Cards are interned: Card(rank, suit) always
+    returns one of the 52 shared objects in CARDS, so creating or copying a
+    card never allocates and every card carries its precomputed code, values and image key.
+    """
+    __slots__ = ()
+
+    def __new__(cls, rank: str, suit: str, *precomputed: object) -> "Card":
+        card = _INTERNED.get((rank, suit))
+        if card is None:
+            card = _INTERNED.get((rank, SUIT_ALIASES.get(suit)))
+            if card is None:
+                raise ValueError(f"Unknown card: {rank}{suit}")
+        return card
+
+    def __getnewargs__(self) -> Tuple[str, str]:
+        # Pickle/copy through __new__ so unpickled cards stay interned
+        return (self.rank, self.suit)
+
+    def __repr__(self) -> str:
+        return f"Card(rank={self.rank!r}, suit={self.suit!r})"
+
+
+# --- Interned Cards ---
+_INTERNED: Dict[Tuple[str, str], Card] = {}
+CARDS: List[Card] = [] # All 52 cards, suit by suit (same order as a fresh Deck)
+for _suit_index, _suit in enumerate(SUITS):
+    for _rank_index, _rank in enumerate(RANKS):
+        _card = _CardTuple.__new__(Card, _rank, _suit, encode_card(_rank_index, _suit_index), len(CARDS),
+                                   RANK_VALUES[_rank], _suit_index, BLACKJACK_VALUES[_rank], BACCARAT_VALUES[_rank],
+                                   f"{_rank}{SUIT_LETTERS[_suit]}")
+        _INTERNED[(_rank, _suit)] = _card
+        CARDS.append(_card)
+
+# The 53rd card, only dealt by decks created with jokers (see Deck). Not part of CARDS.
+# It has no rank or suit, so no rank value, suit index or game values.
+JOKER: Card = _CardTuple.__new__(Card, "JK", "★", JOKER_CODE, len(CARDS), 0, -1, 0, 0, "JK")
+_INTERNED[(JOKER.rank, JOKER.suit)] = JOKER
+
+# Map an encoded card back to its display-level Card
+CARD_BY_CODE: Dict[int, Card] = {card.code: card for card in CARDS + [JOKER]}
+
 def card_to_string(card: Card) -> str:
     """Returns a string representation of a card (e.g., 'K♠', 'T♥')."""
     return f"{card.rank}{card.suit}"
@@ -22,5 +130,9 @@ if __name__ == '__main__':
     print(f"String representation: {card_to_string(c1)}")
     print(f"Rank value of {c1.rank}: {RANK_VALUES[c1.rank]}")
     print(f"Rank value of {c2.rank}: {RANK_VALUES[c2.rank]}")
+    print(f"Encoded {card_to_string(c1)}: {c1.code:#010x} (rank index {card_rank_index(c1.code)}, suit index {card_suit_index(c1.code)}, prime {card_prime(c1.code)})")
+    print(f"Interned: {Card('A', 'S') is c1}")
+    print(f"Precomputed: value {c1.rank_value}, suit index {c1.suit_index}, blackjack {c1.blackjack_value}, "
+          f"baccarat {c1.baccarat_value}, image key {c1.image_key!r}")
     print(f"Available suits: {SUITS}")
     print(f"Available ranks: {RANKS}")
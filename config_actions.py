@@ -25,6 +25,7 @@ ACTION_TOGGLE_SOUND = "TOGGLE_SOUND"
 ACTION_RETURN_TO_TOP_MENU = "RETURN_TO_TOP_MENU" # From Settings
 ACTION_VOLUME_UP = "VOLUME_UP"
 ACTION_VOLUME_DOWN = "VOLUME_DOWN"
+ACTION_CYCLE_POKER_VARIANT = "CYCLE_POKER_VARIANT" # Switch video poker game (Jacks or Better, Bonus, ...)
 # Confirmation Actions
 ACTION_CONFIRM_YES = "CONFIRM_YES"
 ACTION_CONFIRM_NO = "CONFIRM_NO"
@@ -13,3 +13,6 @@ SOUND_FILES = {
     "deal": "deal.mp3", "draw": "draw.mp3", "hold": "hold.mp3",
     "win": "win.mp3", "lose": "lose.mp3", "button": "button.mp3"
 }
+
+# Precomputed Table Cache (generated on first run, see poker_lookup.py)
+TABLE_CACHE_PATH = "cache"
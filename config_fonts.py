@@ -11,3 +11,4 @@ BUTTON_FONT_SIZE = 30
 RESULT_FONT_SIZE = 36
 MULTI_RESULT_FONT_SIZE = 20 # Smaller font for individual hand results
 HOLD_FONT_SIZE = 24
+FAIRNESS_FONT_SIZE = 16 # Commitment / reveal line at the bottom of game screens
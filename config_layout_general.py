@@ -106,6 +106,9 @@ VOLUME_DOWN_BUTTON_RECT = pygame.Rect(
 VOLUME_UP_BUTTON_RECT = pygame.Rect(
     SOUND_TOGGLE_RECT.right + 10, SOUND_TOGGLE_RECT.centery - VOLUME_BUTTON_HEIGHT // 2, VOLUME_BUTTON_WIDTH, VOLUME_BUTTON_HEIGHT
 )
+POKER_VARIANT_TOGGLE_RECT = pygame.Rect( # Below the volume text; cycles the video poker variant
+    display.SCREEN_WIDTH // 2 - 180, SOUND_TOGGLE_RECT.bottom + 70, 360, 50
+)
 
 # Confirmation Dialog Rectangles
 CONFIRM_BOX_RECT = pygame.Rect(display.SCREEN_WIDTH // 4, display.SCREEN_HEIGHT // 3, display.SCREEN_WIDTH // 2, display.SCREEN_HEIGHT // 3)
@@ -9,9 +9,10 @@ import config_display as display
 import config_layout_general as layout_general
 import config_colors as colors
 from typing import Dict, Any
+from roulette_rules import WHEEL_NUMBERS
 
 # Roulette Constants (Initial Setup)
-ROULETTE_WHEEL_NUMBERS = [0, 32, 15, 19, 4, 21, 2, 25, 17, 34, 6, 27, 13, 36, 11, 30, 8, 23, 10, 5, 24, 16, 33, 1, 20, 14, 31, 9, 22, 18, 29, 7, 28, 12, 35, 3, 26]
+ROULETTE_WHEEL_NUMBERS = list(WHEEL_NUMBERS) # Wheel order, defined with the rules
 ROULETTE_RED_NUMBERS = {1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36}
 ROULETTE_BLACK_NUMBERS = {2, 4, 6, 8, 10, 11, 13, 15, 17, 20, 22, 24, 26, 28, 29, 31, 33, 35}
 ROULETTE_GREEN_NUMBER = {0}
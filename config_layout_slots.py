@@ -7,9 +7,9 @@ Imports other config modules for dependencies.
 import pygame
 import config_display as display
 import config_layout_general as layout_general
+from slots_rules import NUM_REELS # Defined with the rules (the reel strips)
 
 # --- Slots Constants ---
-NUM_REELS = 3 # Number of reels
 SLOT_SYMBOL_WIDTH = 90 # Width of each symbol image (was 120)
 SLOT_SYMBOL_HEIGHT = 75 # Height of each symbol image (was 100)
 
@@ -0,0 +1,47 @@
+# /config_rng.py
+"""
+Configuration constants for the random number service (see rng.py).
+"""
+
+# Master seed. None draws a fresh seed from the OS at startup (and reports it,
+# so a session can be replayed); an int makes every stream reproducible.
+RNG_SEED = None
+RNG_SEED_ENV_VAR = "VIDEOPOKER_SEED" # Overrides RNG_SEED when set
+
+# Secure mode: game streams draw from the OS CSPRNG (os.urandom) through a
+# buffered entropy pool instead of seeded generators. Fair, but not replayable.
+SECURE_RNG = False
+SECURE_RNG_ENV_VAR = "VIDEOPOKER_SECURE_RNG" # "1" enables secure mode
+ENTROPY_BLOCK_SIZE = 4096 # Bytes read from os.urandom per refill
+# The extra N-play draws of a secure-mode deck come from SHA-256 in counter mode
+# over its committed 256-bit draw seed (rng.HashDrawRandom), so they can be redrawn to verify
+DRAW_SEED_BITS = 64 # Draw seed committed with each seeded-mode deck (Mersenne Twister draws)
+SECURE_DRAW_SEED_BITS = 256 # Draw seed committed with each secure-mode deck (SHA-256 draws)
+HASH_DRAW_BLOCK_SIZE = 256 # Bytes hashed per refill: an N-play round uses a few hundred
+
+# Named streams: each game draws only from its own stream, so the outcomes of
+# one game never depend on how much another game has been played.
+STREAM_DECK = "deck" # Decks created without an explicit stream
+STREAM_POKER = "poker"
+STREAM_BLACKJACK = "blackjack"
+STREAM_BACCARAT = "baccarat"
+STREAM_ROULETTE = "roulette"
+STREAM_SLOTS = "slots"
+STREAM_EFFECTS = "effects" # Cosmetic randomness (animations); never affects outcomes
+STREAM_SIMULATION = "simulation" # Headless bulk simulations (see deck_batch.py)
+
+# Pre-shuffled permutations kept ready per card set (see shuffle_queue.py)
+SHUFFLE_QUEUE_SIZE = 4
+SHUFFLE_REFILL_DELAY = 0.005 # Seconds the worker waits after each refill, keeping it off the DEAL path
+
+# Provably-fair commitments (see fairness.py)
+COMMITMENT_SALT_BYTES = 16 # Random salt hashed with each outcome, revealed after the round
+SPIN_COMMIT_BATCH = 32 # Roulette/slots outcomes drawn and committed per refill
+FAIRNESS_LOG_DIR = "cache/fairness" # One JSON-lines session log per run
+FAIRNESS_LOG_ENV_VAR = "VIDEOPOKER_FAIRNESS_LOG" # Overrides the log file path; "0" disables logging
+
+# Session recording and replay (see session_recording.py)
+SESSION_RECORD_DIR = "cache/sessions" # One JSON-lines recording per seeded run
+SESSION_RECORD_ENV_VAR = "VIDEOPOKER_RECORD" # Overrides the recording path; "0" disables recording
+CHECKPOINT_FRAMES = 300 # Frames between state digests in a recording (10 seconds at 30 FPS)
+KEYFRAME_FRAMES = 1800 # Frames between full state snapshots (a multiple of CHECKPOINT_FRAMES): seeks replay at most this many
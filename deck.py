@@ -1,19 +1,84 @@
 import random
-from typing import List
-from card import Card, SUITS, RANKS # Assuming card.py is in the same directory
+from array import array
+from typing import Any, Dict, List, Optional
+from card import Card, CARDS, CARD_BY_CODE, JOKER # Assuming card.py is in the same directory
+import config_rng as rng_cfg
+from rng import get_stream
+
+_CARD_BY_CODE_GET = CARD_BY_CODE.__getitem__
+
+# Codes of a fresh 52-card deck; new decks copy this template
+_FRESH_CODES = array('I', [card.code for card in CARDS])
+
+def fresh_codes(num_decks: int = 1, num_jokers: int = 0) -> array:
+    """Returns the unshuffled codes of num_decks decks plus num_jokers jokers."""
+    return _FRESH_CODES * num_decks + array('I', [JOKER.code] * num_jokers)
+
+def shuffle_codes(codes: array, start: int, rng: random.Random):
+    """
+    Shuffles codes[start:] in place (Fisher-Yates). Uses the stream's exact
+    randbelow when it has one (rng.SecureRandom), otherwise scaled floats.
+    """
+    # Shuffle a list copy: swapping list items is cheaper than array items
+    remaining = codes[start:].tolist()
+    randbelow = getattr(rng, "randbelow", None)
+    if randbelow is not None:
+        for i in range(len(remaining) - 1, 0, -1):
+            j = randbelow(i + 1)
+            remaining[i], remaining[j] = remaining[j], remaining[i]
+    else:
+        rng_random = rng.random
+        for i in range(len(remaining) - 1, 0, -1):
+            j = int(rng_random() * (i + 1))
+            remaining[i], remaining[j] = remaining[j], remaining[i]
+    codes[start:] = array('I', remaining)
 
 class Deck:
-    """Represents a standard 52-card deck."""
+    """Represents a standard 52-card deck, optionally with jokers (e.g. 53 cards for Joker Poker)."""
+
+    def __init__(self, num_jokers: int = 0, rng: Optional[random.Random] = None, codes: Optional[array] = None,
+                 commitment: Optional[Any] = None):
+        """
+        Initializes a new deck of 52 cards plus num_jokers jokers, shuffled with
+        the given random stream (default: the shared "deck" stream, see rng.py).
+        `codes` supplies an already shuffled deck (e.g. from a ShuffleQueue), used as-is,
+        and `commitment` the fairness.Commitment to that order, if any.
+        """
+        self._rng = rng or get_stream(rng_cfg.STREAM_DECK)
+        self.commitment = commitment
+        # The deck is a fixed array of card codes plus a cursor: cards before the
+        # cursor have been dealt, so dealing only advances the cursor.
+        self._codes = codes if codes is not None else fresh_codes(1, num_jokers)
+        self._view = memoryview(self._codes)
+        self._cursor = 0
+        if codes is None:
+            self.shuffle()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Memoryviews can't be pickled: the view is rebuilt from the codes on load
+        state = self.__dict__.copy()
+        del state['_view']
+        return state
 
-    def __init__(self):
-        """Initializes a new deck of 52 cards."""
-        self._cards: List[Card] = [Card(rank, suit) for suit in SUITS for rank in RANKS]
-        self.shuffle()
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._view = memoryview(self._codes)
 
     def shuffle(self):
-        """Shuffles the deck in place."""
-        random.shuffle(self._cards)
-        print("Deck shuffled.") # Optional: for debugging/visibility
+        """Shuffles the remaining (undealt) cards in place."""
+        shuffle_codes(self._codes, self._cursor, self._rng)
+
+    def deal_codes(self, num_cards: int = 1) -> memoryview:
+        """
+        Deals a specified number of cards as their integer codes (see card.py).
+        Returns a read-only view into the deck, without copying.
+        Raises an IndexError if not enough cards are left.
+        """
+        start = self._cursor
+        if num_cards > len(self._codes) - start:
+            raise IndexError("Not enough cards left in the deck to deal.")
+        self._cursor = start + num_cards
+        return self._view[start:self._cursor].toreadonly()
 
     def deal(self, num_cards: int = 1) -> List[Card]:
         """
@@ -21,17 +86,26 @@ class Deck:
         Removes the dealt cards from the deck.
         Raises an IndexError if not enough cards are left.
         """
-        if num_cards > len(self._cards):
+        start = self._cursor
+        end = start + num_cards
+        if end > len(self._codes):
             raise IndexError("Not enough cards left in the deck to deal.")
-        
-        dealt_cards = self._cards[:num_cards]
-        self._cards = self._cards[num_cards:]
-        return dealt_cards
+        self._cursor = end
+        return list(map(_CARD_BY_CODE_GET, self._codes[start:end]))
+
+    @property
+    def position(self) -> int:
+        """Number of cards dealt so far."""
+        return self._cursor
+
+    def dealt_codes(self, start: int = 0) -> List[int]:
+        """Returns the codes of the cards dealt from position `start` on, in deal order."""
+        return self._codes[start:self._cursor].tolist()
 
     def __len__(self) -> int:
         """Returns the number of cards remaining in the deck."""
-        return len(self._cards)
+        return len(self._codes) - self._cursor
 
     def is_empty(self) -> bool:
         """Checks if the deck is empty."""
-        return len(self._cards) == 0
+        return self._cursor == len(self._codes)
@@ -0,0 +1,13 @@
+# /engine/__init__.py
+"""
+Headless game engine: the round logic of every game, without pygame.
+
+Each game module (poker, blackjack, baccarat, roulette, slots) offers
+new_round(bankroll, ...) -> (round, events), act(round, bankroll, action, payload)
+where the game has player decisions, and resolve(round, bankroll) -> events.
+The bankroll is a game_state.GameState; the events (see events.py) tell the
+UI which sounds to play, which animations to run and what was paid out.
+
+The game modules are not imported here, so importing one game does not load
+the others (Blackjack, Baccarat, Roulette and Slots load without NumPy).
+"""
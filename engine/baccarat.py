@@ -0,0 +1,129 @@
+# /engine/baccarat.py
+"""
+Headless Baccarat rounds.
+
+    rnd, events = new_round(bankroll, BET_BANKER, 5) # settles at once on a natural
+    events = resolve(rnd, bankroll)                  # third cards, then the payout
+
+The player makes no decisions once the bet is down; `draw_third_cards` is
+exposed separately so the UI can show the draws before the result.
+"""
+from typing import Any, List, Optional, Tuple
+
+import config_rng as rng_cfg
+from baccarat_rules import (
+    calculate_baccarat_payout, determine_baccarat_winner, get_baccarat_hand_value, is_natural,
+    should_banker_draw, should_player_draw, SHOE_NUM_DECKS, SHOE_PENETRATION
+)
+from card import Card
+from game_state import GameState
+from shoe import Shoe
+from shuffle_queue import get_shuffle_queue
+from .events import DEAL, DRAW, LOSE, WIN, Event, push_events, win_events
+
+class BaccaratRound:
+    """One coup of Baccarat with a single bet on Player, Banker or Tie."""
+    __slots__ = ("shoe", "bet_type", "bet", "player_hand", "banker_hand", "commitment", "offset",
+                 "player_third_card", "banker_third_card", "drawn", "winner", "player_value",
+                 "banker_value", "returned", "net_winnings", "finished")
+
+    def __init__(self, shoe: Shoe, bet_type: str, bet: int):
+        self.shoe = shoe
+        self.bet_type = bet_type
+        self.bet = bet
+        self.player_hand: List[Card] = []
+        self.banker_hand: List[Card] = []
+        # Where this round starts in the committed shoe order (for the fairness log)
+        self.commitment: Any = shoe.commitment
+        self.offset = shoe.position
+        self.player_third_card: Optional[Card] = None
+        self.banker_third_card: Optional[Card] = None
+        self.drawn = False # Third-card rules applied
+        self.winner: Optional[str] = None
+        self.player_value = 0
+        self.banker_value = 0
+        self.returned = 0 # Money paid back into the bankroll (bet included)
+        self.net_winnings = 0.0
+        self.finished = False
+
+def new_shoe() -> Shoe:
+    """A Baccarat shoe reshuffled from the pre-shuffled, committed Baccarat queue."""
+    return Shoe(SHOE_NUM_DECKS, SHOE_PENETRATION, shuffle_queue=get_shuffle_queue(rng_cfg.STREAM_BACCARAT, SHOE_NUM_DECKS))
+
+def _settle(rnd: BaccaratRound, bankroll: GameState) -> List[Event]:
+    """Compares the hands and pays the bet out."""
+    rnd.winner, rnd.player_value, rnd.banker_value = determine_baccarat_winner(rnd.player_hand, rnd.banker_hand)
+    total_returned, rnd.net_winnings = calculate_baccarat_payout(rnd.bet_type, rnd.bet, rnd.winner)
+    rnd.finished = True
+    if rnd.net_winnings > 0:
+        rnd.returned = int(round(total_returned))
+        bankroll.add_winnings(rnd.returned)
+        return [WIN] + win_events(rnd.returned)
+    if rnd.net_winnings == 0: # Push: a Tie, with the bet on Player or Banker
+        rnd.returned = int(round(total_returned))
+        bankroll.add_winnings(rnd.returned)
+        return push_events(rnd.returned)
+    return [LOSE] # The bet was taken when the round started
+
+def new_round(bankroll: GameState, bet_type: str, bet: int, shoe: Optional[Shoe] = None) -> Tuple[Optional[BaccaratRound], List[Event]]:
+    """
+    Takes the bet and deals two cards each to Player and Banker from the shoe
+    (a new one if None; reshuffled first if the cut card is out). A natural
+    settles the round at once. Returns (None, []) if the bankroll cannot cover the bet.
+    """
+    if not bankroll.deduct_bet(bet):
+        return None, []
+    if shoe is None:
+        shoe = new_shoe()
+    shoe.start_round()
+    rnd = BaccaratRound(shoe, bet_type, bet)
+    rnd.player_hand = shoe.deal(2)
+    rnd.banker_hand = shoe.deal(2)
+    events = [DEAL]
+    if is_natural(rnd.player_hand) or is_natural(rnd.banker_hand):
+        events.extend(_settle(rnd, bankroll))
+    else:
+        rnd.player_value = get_baccarat_hand_value(rnd.player_hand)
+        rnd.banker_value = get_baccarat_hand_value(rnd.banker_hand)
+    return rnd, events
+
+def draw_third_cards(rnd: BaccaratRound) -> List[Event]:
+    """Applies the third-card rules: Player first, then Banker (depending on Player's third card)."""
+    if rnd.drawn or rnd.finished:
+        return []
+    rnd.drawn = True
+    events = []
+    if should_player_draw(rnd.player_hand):
+        rnd.player_third_card = rnd.shoe.deal(1)[0]
+        rnd.player_hand.append(rnd.player_third_card)
+        events.append(DRAW)
+    if should_banker_draw(rnd.banker_hand, rnd.player_third_card):
+        rnd.banker_third_card = rnd.shoe.deal(1)[0]
+        rnd.banker_hand.append(rnd.banker_third_card)
+        events.append(DRAW)
+    return events
+
+def resolve(rnd: BaccaratRound, bankroll: GameState) -> List[Event]:
+    """Draws any third cards still to come and settles the bet."""
+    if rnd.finished:
+        return []
+    events = draw_third_cards(rnd)
+    events.extend(_settle(rnd, bankroll))
+    return events
+
+
+if __name__ == '__main__':
+    import time
+    from baccarat_rules import BET_BANKER, BET_PLAYER, BET_TIE
+    from rng import RngService
+
+    shoe = Shoe(SHOE_NUM_DECKS, SHOE_PENETRATION, rng=RngService(2024).stream("baccarat"))
+    rounds = 100000
+    for bet_type in (BET_PLAYER, BET_BANKER, BET_TIE):
+        bankroll = GameState(starting_money=10**9)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            rnd, events = new_round(bankroll, bet_type, 1, shoe)
+            resolve(rnd, bankroll)
+        elapsed = time.perf_counter() - start
+        print(f"{bet_type:6}: {rounds / elapsed:,.0f} rounds/s, return {(bankroll.money - 10**9 + rounds) / rounds:.1%}")
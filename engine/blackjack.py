@@ -0,0 +1,129 @@
+# /engine/blackjack.py
+"""
+Headless Blackjack rounds.
+
+    rnd, events = new_round(bankroll, shoe)           # settles at once on a Blackjack
+    events = act(rnd, bankroll, ACTION_BLACKJACK_HIT) # settles on a bust
+    events = act(rnd, bankroll, ACTION_BLACKJACK_STAND)
+
+Standing (or `resolve`) plays the dealer's hand and settles the bet.
+"""
+from typing import Any, List, Optional, Tuple
+
+import config_actions as actions
+import config_rng as rng_cfg
+from blackjack_rules import (
+    determine_winner, is_blackjack, is_busted, should_dealer_hit,
+    LOSS_PAYOUT, PUSH_PAYOUT, SHOE_NUM_DECKS, SHOE_PENETRATION
+)
+from card import Card
+from game_state import GameState
+from shoe import Shoe
+from shuffle_queue import get_shuffle_queue
+from .events import DEAL, DRAW, LOSE, WIN, Event, push_events, win_events
+
+class BlackjackRound:
+    """One hand of Blackjack against the dealer, dealt from a shoe."""
+    __slots__ = ("shoe", "bet", "player_hand", "dealer_hand", "commitment", "offset",
+                 "result", "payout_multiplier", "returned", "finished")
+
+    def __init__(self, shoe: Shoe, bet: int = 1):
+        self.shoe = shoe
+        self.bet = bet
+        self.player_hand: List[Card] = []
+        self.dealer_hand: List[Card] = []
+        # Where this round starts in the committed shoe order (for the fairness log)
+        self.commitment: Any = shoe.commitment
+        self.offset = shoe.position
+        self.result = "" # The rules' result message, once settled
+        self.payout_multiplier = 0.0
+        self.returned = 0 # Money paid back into the bankroll (bet included)
+        self.finished = False
+
+def new_shoe() -> Shoe:
+    """A Blackjack shoe reshuffled from the pre-shuffled, committed Blackjack queue."""
+    return Shoe(SHOE_NUM_DECKS, SHOE_PENETRATION, shuffle_queue=get_shuffle_queue(rng_cfg.STREAM_BLACKJACK, SHOE_NUM_DECKS))
+
+def _settle(rnd: BlackjackRound, bankroll: GameState, result: str, payout_multiplier: float) -> List[Event]:
+    """Pays the round out: the winnings plus the bet back on a win, the bet back on a push."""
+    rnd.result = result
+    rnd.payout_multiplier = payout_multiplier
+    rnd.finished = True
+    rnd.shoe.reveal(rnd.dealer_hand[:1]) # The hole card is shown with the result
+    winnings = int(payout_multiplier * rnd.bet)
+    if winnings > 0:
+        rnd.returned = winnings + rnd.bet
+        bankroll.add_winnings(rnd.returned)
+        return [WIN] + win_events(rnd.returned)
+    if payout_multiplier == PUSH_PAYOUT:
+        rnd.returned = rnd.bet
+        bankroll.add_winnings(rnd.bet)
+        return push_events(rnd.bet) # No win/lose sound for a push
+    return [LOSE] # The bet was taken when the round started
+
+def new_round(bankroll: GameState, shoe: Optional[Shoe] = None, bet: int = 1) -> Tuple[Optional[BlackjackRound], List[Event]]:
+    """
+    Takes the bet and deals two cards each from the shoe (a new one if None;
+    reshuffled first if the cut card is out). A Blackjack on either side
+    settles the round at once. Returns (None, []) if the bankroll cannot cover the bet.
+    """
+    bankroll.set_cost_per_game(bet)
+    if not bankroll.start_fixed_cost_game():
+        return None, []
+    if shoe is None:
+        shoe = new_shoe()
+    shoe.start_round() # Reshuffles only once the cut card has come out
+    rnd = BlackjackRound(shoe, bet)
+    rnd.player_hand = shoe.deal(2)
+    rnd.dealer_hand = shoe.deal(1, face_down=True) + shoe.deal(1) # Hole card, then the upcard
+    events = [DEAL]
+    if is_blackjack(rnd.player_hand) or is_blackjack(rnd.dealer_hand):
+        events.extend(_settle(rnd, bankroll, *determine_winner(rnd.player_hand, rnd.dealer_hand)))
+    return rnd, events
+
+def act(rnd: BlackjackRound, bankroll: GameState, action: str, payload: Any = None) -> List[Event]:
+    """
+    Applies ACTION_BLACKJACK_HIT or ACTION_BLACKJACK_STAND; a hit that busts settles the round.
+    """
+    if rnd.finished:
+        return []
+    if action == actions.ACTION_BLACKJACK_HIT:
+        rnd.player_hand.extend(rnd.shoe.deal(1))
+        events = [DRAW]
+        if is_busted(rnd.player_hand):
+            events.append(LOSE) # Bust sting, before the round's own result
+            events.extend(resolve(rnd, bankroll))
+        return events
+    if action == actions.ACTION_BLACKJACK_STAND:
+        return resolve(rnd, bankroll)
+    return []
+
+def resolve(rnd: BlackjackRound, bankroll: GameState) -> List[Event]:
+    """Plays the dealer's hand (hits until 17+, unless the player busted) and settles the bet."""
+    if rnd.finished:
+        return []
+    if is_busted(rnd.player_hand):
+        return _settle(rnd, bankroll, "Player Busts!", LOSS_PAYOUT) # The dealer doesn't need to play
+    events = []
+    while should_dealer_hit(rnd.dealer_hand) and len(rnd.shoe) > 0:
+        rnd.dealer_hand.extend(rnd.shoe.deal(1))
+        events.append(DRAW)
+    events.extend(_settle(rnd, bankroll, *determine_winner(rnd.player_hand, rnd.dealer_hand)))
+    return events
+
+
+if __name__ == '__main__':
+    import time
+    from blackjack_rules import get_hand_value
+    from rng import RngService
+
+    bankroll = GameState(starting_money=10**9)
+    shoe = Shoe(SHOE_NUM_DECKS, SHOE_PENETRATION, rng=RngService(2024).stream("blackjack"))
+    rounds = 100000
+    start = time.perf_counter()
+    for _ in range(rounds):
+        rnd, events = new_round(bankroll, shoe)
+        while not rnd.finished: # Basic strategy stand-in: hit to 17
+            act(rnd, bankroll, actions.ACTION_BLACKJACK_HIT if get_hand_value(rnd.player_hand) < 17 else actions.ACTION_BLACKJACK_STAND)
+    elapsed = time.perf_counter() - start
+    print(f"{rounds / elapsed:,.0f} rounds/s, return {(bankroll.money - 10**9 + rounds) / rounds:.1%} (hitting to 17)")
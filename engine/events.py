@@ -0,0 +1,44 @@
+# /engine/events.py
+"""
+Events returned by the headless engine for the UI (or a simulation) to consume.
+
+Each engine call returns a list of Events in the order they happen:
+- sound:     a sound the UI should play ("deal", "draw", "hold", "win", "lose", "button")
+- animation: "money" (with the amount shown) or "result_flash"
+- payout:    money paid back into the bankroll ("win" or "push"), already credited
+"""
+from typing import List, NamedTuple
+
+SOUND = "sound"
+ANIMATION = "animation"
+PAYOUT = "payout"
+
+# Animation names
+ANIM_MONEY = "money"
+ANIM_RESULT_FLASH = "result_flash"
+
+class Event(NamedTuple):
+    kind: str # SOUND, ANIMATION or PAYOUT
+    name: str
+    amount: int = 0
+
+# Shared instances for the events without an amount
+DEAL = Event(SOUND, "deal")
+DRAW = Event(SOUND, "draw")
+HOLD = Event(SOUND, "hold")
+WIN = Event(SOUND, "win")
+LOSE = Event(SOUND, "lose")
+BUTTON = Event(SOUND, "button")
+RESULT_FLASH = Event(ANIMATION, ANIM_RESULT_FLASH)
+
+def win_events(amount: int) -> List[Event]:
+    """A win of `amount` (the total paid back): the payout, the money animation and the flashing result."""
+    return [Event(PAYOUT, "win", amount), Event(ANIMATION, ANIM_MONEY, amount), RESULT_FLASH]
+
+def push_events(amount: int) -> List[Event]:
+    """A push: the bet is paid back, with no sound or animation."""
+    return [Event(PAYOUT, "push", amount)]
+
+def total_payout(events: List[Event]) -> int:
+    """The money paid into the bankroll by a list of events."""
+    return sum(event.amount for event in events if event.kind == PAYOUT)
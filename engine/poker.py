@@ -0,0 +1,131 @@
+# /engine/poker.py
+"""
+Headless Draw Poker and Multi (N-play) Poker rounds.
+
+    rnd, events = new_round(bankroll, variant_key, num_hands)
+    events = act(rnd, bankroll, ACTION_HOLD_TOGGLE, index)  # any number of times
+    events = resolve(rnd, bankroll)                         # draw, score and pay
+
+One unit is bet per hand. Without a deck, rounds are dealt from the poker
+shuffle queue, so the deck order (and the N-play draw seed) is committed.
+"""
+import random
+from typing import Any, List, Optional, Tuple
+
+import config_actions as actions
+import config_rng as rng_cfg
+from card import Card
+from deck import Deck
+from fairness import draw_rng as committed_draw_rng
+from game_state import GameState
+from poker_nplay import play_n_hands
+from poker_variants import DEFAULT_VARIANT, get_variant
+from rng import get_stream
+from shuffle_queue import get_shuffle_queue
+from .events import DEAL, DRAW, HOLD, LOSE, WIN, Event, win_events
+
+class PokerRound:
+    """One round of video poker, from the deal to the draw."""
+    __slots__ = ("deck", "hand", "variant_key", "num_hands", "held_indices",
+                 "hands", "results", "winnings", "finished")
+
+    def __init__(self, deck: Optional[Deck], hand: List[Card], variant_key: str = DEFAULT_VARIANT, num_hands: int = 1,
+                 held_indices: Optional[List[int]] = None):
+        self.deck = deck
+        self.hand = hand # The dealt (base) hand
+        self.variant_key = variant_key
+        self.num_hands = num_hands
+        self.held_indices: List[int] = held_indices if held_indices is not None else []
+        self.hands: List[List[Card]] = [] # Final hands, once resolved
+        self.results: List[Tuple[str, str, int]] = [] # (category key, name, payout) per final hand
+        self.winnings = 0
+        self.finished = False
+
+    @property
+    def commitment(self) -> Any:
+        """The fairness.Commitment to the deck order, if the deck came from a shuffle queue."""
+        return getattr(self.deck, 'commitment', None)
+
+def new_round(bankroll: GameState, variant_key: str = DEFAULT_VARIANT, num_hands: int = 1,
+              deck: Optional[Deck] = None) -> Tuple[Optional[PokerRound], List[Event]]:
+    """
+    Takes the bet (one unit per hand) and deals five cards from `deck`
+    (default: the next pre-shuffled, committed deck of the variant).
+    Returns (None, []) if the bankroll cannot cover the bet.
+    """
+    bankroll.set_cost_per_game(num_hands)
+    if not bankroll.start_fixed_cost_game():
+        return None, []
+    if deck is None:
+        deck = get_shuffle_queue(rng_cfg.STREAM_POKER, 1, get_variant(variant_key).num_jokers).next_deck()
+    return PokerRound(deck, deck.deal(5), variant_key, num_hands), [DEAL]
+
+def act(rnd: PokerRound, bankroll: GameState, action: str, payload: Any = None) -> List[Event]:
+    """Applies a player action; the only one is ACTION_HOLD_TOGGLE with the card index (0-4)."""
+    if rnd.finished or action != actions.ACTION_HOLD_TOGGLE or payload is None or not 0 <= payload < 5:
+        return []
+    if payload in rnd.held_indices:
+        rnd.held_indices.remove(payload)
+    else:
+        rnd.held_indices.append(payload)
+        rnd.held_indices.sort()
+    return [HOLD]
+
+def _draw_single(rnd: PokerRound):
+    """Replaces the cards not held with the next cards of the deck, in position order."""
+    held = [i for i in rnd.held_indices if i < len(rnd.hand)]
+    cards_to_draw = 5 - len(held)
+    if len(rnd.deck) < cards_to_draw:
+        raise IndexError(f"Not enough cards left in deck ({len(rnd.deck)}) to draw {cards_to_draw}.")
+    new_cards = iter(rnd.deck.deal(cards_to_draw))
+    final_hand = [rnd.hand[i] if i in held else next(new_cards) for i in range(5)]
+    rnd.hands = [final_hand]
+    rnd.results = [get_variant(rnd.variant_key).evaluate(final_hand)]
+
+def resolve(rnd: PokerRound, bankroll: GameState, draw_rng: Optional[random.Random] = None) -> List[Event]:
+    """
+    Draws, scores and pays the round. A single hand draws from the deck; N-play
+    hands draw from the stub with the committed draw seed (see fairness.draw_rng;
+    or `draw_rng`, or the poker stream, for an uncommitted deck). Raises IndexError if a single
+    hand runs out of cards.
+    """
+    if rnd.num_hands == 1:
+        _draw_single(rnd)
+        winnings = rnd.results[0][2] # Payout is based on a 1-unit bet
+    else:
+        commitment = rnd.commitment
+        if commitment is not None:
+            draw_rng = committed_draw_rng(commitment.payload) # SHA-256 draws in secure mode
+        rnd.hands, rnd.results, winnings = play_n_hands(
+            rnd.hand, rnd.held_indices, rnd.num_hands, rnd.variant_key, draw_rng or get_stream(rng_cfg.STREAM_POKER)
+        )
+    rnd.winnings = winnings
+    rnd.finished = True
+
+    if winnings > 0:
+        bankroll.add_winnings(winnings)
+        events = [WIN] + win_events(winnings)
+    else:
+        events = [LOSE]
+    events.append(DRAW) # After the cards are replaced
+    return events
+
+
+if __name__ == '__main__':
+    import time
+    from rng import RngService
+
+    bankroll = GameState(starting_money=10**9)
+    service = RngService(2024)
+    deck_rng, draw_rng = service.stream("deck"), service.stream("draw")
+    for num_hands in (1, 3):
+        rounds = 20000
+        start_money = bankroll.money
+        start = time.perf_counter()
+        for _ in range(rounds):
+            rnd, events = new_round(bankroll, num_hands=num_hands, deck=Deck(rng=deck_rng))
+            act(rnd, bankroll, actions.ACTION_HOLD_TOGGLE, 0) # Hold the first card
+            resolve(rnd, bankroll, draw_rng)
+        elapsed = time.perf_counter() - start
+        rtp = (bankroll.money - start_money + rounds * num_hands) / (rounds * num_hands)
+        print(f"{num_hands} hand(s): {rounds / elapsed:,.0f} rounds/s, return {rtp:.1%} (holding the first card)")
@@ -0,0 +1,87 @@
+# /engine/roulette.py
+"""
+Headless Roulette rounds.
+
+    rnd, events = new_round(bankroll, {"color_red": 5, "number_17": 1})
+    events = resolve(rnd, bankroll)
+
+Bets are keyed as in roulette_rules ('number_5', 'color_red', 'dozen_1', ...).
+Without an rng, the winning number is the next pre-committed spin of the
+roulette stream (see fairness.OutcomeQueue).
+"""
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+import config_rng as rng_cfg
+from fairness import get_outcome_queue
+from game_state import GameState
+from roulette_rules import get_payout_for_bet, get_winning_numbers_for_bet, spin_wheel
+from .events import DEAL, LOSE, PAYOUT, WIN, Event, win_events
+
+class RouletteRound:
+    """One spin of the wheel with any number of bets."""
+    __slots__ = ("bets", "total_bet", "winning_number", "commitment", "total_payout",
+                 "net_winnings", "winning_bets", "finished")
+
+    def __init__(self, bets: Dict[str, int], winning_number: int, commitment: Any = None):
+        self.bets = dict(bets)
+        self.total_bet = sum(self.bets.values())
+        self.winning_number = winning_number
+        self.commitment = commitment # fairness.Commitment to the winning number, if pre-committed
+        self.total_payout = 0 # Money paid back into the bankroll (winning bets included)
+        self.net_winnings = 0
+        self.winning_bets: List[Tuple[str, int]] = [] # (bet key, payout) of each winning bet
+        self.finished = False
+
+def new_round(bankroll: GameState, bets: Dict[str, int], rng: Optional[random.Random] = None
+              ) -> Tuple[Optional[RouletteRound], List[Event]]:
+    """
+    Takes the bets and spins the wheel: with `rng` if given, otherwise the
+    next committed spin. Returns (None, []) if there are no bets or the
+    bankroll cannot cover them.
+    """
+    total_bet = sum(bets.values())
+    if total_bet <= 0 or not bankroll.deduct_bet(total_bet):
+        return None, []
+    if rng is not None:
+        return RouletteRound(bets, spin_wheel(rng)), [DEAL]
+    commitment = get_outcome_queue(rng_cfg.STREAM_ROULETTE, spin_wheel).pop()
+    return RouletteRound(bets, commitment.payload["result"], commitment), [DEAL]
+
+def resolve(rnd: RouletteRound, bankroll: GameState) -> List[Event]:
+    """Pays every winning bet its odds plus the bet itself."""
+    if rnd.finished:
+        return []
+    for bet_key, bet_amount in rnd.bets.items():
+        if rnd.winning_number in get_winning_numbers_for_bet(bet_key):
+            payout = get_payout_for_bet(bet_key) * bet_amount + bet_amount # Payout includes the original bet back
+            rnd.total_payout += payout
+            rnd.winning_bets.append((bet_key, payout))
+    rnd.net_winnings = rnd.total_payout - rnd.total_bet
+    rnd.finished = True
+
+    if rnd.total_payout > 0:
+        bankroll.add_winnings(rnd.total_payout)
+    if rnd.net_winnings > 0:
+        return [WIN] + win_events(rnd.total_payout)
+    events = [LOSE] if rnd.net_winnings < 0 else []
+    if rnd.total_payout > 0: # Some bets came back, without a net win
+        events.append(Event(PAYOUT, "push" if rnd.net_winnings == 0 else "win", rnd.total_payout))
+    return events
+
+
+if __name__ == '__main__':
+    import time
+    from rng import RngService
+
+    rng = RngService(2024).stream("roulette")
+    rounds = 200000
+    for bets in ({"color_red": 1}, {"number_17": 1}, {"dozen_2": 2, "column_1": 1}):
+        bankroll = GameState(starting_money=10**9)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            rnd, events = new_round(bankroll, bets, rng)
+            resolve(rnd, bankroll)
+        elapsed = time.perf_counter() - start
+        staked = rounds * sum(bets.values())
+        print(f"{bets}: {rounds / elapsed:,.0f} spins/s, return {(bankroll.money - 10**9 + staked) / staked:.1%}")
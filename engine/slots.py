@@ -0,0 +1,70 @@
+# /engine/slots.py
+"""
+Headless Slots rounds.
+
+    rnd, events = new_round(bankroll)
+    events = resolve(rnd, bankroll)
+
+Without an rng, the payline is the next pre-committed spin of the slots
+stream (see fairness.OutcomeQueue).
+"""
+import random
+from typing import Any, List, Optional, Tuple
+
+import config_rng as rng_cfg
+from fairness import get_outcome_queue
+from game_state import GameState
+from slots_rules import calculate_winnings, spin_reels, NUM_REELS, SLOTS_COST_PER_SPIN
+from .events import BUTTON, LOSE, WIN, Event, win_events
+
+class SlotsRound:
+    """One spin of the reels on the single payline."""
+    __slots__ = ("bet", "symbols", "commitment", "winnings", "win_name", "finished")
+
+    def __init__(self, bet: int, symbols: List[str], commitment: Any = None):
+        self.bet = bet
+        self.symbols = symbols # Payline symbols, one per reel
+        self.commitment = commitment # fairness.Commitment to the payline, if pre-committed
+        self.winnings = 0 # Money paid back into the bankroll
+        self.win_name = ""
+        self.finished = False
+
+def new_round(bankroll: GameState, bet: int = SLOTS_COST_PER_SPIN, rng: Optional[random.Random] = None
+              ) -> Tuple[Optional[SlotsRound], List[Event]]:
+    """
+    Takes the bet and spins the reels: with `rng` if given, otherwise the next
+    committed spin. Returns (None, []) if the bankroll cannot cover the bet.
+    """
+    if not bankroll.deduct_bet(bet):
+        return None, []
+    if rng is not None:
+        return SlotsRound(bet, spin_reels(rng)), [BUTTON]
+    commitment = get_outcome_queue(rng_cfg.STREAM_SLOTS, spin_reels).pop()
+    return SlotsRound(bet, list(commitment.payload["result"]), commitment), [BUTTON]
+
+def resolve(rnd: SlotsRound, bankroll: GameState) -> List[Event]:
+    """Pays the payline; an invalid payline (wrong number of symbols) pays nothing."""
+    if rnd.finished:
+        return []
+    rnd.finished = True
+    if len(rnd.symbols) == NUM_REELS:
+        rnd.winnings, rnd.win_name = calculate_winnings(rnd.symbols, rnd.bet)
+    if rnd.winnings > 0:
+        bankroll.add_winnings(rnd.winnings)
+        return [WIN] + win_events(rnd.winnings)
+    return [LOSE]
+
+
+if __name__ == '__main__':
+    import time
+    from rng import RngService
+
+    rng = RngService(2024).stream("slots")
+    bankroll = GameState(starting_money=10**9)
+    rounds = 200000
+    start = time.perf_counter()
+    for _ in range(rounds):
+        rnd, events = new_round(bankroll, rng=rng)
+        resolve(rnd, bankroll)
+    elapsed = time.perf_counter() - start
+    print(f"{rounds / elapsed:,.0f} spins/s, return {(bankroll.money - 10**9 + rounds) / rounds:.1%}")
@@ -0,0 +1,333 @@
+# /fairness.py
+"""
+Provably-fair commitments (commit-reveal) for every game round.
+
+Each round's outcome is fixed before the player bets: the deck order (poker),
+the shoe order (blackjack, baccarat), the winning pocket (roulette) or the
+symbols on the payline (slots). The player is shown only the commitment
+
+    SHA-256(salt || canonical JSON of the outcome)
+
+with a random salt, so the outcome cannot be worked out from it. After the
+round the salt and the outcome are revealed, and hashing them again must give
+the commitment shown before. A shoe is played over many rounds, so it is
+revealed when it is retired at the cut card.
+
+Deck and shoe commitments are computed by the ShuffleQueue workers together
+with each shuffle, and spin outcomes are drawn and committed in batches
+(OutcomeQueue), so no hashing happens when the player clicks DEAL or SPIN.
+
+Every commitment shown, round played and reveal is appended to a JSON-lines
+session log. `python fairness.py [LOG ...]` re-checks whole logs.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import random
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import config_rng as rng_cfg
+from card import CARD_BY_CODE
+from deck import fresh_codes
+from rng import HashDrawRandom, RngService, get_rng_service
+
+DRAWS_SHA256 = "sha256" # Payload "draws": the extra draws are SHA-256 counter mode over the draw seed
+
+def canonical_bytes(payload: Dict[str, Any]) -> bytes:
+    """The outcome's canonical JSON encoding: sorted keys, no whitespace."""
+    return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+def commitment_digest(salt: bytes, payload: Dict[str, Any]) -> str:
+    """Returns the hex SHA-256 commitment to the payload under the given salt."""
+    return hashlib.sha256(salt + canonical_bytes(payload)).hexdigest()
+
+class Commitment:
+    """A salted SHA-256 commitment to one outcome (a JSON-serializable dict)."""
+    __slots__ = ("payload", "salt", "digest")
+
+    def __init__(self, payload: Dict[str, Any], salt: Optional[bytes] = None):
+        self.payload = payload
+        self.salt = salt if salt is not None else os.urandom(rng_cfg.COMMITMENT_SALT_BYTES)
+        self.digest = commitment_digest(self.salt, payload)
+
+    def reveal(self) -> Dict[str, Any]:
+        """Everything needed to check the commitment: the digest, the salt and the outcome."""
+        return {"commitment": self.digest, "salt": self.salt.hex(), "payload": self.payload}
+
+def deck_payload(codes: Any, num_decks: int, num_jokers: int, draw_seed: int, hash_draws: bool = False) -> Dict[str, Any]:
+    """
+    The outcome committed for a deck or shoe: the full card order, the card set
+    it is a permutation of, and a seed for any draws a round makes besides the
+    deck order (the extra hands of N-play poker, see poker_nplay). With
+    hash_draws (secure mode) those draws come from SHA-256 over the seed
+    instead of a Mersenne Twister seeded with it (see draw_rng).
+    """
+    payload = {"cards": list(codes), "decks": num_decks, "jokers": num_jokers, "draw_seed": draw_seed}
+    if hash_draws:
+        payload["draws"] = DRAWS_SHA256
+    return payload
+
+def draw_rng(payload: Dict[str, Any]) -> random.Random:
+    """The generator of a committed deck's extra draws, from its draw seed."""
+    if payload.get("draws") == DRAWS_SHA256:
+        return HashDrawRandom(payload["draw_seed"])
+    return random.Random(payload["draw_seed"])
+
+
+# --- Pre-committed Spins ---
+class OutcomeQueue:
+    """
+    Spin outcomes (roulette pockets, slot paylines) drawn ahead of time from a
+    game stream, each with its commitment. Outcomes are drawn and hashed a
+    batch at a time, when the next commitment is first shown (between rounds).
+    """
+
+    def __init__(self, stream_name: str, draw: Callable[[random.Random], Any],
+                 batch_size: int = rng_cfg.SPIN_COMMIT_BATCH, service: Optional[RngService] = None,
+                 pending: Optional[List[Commitment]] = None):
+        """`pending` (from get_outcome_queue_states) resumes a saved queue; its stream must be resumed too."""
+        self.service = service or get_rng_service()
+        # Drawn in order from the game's own stream, so seeded sessions give the same spins
+        self._rng = self.service.stream(stream_name)
+        self._draw = draw
+        self._batch_size = batch_size
+        self._pending: Deque[Commitment] = deque(pending or ())
+
+    def _refill(self):
+        salt_size = rng_cfg.COMMITMENT_SALT_BYTES
+        salts = os.urandom(salt_size * self._batch_size) # One syscall per batch
+        for i in range(self._batch_size):
+            result = self._draw(self._rng)
+            self._pending.append(Commitment({"result": result}, salts[i * salt_size:(i + 1) * salt_size]))
+
+    def peek(self) -> Commitment:
+        """The commitment the next spin will use (to show before bets are placed)."""
+        if not self._pending:
+            self._refill()
+        return self._pending[0]
+
+    def pop(self) -> Commitment:
+        """Takes the next committed outcome; its payload["result"] is the spin result."""
+        commitment = self.peek()
+        self._pending.popleft()
+        return commitment
+
+_outcome_queues: Dict[str, OutcomeQueue] = {}
+
+def get_outcome_queue(stream_name: str, draw: Callable[[random.Random], Any]) -> OutcomeQueue:
+    """
+    Returns the shared outcome queue of a game stream, replacing it if the RNG
+    service was reseeded since it was created (as get_shuffle_queue does).
+    """
+    outcome_queue = _outcome_queues.get(stream_name)
+    if outcome_queue is None or outcome_queue.service is not get_rng_service():
+        outcome_queue = OutcomeQueue(stream_name, draw)
+        _outcome_queues[stream_name] = outcome_queue
+    return outcome_queue
+
+def get_outcome_queue_states() -> Dict[str, Tuple[Callable[[random.Random], Any], List[Commitment]]]:
+    """
+    Returns each shared outcome queue's draw function and the outcomes it has
+    committed but not used yet. Together with the RNG service's stream states
+    (RngService.getstate) this resumes the queues (restore_outcome_queues).
+    """
+    return {name: (outcome_queue._draw, list(outcome_queue._pending)) for name, outcome_queue in _outcome_queues.items()}
+
+def restore_outcome_queues(states: Dict[str, Tuple[Callable[[random.Random], Any], List[Commitment]]]):
+    """Replaces the shared outcome queues with ones resumed from get_outcome_queue_states()."""
+    _outcome_queues.clear()
+    for name, (draw, pending) in states.items():
+        _outcome_queues[name] = OutcomeQueue(name, draw, pending=pending)
+
+
+# --- Session Log ---
+class SessionLog:
+    """
+    Append-only JSON-lines log of one session: a "commit" record when a
+    commitment is first shown, a "round" record per round played against it,
+    and a "reveal" record with the salt and outcome once it is revealed.
+    A log with no path drops every record.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.rounds = 0 # Rounds played, logged or not (session recordings index them)
+        self._file = None
+
+    def _write(self, record: Dict[str, Any]):
+        if self.path is None:
+            return
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8", buffering=1) # Line-buffered: survives a crash
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def commit(self, game: str, commitment: Commitment):
+        self._write({"type": "commit", "game": game, "commitment": commitment.digest})
+
+    def round(self, game: str, commitment: Commitment, outcome: Dict[str, Any]):
+        self.rounds += 1
+        self._write({"type": "round", "game": game, "commitment": commitment.digest, "outcome": outcome})
+
+    def reveal(self, game: str, commitment: Commitment) -> Dict[str, Any]:
+        """Logs the reveal and returns it (for display)."""
+        record = commitment.reveal()
+        self._write({"type": "reveal", "game": game, **record})
+        return record
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+_session_log: Optional[SessionLog] = None
+
+def _default_log_path() -> Optional[str]:
+    env_path = os.environ.get(rng_cfg.FAIRNESS_LOG_ENV_VAR)
+    if env_path:
+        return None if env_path == "0" else env_path
+    filename = time.strftime("session_%Y%m%d_%H%M%S") + f"_{os.getpid()}.jsonl"
+    return os.path.join(rng_cfg.FAIRNESS_LOG_DIR, filename)
+
+def get_session_log() -> SessionLog:
+    """Returns the process-wide session log, created on first use."""
+    global _session_log
+    if _session_log is None:
+        _session_log = SessionLog(_default_log_path())
+    return _session_log
+
+def set_session_log(path: Optional[str]) -> SessionLog:
+    """Closes the current session log and starts a new one at `path` (None: no logging)."""
+    global _session_log
+    if _session_log is not None:
+        _session_log.close()
+    _session_log = SessionLog(path)
+    return _session_log
+
+
+# --- Verification ---
+_card_sets: Dict[Tuple[int, int], List[int]] = {}
+
+def _check_payload(payload: Dict[str, Any]) -> Optional[str]:
+    """Checks that a deck payload is a permutation of its card set. Returns an error or None."""
+    if "cards" not in payload:
+        return None if "result" in payload else "unknown payload"
+    key = (payload.get("decks", 1), payload.get("jokers", 0))
+    card_set = _card_sets.get(key)
+    if card_set is None:
+        card_set = _card_sets[key] = sorted(fresh_codes(*key))
+    if sorted(payload["cards"]) != card_set:
+        return "deck order is not a permutation of its card set"
+    if payload.get("draws", DRAWS_SHA256) != DRAWS_SHA256:
+        return "unknown draw generator"
+    return None
+
+def _check_outcome(payload: Dict[str, Any], outcome: Dict[str, Any]) -> Optional[str]:
+    """Checks a played round against the revealed outcome. Returns an error or None."""
+    if "result" in payload:
+        return None if outcome.get("result") == payload["result"] else "spin result differs from the commitment"
+    offset = outcome.get("offset", 0)
+    cards = outcome.get("cards", [])
+    if payload["cards"][offset:offset + len(cards)] != cards:
+        return "dealt cards differ from the committed deck order"
+    if "hands" in outcome:
+        # N-play: every extra hand is redrawn from the committed draw seed
+        from poker_nplay import draw_hands # Local import: only needed for N-play rounds
+        base_hand = [CARD_BY_CODE[code] for code in cards[:5]]
+        hands = draw_hands(base_hand, outcome.get("held", []), len(outcome["hands"]),
+                           payload.get("jokers", 0), draw_rng(payload))
+        if [[card.code for card in hand] for hand in hands] != outcome["hands"]:
+            return "N-play hands differ from the committed draw seed"
+    return None
+
+def verify_log(path: str) -> Dict[str, Any]:
+    """
+    Re-checks a session log in one pass: every reveal must hash to its
+    commitment, every round must have been played on a commitment shown
+    beforehand, and every round's outcome must match what was revealed.
+    Returns counts and a list of errors.
+    """
+    shown = set()
+    revealed = set()
+    pending_rounds: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {} # Rounds awaiting their reveal
+    errors: List[str] = []
+    counts = {"records": 0, "commitments": 0, "rounds": 0, "reveals": 0}
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                errors.append(f"line {line_no}: not valid JSON")
+                continue
+            counts["records"] += 1
+            kind = record.get("type")
+            digest = record.get("commitment")
+            if kind == "commit":
+                counts["commitments"] += 1
+                shown.add(digest)
+            elif kind == "round":
+                counts["rounds"] += 1
+                if digest not in shown:
+                    errors.append(f"line {line_no}: round played on a commitment not shown before it")
+                if digest in revealed:
+                    errors.append(f"line {line_no}: round played on a commitment already revealed")
+                pending_rounds.setdefault(digest, []).append((line_no, record.get("outcome", {})))
+            elif kind == "reveal":
+                counts["reveals"] += 1
+                payload = record.get("payload", {})
+                try:
+                    salt = bytes.fromhex(record.get("salt", ""))
+                except ValueError:
+                    salt = None
+                if salt is None or commitment_digest(salt, payload) != digest:
+                    errors.append(f"line {line_no}: salt and outcome do not hash to the commitment")
+                    pending_rounds.pop(digest, None)
+                    continue
+                error = _check_payload(payload)
+                if error:
+                    errors.append(f"line {line_no}: {error}")
+                    pending_rounds.pop(digest, None)
+                    continue
+                for round_line, outcome in pending_rounds.pop(digest, []):
+                    error = _check_outcome(payload, outcome)
+                    if error:
+                        errors.append(f"line {round_line}: {error}")
+                revealed.add(digest)
+            else:
+                errors.append(f"line {line_no}: unknown record type {kind!r}")
+    # Rounds on a commitment never revealed (e.g. the shoe in play when the session ended)
+    counts["unrevealed_rounds"] = sum(len(rounds) for rounds in pending_rounds.values())
+    return {"path": path, **counts, "errors": errors}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Verify provably-fair session logs.")
+    parser.add_argument("logs", nargs="*", help="Session logs (default: the newest log in FAIRNESS_LOG_DIR)")
+    args = parser.parse_args()
+
+    paths = args.logs
+    if not paths:
+        found = sorted(glob.glob(os.path.join(rng_cfg.FAIRNESS_LOG_DIR, "*.jsonl")), key=os.path.getmtime)
+        if not found:
+            parser.error(f"no session logs in {rng_cfg.FAIRNESS_LOG_DIR}")
+        paths = found[-1:]
+    failed = False
+    for path in paths:
+        start = time.perf_counter()
+        report = verify_log(path)
+        elapsed = time.perf_counter() - start
+        status = "FAIL" if report["errors"] else "PASS"
+        print(f"{status} {path}: {report['rounds']} rounds, {report['reveals']} reveals, "
+              f"{report['unrevealed_rounds']} rounds awaiting reveal ({elapsed:.2f} s)")
+        for error in report["errors"][:20]:
+            print(f"  {error}")
+        if len(report["errors"]) > 20:
+            print(f"  ... {len(report['errors']) - 20} more")
+        failed = failed or bool(report["errors"])
+    raise SystemExit(1 if failed else 0)
@@ -0,0 +1,31 @@
+# /game_functions/apply_engine_events.py
+from typing import Dict, Any, List
+
+import config_animations as anim
+from engine.events import ANIMATION, ANIM_MONEY, ANIM_RESULT_FLASH, SOUND, Event
+
+def apply_engine_events(events: List[Event], sounds: Dict[str, Any], settled: bool = False) -> Dict[str, Any]:
+    """
+    Plays the sounds of headless engine events and starts their animations.
+    With `settled` (the round was paid out), a round without a money animation
+    turns the money animation and result flashing off.
+    Returns a dictionary of the updated game state variables.
+    """
+    updated_state = {}
+    for event in events:
+        if event.kind == SOUND:
+            if sounds.get(event.name):
+                sounds[event.name].play()
+        elif event.kind == ANIMATION:
+            if event.name == ANIM_MONEY:
+                updated_state['money_animation_active'] = True
+                updated_state['money_animation_amount'] = event.amount
+                updated_state['money_animation_timer'] = anim.MONEY_ANIMATION_DURATION
+            elif event.name == ANIM_RESULT_FLASH:
+                updated_state['result_message_flash_active'] = True
+                updated_state['result_message_flash_timer'] = anim.RESULT_FLASH_DURATION
+                updated_state['result_message_flash_visible'] = True
+    if settled and 'money_animation_active' not in updated_state:
+        updated_state['money_animation_active'] = False
+        updated_state['result_message_flash_active'] = False
+    return updated_state
@@ -1,58 +1,38 @@
-import random
 from typing import Dict, Any
 
-import config_animations as animations
+import config_rng as rng_cfg
 import config_states as states
+from engine import roulette as roulette_engine
+from fairness import get_session_log
 from game_state import GameState
-# No longer need calculate_roulette_winnings here directly
-# from .calculate_roulette_winnings import calculate_roulette_winnings
-# Need the rules for getting number properties
-from roulette_rules import get_winning_numbers_for_bet, RED_NUMBERS, BLACK_NUMBERS, GREEN_NUMBER
+from roulette_rules import RED_NUMBERS, GREEN_NUMBER
+from .apply_engine_events import apply_engine_events
 
-# This function is now primarily responsible for calculating winnings and setting messages
-# based on a pre-determined winning number.
+# This function is now primarily responsible for paying out the spin and setting messages
+# based on the winning number drawn when the wheel was spun.
 def determine_roulette_result(current_game_state: Dict[str, Any], game_state_manager: GameState, sounds: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Calculates payouts based on the pre-determined winning number stored in the state,
+    Pays out the round in play (see engine/roulette.py) on its pre-determined winning number,
     updates money, sets messages/animations, and transitions state to RESULT.
     Called after the spin animation/timer finishes.
     Returns a dictionary of the updated game state variables.
     """
     new_state = current_game_state.copy()
 
-    # 1. Get the pre-determined Winning Number
-    winning_number = new_state.get('roulette_winning_number')
-    if winning_number is None:
+    # 1. Get the round in play, with its pre-determined Winning Number
+    rnd = new_state.get('roulette_round')
+    if rnd is None:
         print("Error: Winning number not found in state for result calculation!")
-        # Handle error gracefully - maybe force a loss or re-spin?
-        # For now, set to 0 and proceed, logging the error.
-        winning_number = 0
-        new_state['roulette_winning_number'] = 0 # Ensure it's set
+        # Handle error gracefully: a spin of 0 on the bets in the state, paid as usual
+        rnd = roulette_engine.RouletteRound(new_state.get('roulette_bets', {}), 0)
+    winning_number = rnd.winning_number
+    new_state['roulette_winning_number'] = winning_number
 
-    # 2. Calculate Winnings (using imported rules)
-    bets = new_state.get('roulette_bets', {})
-    total_payout = 0
-    total_bet_amount = sum(bets.values())
-    winning_bets_summary = []
-
-    # Re-implement calculation logic here (from calculate_roulette_winnings)
-    from roulette_rules import get_payout_for_bet # Local import ok here
-    for bet_key, bet_amount in bets.items():
-        winning_numbers_for_this_bet = get_winning_numbers_for_bet(bet_key)
-        if winning_number in winning_numbers_for_this_bet:
-            payout_multiplier = get_payout_for_bet(bet_key)
-            # Payout includes the original bet back
-            payout = (payout_multiplier * bet_amount) + bet_amount
-            total_payout += payout
-            # Format bet key nicely for the message
-            bet_name = bet_key.replace('_', ' ').title()
-            winning_bets_summary.append(f"{bet_name} (+${payout})")
-
-    net_winnings = total_payout - total_bet_amount
-
-    # Update player's money - add the total payout
-    if total_payout > 0:
-        game_state_manager.add_winnings(total_payout)
+    # 2. Pay the winning bets (the payout includes the original bet back)
+    events = roulette_engine.resolve(rnd, game_state_manager)
+    net_winnings = rnd.net_winnings
+    # Format bet keys nicely for the message
+    winning_bets_summary = [f"{bet_key.replace('_', ' ').title()} (+${payout})" for bet_key, payout in rnd.winning_bets]
 
     # Construct result message
     number_color = "Green" if winning_number in GREEN_NUMBER else ("Red" if winning_number in RED_NUMBERS else "Black")
@@ -62,9 +42,9 @@ def determine_roulette_result(current_game_state: Dict[str, Any], game_state_man
         result_message += f"You win ${net_winnings}! "
         if winning_bets_summary:
              result_message += f"({', '.join(winning_bets_summary)})"
-    elif net_winnings == 0 and total_payout > 0: # Bets returned, no net gain/loss
+    elif net_winnings == 0 and rnd.total_payout > 0: # Bets returned, no net gain/loss
          result_message += "Bets returned."
-    elif total_bet_amount > 0: # Avoid saying "You lost $0" if no bets were placed
+    elif rnd.total_bet > 0: # Avoid saying "You lost $0" if no bets were placed
         result_message += f"You lost ${abs(net_winnings)}."
     else:
         result_message += "No bets placed."
@@ -72,32 +52,24 @@ def determine_roulette_result(current_game_state: Dict[str, Any], game_state_man
 
     new_state['result_message'] = result_message
 
-    # 3. Play Sounds & Trigger Animations
-    if net_winnings > 0:
-        if sounds.get("win"): sounds["win"].play()
-        # Amount should be the total returned (net winnings + original winning bets)
-        original_winning_bets_value = total_payout - net_winnings
-        total_returned = net_winnings + original_winning_bets_value
-        new_state['money_animation_active'] = True
-        new_state['money_animation_amount'] = total_returned
-        new_state['money_animation_timer'] = animations.MONEY_ANIMATION_DURATION
-        new_state['result_message_flash_active'] = True
-        new_state['result_message_flash_timer'] = animations.RESULT_FLASH_DURATION
-        new_state['result_message_flash_visible'] = True
-    elif net_winnings < 0:
-        if sounds.get("lose"): sounds["lose"].play()
-        new_state['money_animation_active'] = False
-        new_state['result_message_flash_active'] = False
-    else: # Push or no bets won/lost
-        new_state['money_animation_active'] = False
-        new_state['result_message_flash_active'] = False
+    # 3. Play Sounds & Trigger Animations (the money animation shows the total returned)
+    new_state.update(apply_engine_events(events, sounds, settled=True))
 
 
     # 4. Update State for Result Display
     new_state['current_state'] = states.STATE_ROULETTE_RESULT
     new_state['message'] = "Click 'Clear Bets' or place new bets." # Next action prompt
+    new_state['roulette_round'] = None
 
     # Bets are kept in the state until explicitly cleared by the player
     # game_state_manager.reset_round_bet() # Reset the internal bet tracker for the next round
 
+    # Provably fair: log the spin against the commitment shown before it, then reveal it
+    commitment = new_state.get('fair_round_commitment')
+    if commitment is not None:
+        fair_log = get_session_log()
+        fair_log.round(rng_cfg.STREAM_ROULETTE, commitment, {"result": winning_number})
+        new_state['fair_reveal'] = fair_log.reveal(rng_cfg.STREAM_ROULETTE, commitment)
+        new_state['fair_round_commitment'] = None
+
     return new_state
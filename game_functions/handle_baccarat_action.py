@@ -124,13 +124,9 @@ def handle_baccarat_action(action: str, payload: Optional[any], current_game_sta
                 new_game_state['message'] = "Place a bet (Player, Banker, or Tie) before dealing!"
                 if sounds.get("lose"): sounds["lose"].play()
             elif game_state_manager.can_afford_bet(total_bet):
-                if game_state_manager.deduct_bet(total_bet):
-                    # Start the round (deals cards, checks naturals)
-                    round_state = start_baccarat_round(new_game_state, game_state_manager, sounds)
-                    new_game_state.update(round_state)
-                else:
-                    new_game_state['message'] = "Error deducting bet!"
-                    if sounds.get("lose"): sounds["lose"].play()
+                # Start the round (deducts the bet, deals cards, checks naturals)
+                round_state = start_baccarat_round(new_game_state, game_state_manager, sounds)
+                new_game_state.update(round_state)
             else:
                 new_game_state['message'] = f"Not enough money! Need ${total_bet} to deal."
                 if sounds.get("lose"): sounds["lose"].play()
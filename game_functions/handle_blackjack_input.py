@@ -37,12 +37,12 @@ def handle_blackjack_action(action: str, payload: Optional[any], current_game_st
     if action == actions_cfg.ACTION_DEAL_DRAW: # Reusing DEAL_DRAW for Blackjack Deal
         if current_state_str == states.STATE_BLACKJACK_IDLE:
             if sounds.get("button"): sounds["button"].play()
-            round_state = start_blackjack_round(game_state_manager, sounds)
+            round_state = start_blackjack_round(game_state_manager, sounds, new_game_state.get('blackjack_shoe'))
             new_game_state.update(round_state)
         elif current_state_str == states.STATE_BLACKJACK_SHOWING_RESULT:
             if sounds.get("button"): sounds["button"].play()
             if game_state_manager.can_afford_bet(1):
-                round_state = start_blackjack_round(game_state_manager, sounds)
+                round_state = start_blackjack_round(game_state_manager, sounds, new_game_state.get('blackjack_shoe'))
                 new_game_state.update(round_state)
             else:
                 reset_state = reset_game_variables()
@@ -5,6 +5,7 @@ import config_states as states
 import config_actions as actions_cfg
 import config_layout_cards as layout_cards
 from game_state import GameState
+from poker_variants import next_variant_key
 from .reset_game_variables import reset_game_variables
 
 def handle_menu_action(action: str, payload: Optional[any], current_game_state: Dict[str, Any], game_state_manager: GameState, sounds: Dict[str, Any]) -> Dict[str, Any]:
@@ -47,6 +48,9 @@ def handle_menu_action(action: str, payload: Optional[any], current_game_state:
                 new_game_state['volume_level'] = round(new_volume, 2)
                 new_game_state['volume_changed'] = True
                 if sounds.get("button"): sounds["button"].play()
+        elif action == actions_cfg.ACTION_CYCLE_POKER_VARIANT:
+            if sounds.get("button"): sounds["button"].play()
+            new_game_state['poker_variant'] = next_variant_key(new_game_state.get('poker_variant'))
         elif action == actions_cfg.ACTION_RETURN_TO_TOP_MENU:
             if sounds.get("button"): sounds["button"].play()
             new_game_state['current_state'] = states.STATE_TOP_MENU
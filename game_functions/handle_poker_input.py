@@ -6,6 +6,7 @@ import config_states as states
 import config_actions as actions_cfg
 import config_layout_cards as layout_cards # For NUM_MULTI_HANDS cost check
 from game_state import GameState
+from poker_variants import DEFAULT_VARIANT
 from .start_draw_poker_round import start_draw_poker_round
 from .start_multi_poker_round import start_multi_poker_round
 from .process_drawing import process_drawing
@@ -40,30 +41,33 @@ def handle_poker_action(action: str, payload: Optional[any], current_game_state:
     if action == actions_cfg.ACTION_DEAL_DRAW:
         if current_state_str == states.STATE_DRAW_POKER_IDLE:
             if sounds.get("button"): sounds["button"].play()
-            round_state = start_draw_poker_round(game_state_manager, sounds)
+            round_state = start_draw_poker_round(game_state_manager, sounds, new_game_state.get('poker_variant', DEFAULT_VARIANT))
             new_game_state.update(round_state)
         elif current_state_str == states.STATE_MULTI_POKER_IDLE:
             if sounds.get("button"): sounds["button"].play()
-            round_state = start_multi_poker_round(game_state_manager, sounds)
+            round_state = start_multi_poker_round(game_state_manager, sounds, new_game_state.get('poker_variant', DEFAULT_VARIANT))
             new_game_state.update(round_state)
         elif current_state_str == states.STATE_DRAW_POKER_WAITING_FOR_HOLD:
             if sounds.get("button"): sounds["button"].play()
             draw_results = process_drawing(
                 new_game_state['hand'], new_game_state['held_indices'],
-                new_game_state['deck'], game_state_manager, sounds
+                new_game_state['deck'], game_state_manager, sounds,
+                new_game_state.get('poker_variant', DEFAULT_VARIANT)
             )
             new_game_state.update(draw_results)
         elif current_state_str == states.STATE_MULTI_POKER_WAITING_FOR_HOLD:
             if sounds.get("button"): sounds["button"].play()
             multi_draw_results = process_multi_drawing(
                 new_game_state['hand'], new_game_state['held_indices'],
-                game_state_manager, sounds
+                game_state_manager, sounds,
+                new_game_state.get('poker_variant', DEFAULT_VARIANT),
+                deck=new_game_state.get('deck')
             )
             new_game_state.update(multi_draw_results)
         elif current_state_str == states.STATE_DRAW_POKER_SHOWING_RESULT:
             if sounds.get("button"): sounds["button"].play()
             if game_state_manager.can_afford_bet(1):
-                round_state = start_draw_poker_round(game_state_manager, sounds)
+                round_state = start_draw_poker_round(game_state_manager, sounds, new_game_state.get('poker_variant', DEFAULT_VARIANT))
                 new_game_state.update(round_state)
             else:
                 reset_state = reset_game_variables()
@@ -74,7 +78,7 @@ def handle_poker_action(action: str, payload: Optional[any], current_game_state:
             if sounds.get("button"): sounds["button"].play()
             cost_next_multi = layout_cards.NUM_MULTI_HANDS
             if game_state_manager.can_afford_bet(cost_next_multi):
-                round_state = start_multi_poker_round(game_state_manager, sounds)
+                round_state = start_multi_poker_round(game_state_manager, sounds, new_game_state.get('poker_variant', DEFAULT_VARIANT))
                 new_game_state.update(round_state)
             else:
                 reset_state = reset_game_variables()
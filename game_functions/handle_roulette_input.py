@@ -1,12 +1,12 @@
 # /game_functions/handle_roulette_input.py
-import random
 from typing import Dict, Any, Optional, Tuple
 
 import config_states as states
 import config_actions as actions_cfg
 import config_animations as anim
-import config_layout_roulette as layout_roulette # For wheel numbers
+from engine import roulette as roulette_engine
 from game_state import GameState
+from .apply_engine_events import apply_engine_events
 from .place_roulette_bet import place_roulette_bet
 from .reset_game_variables import reset_game_variables
 
@@ -61,11 +61,13 @@ def handle_roulette_action(action: str, payload: Optional[any], current_game_sta
                 new_game_state['message'] = "Place a bet before spinning!"
                 if sounds.get("lose"): sounds["lose"].play()
             elif game_state_manager.can_afford_bet(total_bet):
-                if game_state_manager.deduct_bet(total_bet):
-                    if sounds.get("deal"): sounds["deal"].play()
-                    # Determine winning number HERE
-                    winning_number = random.choice(layout_roulette.ROULETTE_WHEEL_NUMBERS)
-                    new_game_state['roulette_winning_number'] = winning_number
+                # Deducts the bets; the winning number was drawn and committed before them (see fairness.py)
+                rnd, events = roulette_engine.new_round(game_state_manager, new_game_state.get('roulette_bets', {}))
+                if rnd is not None:
+                    new_game_state.update(apply_engine_events(events, sounds)) # Spin sound
+                    new_game_state['roulette_round'] = rnd
+                    new_game_state['fair_round_commitment'] = rnd.commitment
+                    new_game_state['roulette_winning_number'] = rnd.winning_number
                     # Set state and timer for animation
                     new_game_state['current_state'] = states.STATE_ROULETTE_SPINNING
                     new_game_state['roulette_spin_timer'] = anim.ROULETTE_SPIN_DURATION
@@ -0,0 +1,74 @@
+# /game_functions/new_game_state.py
+from typing import Dict, Any
+
+import config_states as states
+from deck import Deck
+from poker_variants import DEFAULT_VARIANT
+
+def new_game_state(sound_enabled: bool = True, volume_level: float = 0.7) -> Dict[str, Any]:
+    """Returns the game state variables of a new session, starting at the top menu."""
+    return {
+        'current_state': states.STATE_TOP_MENU,
+        'hand': [],
+        'multi_hands': [],
+        'multi_results': [],
+        'held_indices': [],
+        'message': "",
+        'result_message': "",
+        'final_hand_rank': None,
+        'total_winnings': 0,
+        'money_animation_active': False,
+        'money_animation_timer': 0,
+        'money_animation_amount': 0,
+        'result_message_flash_active': False,
+        'result_message_flash_timer': 0,
+        'result_message_flash_visible': True,
+        'player_hand': [],
+        'dealer_hand': [],
+        'dealer_shows_one_card': False,
+        'deck': Deck(),
+        'blackjack_shoe': None, # Created on the first Blackjack round, then kept (see shoe.py)
+        'baccarat_shoe': None,
+        'running': True,
+        'sound_enabled': sound_enabled,
+        'needs_money_reset': False,
+        'confirm_exit_destination': None,
+        'sound_setting_changed': False,
+        'volume_level': volume_level,
+        'volume_changed': False,
+        'previous_state_before_confirm': None,
+        'confirm_action_type': None,
+        'poker_variant': DEFAULT_VARIANT, # Video poker game, see poker_variants.VARIANTS
+        # --- Add Roulette Specific State ---
+        'roulette_bets': {},
+        'roulette_winning_number': None,
+        'roulette_spin_timer': 0,
+        'roulette_pause_timer': 0,
+        'winning_slot_flash_active': False,
+        'winning_slot_flash_count': 0,
+        'winning_slot_flash_visible': True,
+        # --- Add Slots Specific State ---
+        'slots_final_symbols': ["?", "?", "?"],
+        'slots_reel_positions': [0, 0, 0],
+        'slots_spin_timer': 0,
+        'slots_result_pause_timer': 0,
+        # --- Add Baccarat Specific State ---
+        'baccarat_bets': {},
+        'baccarat_bet_type': None,
+        'baccarat_total_bet': 0,
+        'baccarat_player_hand': [],
+        'baccarat_banker_hand': [],
+        'baccarat_player_value': None,
+        'baccarat_banker_value': None,
+        'baccarat_winner': None,
+        # --- Headless engine rounds in play (see engine/) ---
+        'blackjack_round': None,
+        'baccarat_round': None,
+        'roulette_round': None,
+        'slots_round': None,
+        # --- Provably-fair commitments (see fairness.py) ---
+        'fair_commitment': None, # Commitment shown for the current or next round
+        'fair_reveal': None, # Last revealed commitment (digest, salt, outcome)
+        'fair_round_commitment': None, # Commitment the round in play was dealt/spun from
+        'fair_round_offset': 0, # Shoe position where the round in play started
+    }
@@ -2,9 +2,9 @@ from typing import Dict, Any
 
 import config_actions as actions
 import config_states as states
-from deck import Deck
+from engine import blackjack as blackjack_engine
 from game_state import GameState
-from blackjack_rules import get_hand_value, is_busted
+from .apply_engine_events import apply_engine_events
 from .resolve_blackjack_round import resolve_blackjack_round # Import resolve function
 
 def process_blackjack_action(action: str, current_game_state: Dict[str, Any], game_state_manager: GameState, sounds: Dict[str, Any]) -> Dict[str, Any]:
@@ -13,30 +13,25 @@ def process_blackjack_action(action: str, current_game_state: Dict[str, Any], ga
     Returns a dictionary of the updated game state variables.
     """
     new_state = current_game_state.copy()
-    player_hand = new_state.get('player_hand', [])
-    deck = new_state.get('deck')
+    rnd = new_state.get('blackjack_round')
+    if rnd is None:
+        new_state['message'] = "No hand in play!"
+        new_state['current_state'] = states.STATE_GAME_OVER # Error state
+        return new_state
 
     if action == actions.ACTION_BLACKJACK_HIT:
-        if deck and len(deck) > 0:
-            # Deal one card to player
-            player_hand.extend(deck.deal(1))
-            new_state['player_hand'] = player_hand
-            if sounds.get("draw"): sounds["draw"].play() # Use draw sound for hit
-
-            # Check for bust
-            if is_busted(player_hand):
-                if sounds.get("lose"): sounds["lose"].play()
-                # Player busts, resolve the round immediately (player loses)
-                # Pass the current state to resolve function
-                resolve_state = resolve_blackjack_round(new_state, game_state_manager, sounds)
-                new_state.update(resolve_state) # Update state with resolution results
-            else:
-                # Still player's turn, update message if needed
-                new_state['message'] = "Hit or Stand?"
-                new_state['current_state'] = states.STATE_BLACKJACK_PLAYER_TURN # Remain in player turn
+        # Deal one card to player; a bust settles the round at once (player loses)
+        events = blackjack_engine.act(rnd, game_state_manager, action)
+        new_state['player_hand'] = rnd.player_hand
+        if rnd.finished:
+            # Pass the hit's events on, so they are played before the result's
+            resolve_state = resolve_blackjack_round(new_state, game_state_manager, sounds, events)
+            new_state.update(resolve_state) # Update state with resolution results
         else:
-            new_state['message'] = "Deck empty error!"
-            new_state['current_state'] = states.STATE_GAME_OVER # Error state
+            new_state.update(apply_engine_events(events, sounds)) # Draw sound for the hit
+            # Still player's turn, update message if needed
+            new_state['message'] = "Hit or Stand?"
+            new_state['current_state'] = states.STATE_BLACKJACK_PLAYER_TURN # Remain in player turn
 
     elif action == actions.ACTION_BLACKJACK_STAND:
         if sounds.get("button"): sounds["button"].play() # Sound for clicking stand
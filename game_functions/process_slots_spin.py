@@ -1,13 +1,14 @@
 # /game_functions/process_slots_spin.py
-import random
 from typing import Dict, Any
 
 import config_states as states
 import config_animations as anim
+import config_rng as rng_cfg
+from engine import slots as slots_engine
 from game_state import GameState
-from slots_rules import spin_reels, REEL_STRIPS
-# Define the cost per spin
-SLOTS_COST_PER_SPIN = 1
+from rng import get_stream
+from slots_rules import REEL_STRIPS, SLOTS_COST_PER_SPIN
+from .apply_engine_events import apply_engine_events
 
 def process_slots_spin(current_game_state: Dict[str, Any], game_state_manager: GameState, sounds: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -23,13 +24,15 @@ def process_slots_spin(current_game_state: Dict[str, Any], game_state_manager: G
         if sounds.get("lose"): sounds["lose"].play()
         return new_state # Return without changing state if cannot afford
 
-    # 2. Deduct cost
-    if game_state_manager.deduct_bet(SLOTS_COST_PER_SPIN):
-        if sounds.get("button"): sounds["button"].play() # Or a dedicated spin sound
+    # 2. Deduct cost and take the result of the spin, drawn and committed before it (see fairness.py)
+    rnd, events = slots_engine.new_round(game_state_manager, SLOTS_COST_PER_SPIN)
+    if rnd is not None:
+        new_state.update(apply_engine_events(events, sounds)) # Spin sound
 
-        # 3. Determine the final result of the spin *before* animation starts
-        final_symbols = spin_reels()
-        new_state['slots_final_symbols'] = final_symbols # Store the result
+        # 3. Store the round and its result
+        new_state['slots_round'] = rnd
+        new_state['fair_round_commitment'] = rnd.commitment
+        new_state['slots_final_symbols'] = list(rnd.symbols)
 
         # 4. Set state to spinning and start timer
         new_state['current_state'] = states.STATE_SLOTS_SPINNING
@@ -39,8 +42,9 @@ def process_slots_spin(current_game_state: Dict[str, Any], game_state_manager: G
 
         # Initialize reel positions for animation (e.g., start at random points)
         # These will be updated during the animation in draw_slots_screen
-        # Use the imported REEL_STRIPS
-        new_state['slots_reel_positions'] = [random.randint(0, len(strip) - 1) for strip in REEL_STRIPS]
+        # Use the imported REEL_STRIPS; cosmetic, so drawn from the effects stream
+        effects_rng = get_stream(rng_cfg.STREAM_EFFECTS)
+        new_state['slots_reel_positions'] = [effects_rng.randint(0, len(strip) - 1) for strip in REEL_STRIPS]
 
     else:
         # Should not happen if can_afford_bet passed, but as a fallback
@@ -0,0 +1,22 @@
+# /game_functions/record_shoe_round.py
+from typing import Dict, Any, Optional
+
+from fairness import Commitment, get_session_log
+from shoe import Shoe
+
+def record_shoe_round(game: str, shoe: Optional[Shoe], round_commitment: Optional[Commitment], round_offset: int) -> Dict[str, Any]:
+    """
+    Provably fair: logs the cards a finished Blackjack/Baccarat round dealt off
+    the committed shoe order, then reveals any shoe retired at the cut card.
+    Returns a dictionary of the updated game state variables.
+    """
+    updated_state = {}
+    if shoe is None:
+        return updated_state
+    fair_log = get_session_log()
+    # A shoe that ran out mid-round was reshuffled under a new commitment; that round is not logged
+    if round_commitment is not None and shoe.commitment is round_commitment:
+        fair_log.round(game, round_commitment, {"offset": round_offset, "cards": shoe.dealt_codes(round_offset)})
+    for commitment in shoe.take_retired_commitments():
+        updated_state['fair_reveal'] = fair_log.reveal(game, commitment)
+    return updated_state
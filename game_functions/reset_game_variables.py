@@ -44,6 +44,11 @@ def reset_game_variables() -> Dict[str, Any]:
         'baccarat_player_value': None,
         'baccarat_banker_value': None,
         'baccarat_winner': None,
+        # Headless engine rounds in play (see engine/)
+        'blackjack_round': None,
+        'baccarat_round': None,
+        'roulette_round': None,
+        'slots_round': None,
         # Note: deck and current_state are typically handled by the calling function
         # Note: game_state_manager (money) is NOT reset here
     }
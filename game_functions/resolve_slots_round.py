@@ -1,60 +1,56 @@
 from typing import Dict, Any
 
+import config_rng as rng_cfg
 import config_states as states
 import config_animations as anim
-from config_layout_slots import NUM_REELS
+from engine import slots as slots_engine
+from fairness import get_session_log
 from game_state import GameState
-from slots_rules import calculate_winnings # Import the function to calculate winnings
-from .process_slots_spin import SLOTS_COST_PER_SPIN # Import cost per spin
+from slots_rules import SLOTS_COST_PER_SPIN
+from .apply_engine_events import apply_engine_events
 
 def resolve_slots_round(current_game_state: Dict[str, Any], game_state_manager: GameState, sounds: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Calculates winnings based on the final symbols stored in the state,
+    Pays out the spin in play (see engine/slots.py) on its final symbols,
     updates money, sets messages/animations, and transitions state to SHOWING_RESULT.
     Called after the spin animation/timer finishes.
     Returns a dictionary of the updated game state variables.
     """
     new_state = current_game_state.copy()
 
-    # 1. Get the final symbols determined before the spin
-    final_symbols = new_state.get('slots_final_symbols')
-    if not final_symbols or len(final_symbols) != NUM_REELS:
-        print(f"Error: Final symbols not found or invalid in state: {final_symbols}")
+    # 1. Get the round in play, with the final symbols determined before the spin
+    rnd = new_state.get('slots_round')
+    if rnd is None:
+        print(f"Error: Final symbols not found or invalid in state: {new_state.get('slots_final_symbols')}")
         # Handle error gracefully - assume no win
-        final_symbols = ["?", "?", "?"] # Placeholder
-        winnings = 0
-        win_name = ""
-        new_state['slots_final_symbols'] = final_symbols # Ensure it's set for display
-    else:
-        # 2. Calculate Winnings
-        winnings, win_name = calculate_winnings(final_symbols, SLOTS_COST_PER_SPIN)
-
-    # 3. Update Money and Set Messages/Sounds/Animations
-    if winnings > 0:
-        game_state_manager.add_winnings(winnings) # Add net winnings
-        new_state['result_message'] = f"WINNER! {win_name}! +${winnings}"
-        if sounds.get("win"): sounds["win"].play()
-        # Trigger animations
-        new_state['money_animation_active'] = True
-        new_state['money_animation_amount'] = winnings
-        new_state['money_animation_timer'] = anim.MONEY_ANIMATION_DURATION
-        new_state['result_message_flash_active'] = True
-        new_state['result_message_flash_timer'] = anim.RESULT_FLASH_DURATION
-        new_state['result_message_flash_visible'] = True
+        rnd = slots_engine.SlotsRound(SLOTS_COST_PER_SPIN, ["?", "?", "?"]) # Placeholder
+        new_state['slots_final_symbols'] = rnd.symbols # Ensure it's set for display
+
+    # 2. Calculate and pay the winnings (an invalid payline pays nothing)
+    events = slots_engine.resolve(rnd, game_state_manager)
+
+    # 3. Set Messages, then play Sounds/Animations
+    if rnd.winnings > 0:
+        new_state['result_message'] = f"WINNER! {rnd.win_name}! +${rnd.winnings}"
     else:
         new_state['result_message'] = "No win this spin."
-        # Only play lose sound if they actually bet (which they must have to reach here)
-        if sounds.get("lose"): sounds["lose"].play()
-        # Ensure animations are off
-        new_state['money_animation_active'] = False
-        new_state['result_message_flash_active'] = False
+    new_state.update(apply_engine_events(events, sounds, settled=True))
 
     # 4. Update State for Result Display
     new_state['current_state'] = states.STATE_SLOTS_SHOWING_RESULT
     new_state['slots_result_pause_timer'] = anim.SLOTS_RESULT_PAUSE_DURATION # Start pause timer
     new_state['message'] = "Click SPIN to play again." # Next action prompt
+    new_state['slots_round'] = None
 
     # Reset the round bet tracker in GameState (optional, depends on how it's used)
     # game_state_manager.reset_round_bet()
 
+    # Provably fair: log the spin against the commitment shown before it, then reveal it
+    commitment = new_state.get('fair_round_commitment')
+    if commitment is not None:
+        fair_log = get_session_log()
+        fair_log.round(rng_cfg.STREAM_SLOTS, commitment, {"result": rnd.symbols})
+        new_state['fair_reveal'] = fair_log.reveal(rng_cfg.STREAM_SLOTS, commitment)
+        new_state['fair_round_commitment'] = None
+
     return new_state
@@ -1,22 +1,21 @@
 # /game_functions/start_baccarat_round.py
 """
-Handles the start of a Baccarat round: dealing initial cards and checking for naturals.
+Handles the start of a Baccarat round: taking the bet, dealing initial cards and checking for naturals.
 """
 from typing import Dict, Any
 
+import config_rng as rng_cfg
 import config_states as states
-import config_animations as anim
-from deck import Deck
+from engine import baccarat as baccarat_engine
 from game_state import GameState
-from baccarat_rules import (
-    is_natural, determine_baccarat_winner, calculate_baccarat_payout,
-    BET_PLAYER, BET_BANKER, BET_TIE, get_baccarat_hand_value
-)
+from .apply_engine_events import apply_engine_events
+from .record_shoe_round import record_shoe_round
 from .reset_game_variables import reset_game_variables # Use to clear previous round state
 
 def start_baccarat_round(current_game_state: Dict[str, Any], game_state_manager: GameState, sounds: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Starts a new round of Baccarat. Deals cards, checks for naturals, and determines immediate outcome or proceeds.
+    Starts a new round of Baccarat. Deducts the bet, deals cards, checks for naturals,
+    and determines immediate outcome or proceeds.
     Assumes bets are already placed and validated in handle_baccarat_action.
     Returns a dictionary of the updated game state variables.
     """
@@ -24,6 +23,17 @@ def start_baccarat_round(current_game_state: Dict[str, Any], game_state_manager:
     bet_amount = new_state.get('baccarat_total_bet', 0)
     bet_type = new_state.get('baccarat_bet_type') # Should be set before calling this
 
+    # The shoe is kept in game state across rounds and reshuffled once the cut card is out
+    shoe = new_state.get('baccarat_shoe')
+    if shoe is None:
+        shoe = baccarat_engine.new_shoe()
+        new_state['baccarat_shoe'] = shoe
+    rnd, events = baccarat_engine.new_round(game_state_manager, bet_type, bet_amount, shoe)
+    if rnd is None:
+        new_state['message'] = "Error deducting bet!"
+        if sounds.get("lose"): sounds["lose"].play()
+        return new_state
+
     # Reset previous round variables (hands, results) but keep bets for this round
     reset_vars = reset_game_variables()
     new_state.update(reset_vars)
@@ -31,61 +41,40 @@ def start_baccarat_round(current_game_state: Dict[str, Any], game_state_manager:
     new_state['baccarat_total_bet'] = bet_amount
     new_state['baccarat_bet_type'] = bet_type
 
-    deck = Deck() # Fresh deck
-
-    # Deal initial hands (Player, Banker, Player, Banker)
-    player_hand = [deck.deal(1)[0], deck.deal(1)[0]]
-    banker_hand = [deck.deal(1)[0], deck.deal(1)[0]]
+    new_state['baccarat_round'] = rnd
+    # Where this round starts in the committed shoe order (see record_shoe_round)
+    new_state['fair_round_commitment'] = rnd.commitment
+    new_state['fair_round_offset'] = rnd.offset
 
-    new_state['baccarat_player_hand'] = player_hand
-    new_state['baccarat_banker_hand'] = banker_hand
-    new_state['deck'] = deck # Store the deck
-
-    if sounds.get("deal"):
-        sounds["deal"].play()
+    # Initial hands (Player, Player, Banker, Banker)
+    new_state['baccarat_player_hand'] = rnd.player_hand
+    new_state['baccarat_banker_hand'] = rnd.banker_hand
+    new_state['deck'] = shoe # Store the deck
 
     new_state['current_state'] = states.STATE_BACCARAT_DEALING # Indicate dealing phase
 
-    # Check for Naturals
-    player_natural = is_natural(player_hand)
-    banker_natural = is_natural(banker_hand)
-
-    if player_natural or banker_natural:
-        # Natural occurred, round ends immediately. Resolve winner.
-        winning_hand, player_val, banker_val = determine_baccarat_winner(player_hand, banker_hand)
-        total_returned, net_winnings = calculate_baccarat_payout(bet_type, bet_amount, winning_hand)
+    # Deal sound, plus the result's sound and animations if a natural settled the round
+    new_state.update(apply_engine_events(events, sounds))
+    new_state['baccarat_player_value'] = rnd.player_value
+    new_state['baccarat_banker_value'] = rnd.banker_value
 
-        new_state['baccarat_player_value'] = player_val
-        new_state['baccarat_banker_value'] = banker_val
-        new_state['baccarat_winner'] = winning_hand
+    if rnd.finished:
+        # Natural occurred, round ends immediately
+        new_state['baccarat_winner'] = rnd.winner
 
-        # Update money and set messages/animations
-        if net_winnings > 0:
-            game_state_manager.add_winnings(int(round(total_returned))) # Add total return (bet + win), ensure int
-            new_state['result_message'] = f"{winning_hand} wins! +${int(round(total_returned))}"
-            if sounds.get("win"): sounds["win"].play()
-            new_state['money_animation_active'] = True
-            new_state['money_animation_amount'] = int(round(total_returned))
-            new_state['money_animation_timer'] = anim.MONEY_ANIMATION_DURATION
-            new_state['result_message_flash_active'] = True
-            new_state['result_message_flash_timer'] = anim.RESULT_FLASH_DURATION
-        elif net_winnings == 0: # Push (Tie occurred, bet was on Player/Banker)
-            game_state_manager.add_winnings(int(round(total_returned))) # Return original bet
+        if rnd.net_winnings > 0:
+            new_state['result_message'] = f"{rnd.winner} wins! +${rnd.returned}"
+        elif rnd.net_winnings == 0: # Push (Tie occurred, bet was on Player/Banker)
             new_state['result_message'] = f"Tie! Bet Returned"
-            # No win/lose sound for push
-        else: # Loss
-            # Bet was already deducted, no money change needed
-            new_state['result_message'] = f"{winning_hand} wins! You lose -${bet_amount}"
-            if sounds.get("lose"): sounds["lose"].play()
+        else: # Loss: the bet was already deducted, no money change needed
+            new_state['result_message'] = f"{rnd.winner} wins! You lose -${bet_amount}"
 
         new_state['message'] = "Place bets or Deal again."
         new_state['current_state'] = states.STATE_BACCARAT_RESULT
+        new_state.update(record_shoe_round(rng_cfg.STREAM_BACCARAT, shoe, rnd.commitment, rnd.offset))
 
     else:
-        # No Natural, proceed to drawing phase
-        # Store initial values for display during drawing phase if needed
-        new_state['baccarat_player_value'] = get_baccarat_hand_value(player_hand)
-        new_state['baccarat_banker_value'] = get_baccarat_hand_value(banker_hand)
+        # No Natural, proceed to drawing phase (initial values are shown while drawing)
         new_state['message'] = "Checking drawing rules..."
         new_state['current_state'] = states.STATE_BACCARAT_DRAWING # Move to drawing logic state
         # We can add a small delay timer here if we want a pause before drawing starts
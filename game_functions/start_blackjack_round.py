@@ -1,71 +1,53 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-import config_animations as animations
+import config_rng as rng_cfg
 import config_states as states
 from deck import Deck
+from engine import blackjack as blackjack_engine
 from game_state import GameState
-from blackjack_rules import is_blackjack, determine_winner, BLACKJACK_PAYOUT, LOSS_PAYOUT, PUSH_PAYOUT
+from shoe import Shoe
+from .apply_engine_events import apply_engine_events
+from .record_shoe_round import record_shoe_round
 from .reset_game_variables import reset_game_variables
 
-def start_blackjack_round(game_state_manager: GameState, sounds: Dict[str, Any]) -> Dict[str, Any]:
+def start_blackjack_round(game_state_manager: GameState, sounds: Dict[str, Any], shoe: Optional[Shoe] = None) -> Dict[str, Any]:
     """
-    Starts a new round of Blackjack. Deals cards and checks for initial Blackjacks.
+    Starts a new round of Blackjack. Deals cards from the shoe (a new one if None;
+    reshuffled first if the cut card is out) and checks for initial Blackjacks.
     Returns a dictionary of the updated game state variables.
     """
     bet_amount = 1 # Fixed bet for now
-    game_state_manager.set_cost_per_game(bet_amount)
+    rnd, events = blackjack_engine.new_round(game_state_manager, shoe, bet_amount)
 
-    if game_state_manager.start_fixed_cost_game(): 
+    if rnd is not None:
         updated_state = reset_game_variables() # Reset general variables
-        deck = Deck() # Get a fresh shuffled deck
+        updated_state['blackjack_round'] = rnd
+        # Where this round starts in the committed shoe order (see record_shoe_round)
+        updated_state['fair_round_commitment'] = rnd.commitment
+        updated_state['fair_round_offset'] = rnd.offset
 
-        # Deal initial hands
-        player_hand = deck.deal(2)
-        dealer_hand = deck.deal(2)
-
-        updated_state['player_hand'] = player_hand
-        updated_state['dealer_hand'] = dealer_hand
+        updated_state['player_hand'] = rnd.player_hand
+        updated_state['dealer_hand'] = rnd.dealer_hand
         updated_state['dealer_shows_one_card'] = True # Flag to hide dealer's first card
-        updated_state['deck'] = deck # Store the deck
-
-        if sounds.get("deal"):
-            sounds["deal"].play()
+        updated_state['deck'] = rnd.shoe # Hits and the dealer's draws come from the shoe too
+        updated_state['blackjack_shoe'] = rnd.shoe # Kept across rounds
 
-        # Check for initial Blackjacks
-        player_has_blackjack = is_blackjack(player_hand)
-        dealer_has_blackjack = is_blackjack(dealer_hand)
+        # Deal sound, plus the result's sound and animations if a Blackjack settled the round
+        updated_state.update(apply_engine_events(events, sounds, settled=rnd.finished))
 
-        # Determine immediate outcome if Blackjack occurs
-        if player_has_blackjack or dealer_has_blackjack:
+        if rnd.finished:
+            # A Blackjack occurred: the round ended immediately
             updated_state['dealer_shows_one_card'] = False # Reveal dealer card if game ends now
-            result_message, payout_multiplier = determine_winner(player_hand, dealer_hand)
-
-            winnings = int(payout_multiplier * bet_amount) # Calculate winnings/loss
-            if winnings > 0:
-                game_state_manager.add_winnings(winnings + bet_amount) # Add winnings + original bet back
-                updated_state['result_message'] = f"{result_message} +${winnings + bet_amount}"
-                if sounds.get("win"): sounds["win"].play()
-                # Trigger animations
-                updated_state['money_animation_active'] = True
-                updated_state['money_animation_amount'] = winnings + bet_amount
-                updated_state['money_animation_timer'] = animations.MONEY_ANIMATION_DURATION
-                updated_state['result_message_flash_active'] = True
-                updated_state['result_message_flash_timer'] = animations.RESULT_FLASH_DURATION
-                updated_state['result_message_flash_visible'] = True
-            elif payout_multiplier == PUSH_PAYOUT:
-                game_state_manager.add_winnings(bet_amount) # Return original bet
-                updated_state['result_message'] = f"{result_message} Bet Returned"
-                # No win/lose sound for push
+            if rnd.returned > bet_amount:
+                updated_state['result_message'] = f"{rnd.result} +${rnd.returned}"
+            elif rnd.returned == bet_amount: # Push
+                updated_state['result_message'] = f"{rnd.result} Bet Returned"
             else: # Loss
-                updated_state['result_message'] = f"{result_message} -${bet_amount}"
-                if sounds.get("lose"): sounds["lose"].play()
-                # Ensure animations are off
-                updated_state['money_animation_active'] = False
-                updated_state['result_message_flash_active'] = False
-
+                updated_state['result_message'] = f"{rnd.result} -${bet_amount}"
 
             updated_state['message'] = "Click DEAL for next hand"
             updated_state['current_state'] = states.STATE_BLACKJACK_SHOWING_RESULT
+            updated_state.update(record_shoe_round(rng_cfg.STREAM_BLACKJACK, rnd.shoe, rnd.commitment, rnd.offset))
 
         else:
             # No immediate Blackjack resolution, proceed to player's turn
@@ -81,6 +63,7 @@ def start_blackjack_round(game_state_manager: GameState, sounds: Dict[str, Any])
         updated_state['current_state'] = states.STATE_GAME_OVER
         updated_state['deck'] = Deck() # Still provide a deck object
         # Ensure Blackjack specific state is cleared
+        updated_state['blackjack_round'] = None
         updated_state['player_hand'] = []
         updated_state['dealer_hand'] = []
         updated_state['dealer_shows_one_card'] = False
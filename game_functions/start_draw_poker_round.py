@@ -2,25 +2,26 @@ from typing import Dict, Any
 
 import config_states as states
 from deck import Deck
+from engine import poker as poker_engine
 from game_state import GameState
+from poker_variants import DEFAULT_VARIANT
+from .apply_engine_events import apply_engine_events
 from .reset_game_variables import reset_game_variables
 
 
-def start_draw_poker_round(game_state_manager: GameState, sounds: Dict[str, Any]) -> Dict[str, Any]:
+def start_draw_poker_round(game_state_manager: GameState, sounds: Dict[str, Any], variant_key: str = DEFAULT_VARIANT) -> Dict[str, Any]:
     """
-    Starts a new round of standard Draw Poker.
+    Starts a new round of Draw Poker with the given poker variant's deck.
     Returns a dictionary of the updated game state variables.
     """
-    game_state_manager.set_cost_per_game(1) # Ensure cost is 1
-    if game_state_manager.start_fixed_cost_game(): 
+    rnd, events = poker_engine.new_round(game_state_manager, variant_key) # Costs 1, dealt from a pre-shuffled deck
+    if rnd is not None:
         updated_state = reset_game_variables() # Get reset variables
-        deck = Deck() # Get a fresh shuffled deck
-        updated_state['hand'] = deck.deal(5)
-        updated_state['deck'] = deck # Store the deck in the state
+        updated_state['hand'] = rnd.hand
+        updated_state['deck'] = rnd.deck # Store the deck in the state
         updated_state['message'] = "Click HOLD buttons, then click DRAW"
         updated_state['current_state'] = states.STATE_DRAW_POKER_WAITING_FOR_HOLD
-        if sounds.get("deal"): # Check if sound object exists
-            sounds["deal"].play() # Play deal sound
+        updated_state.update(apply_engine_events(events, sounds)) # Deal sound
         return updated_state
     else:
         # Game Over state
@@ -3,25 +3,26 @@ from typing import Dict, Any
 import config_layout_cards as layout_cards
 import config_states as states
 from deck import Deck
+from engine import poker as poker_engine
 from game_state import GameState
+from poker_variants import DEFAULT_VARIANT
+from .apply_engine_events import apply_engine_events
 from .reset_game_variables import reset_game_variables
 
-def start_multi_poker_round(game_state_manager: GameState, sounds: Dict[str, Any]) -> Dict[str, Any]:
+def start_multi_poker_round(game_state_manager: GameState, sounds: Dict[str, Any], variant_key: str = DEFAULT_VARIANT) -> Dict[str, Any]:
     """
-    Starts a new round of Multi Poker.
+    Starts a new round of Multi Poker with the given poker variant's deck.
     Returns a dictionary of the updated game state variables.
     """
     cost = layout_cards.NUM_MULTI_HANDS
-    game_state_manager.set_cost_per_game(cost) # Set cost for N hands
-    if game_state_manager.start_fixed_cost_game(): 
+    rnd, events = poker_engine.new_round(game_state_manager, variant_key, cost) # One unit per hand
+    if rnd is not None:
         updated_state = reset_game_variables()
-        deck = Deck() # Fresh deck for the initial deal
-        updated_state['hand'] = deck.deal(5) # Deal the base hand
-        updated_state['deck'] = deck # Store the deck
+        updated_state['hand'] = rnd.hand # The base hand
+        updated_state['deck'] = rnd.deck # Store the deck
         updated_state['message'] = f"Click HOLD buttons (Cost: {cost}), then click DRAW"
         updated_state['current_state'] = states.STATE_MULTI_POKER_WAITING_FOR_HOLD
-        if sounds.get("deal"):
-            sounds["deal"].play()
+        updated_state.update(apply_engine_events(events, sounds)) # Deal sound
         return updated_state
     else:
         # Game Over state
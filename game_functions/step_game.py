@@ -0,0 +1,32 @@
+# /game_functions/step_game.py
+import pygame
+from typing import Dict, Any, List, Optional, Tuple
+
+from game_state import GameState, STARTING_MONEY
+from .process_input import process_input
+from .update_game import update_game
+
+def step_game(actions: List[Tuple[str, Optional[Any]]], current_game_state: Dict[str, Any], game_state_manager: GameState,
+              sounds: Dict[str, Any], screen: Optional[pygame.Surface] = None,
+              fonts: Optional[Dict[str, pygame.font.Font]] = None) -> Tuple[Dict[str, Any], GameState]:
+    """
+    Runs the game logic of one frame: the input actions (process_input), then
+    timers and game-over checks (update_game). Nothing else changes the state,
+    so the same actions on the same frames replay a session exactly.
+    Returns the updated game state and the (possibly replaced) GameState.
+    """
+    # 1. Process Input Actions -> Update State
+    game_state = process_input(actions, current_game_state, game_state_manager, sounds, screen, fonts)
+
+    # Handle specific state changes triggered by input processing
+    if game_state.get('needs_money_reset', False):
+        game_state_manager = GameState(starting_money=STARTING_MONEY)
+        game_state['needs_money_reset'] = False
+
+    # Quitting: no further updates
+    if not game_state['running']:
+        return game_state, game_state_manager
+
+    # 2. Update Game Logic (Timers, Game Over Checks) -> Update State
+    game_state = update_game(game_state, game_state_manager, sounds)
+    return game_state, game_state_manager
@@ -0,0 +1,70 @@
+# /game_functions/update_fair_commitment.py
+from typing import Dict, Any, Optional, Tuple
+
+import config_rng as rng_cfg
+import config_states as states
+from blackjack_rules import SHOE_NUM_DECKS as BLACKJACK_SHOE_DECKS
+from baccarat_rules import SHOE_NUM_DECKS as BACCARAT_SHOE_DECKS
+from fairness import Commitment, get_outcome_queue, get_session_log
+from poker_variants import DEFAULT_VARIANT, get_variant
+from roulette_rules import spin_wheel
+from shuffle_queue import get_shuffle_queue
+from slots_rules import spin_reels
+
+# States between rounds show the commitment of the next round; states inside a round show the current one
+_POKER_BETWEEN = {states.STATE_DRAW_POKER_IDLE, states.STATE_DRAW_POKER_SHOWING_RESULT,
+                  states.STATE_MULTI_POKER_IDLE, states.STATE_MULTI_POKER_SHOWING_RESULT}
+_POKER_IN_ROUND = {states.STATE_DRAW_POKER_WAITING_FOR_HOLD, states.STATE_DRAW_POKER_DRAWING,
+                   states.STATE_MULTI_POKER_WAITING_FOR_HOLD, states.STATE_MULTI_POKER_DRAWING}
+_BLACKJACK_BETWEEN = {states.STATE_BLACKJACK_IDLE, states.STATE_BLACKJACK_SHOWING_RESULT}
+_BLACKJACK_IN_ROUND = {states.STATE_BLACKJACK_PLAYER_TURN, states.STATE_BLACKJACK_DEALER_TURN}
+_BACCARAT_BETWEEN = {states.STATE_BACCARAT_BETTING, states.STATE_BACCARAT_RESULT}
+_BACCARAT_IN_ROUND = {states.STATE_BACCARAT_DEALING, states.STATE_BACCARAT_DRAWING}
+
+def _shoe_commitment(stream_name: str, num_decks: int, shoe: Any, between_rounds: bool) -> Optional[Commitment]:
+    # The next round plays on a fresh shoe if there is none yet or its cut card is out
+    if between_rounds and (shoe is None or shoe.cut_card_reached()):
+        return get_shuffle_queue(stream_name, num_decks).peek_commitment()
+    return getattr(shoe, 'commitment', None)
+
+def _current_commitment(game_state: Dict[str, Any]) -> Tuple[Optional[str], Optional[Commitment]]:
+    """Returns (game, commitment) binding the round in play or, between rounds, the next one."""
+    current_state = game_state['current_state']
+    if current_state in _POKER_BETWEEN:
+        num_jokers = get_variant(game_state.get('poker_variant', DEFAULT_VARIANT)).num_jokers
+        return rng_cfg.STREAM_POKER, get_shuffle_queue(rng_cfg.STREAM_POKER, 1, num_jokers).peek_commitment()
+    if current_state in _POKER_IN_ROUND:
+        deck = game_state.get('deck')
+        return rng_cfg.STREAM_POKER, getattr(deck, 'commitment', None)
+    if current_state in _BLACKJACK_BETWEEN or current_state in _BLACKJACK_IN_ROUND:
+        return rng_cfg.STREAM_BLACKJACK, _shoe_commitment(rng_cfg.STREAM_BLACKJACK, BLACKJACK_SHOE_DECKS,
+                                                          game_state.get('blackjack_shoe'), current_state in _BLACKJACK_BETWEEN)
+    if current_state in _BACCARAT_BETWEEN or current_state in _BACCARAT_IN_ROUND:
+        return rng_cfg.STREAM_BACCARAT, _shoe_commitment(rng_cfg.STREAM_BACCARAT, BACCARAT_SHOE_DECKS,
+                                                         game_state.get('baccarat_shoe'), current_state in _BACCARAT_BETWEEN)
+    if current_state == states.STATE_ROULETTE_SPINNING:
+        return rng_cfg.STREAM_ROULETTE, game_state.get('fair_round_commitment')
+    if current_state in (states.STATE_ROULETTE_BETTING, states.STATE_ROULETTE_RESULT):
+        return rng_cfg.STREAM_ROULETTE, get_outcome_queue(rng_cfg.STREAM_ROULETTE, spin_wheel).peek()
+    if current_state == states.STATE_SLOTS_SPINNING:
+        return rng_cfg.STREAM_SLOTS, game_state.get('fair_round_commitment')
+    if current_state in (states.STATE_SLOTS_IDLE, states.STATE_SLOTS_SHOWING_RESULT):
+        return rng_cfg.STREAM_SLOTS, get_outcome_queue(rng_cfg.STREAM_SLOTS, spin_reels).peek()
+    return None, None
+
+def update_fair_commitment(current_game_state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Keeps 'fair_commitment' on the commitment the player should see now (the
+    round in play, or the next round before its bet) and logs each commitment
+    when it is first shown, so the session log proves it came before the round.
+    Returns a dictionary of the updated game state variables.
+    """
+    updated_state = {}
+    if current_game_state['current_state'] == states.STATE_CONFIRM_EXIT:
+        return updated_state # Overlay: keep showing the game's commitment
+    game, commitment = _current_commitment(current_game_state)
+    if commitment is not current_game_state.get('fair_commitment'):
+        if commitment is not None:
+            get_session_log().commit(game, commitment)
+        updated_state['fair_commitment'] = commitment
+    return updated_state
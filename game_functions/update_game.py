@@ -9,6 +9,7 @@ from .determine_roulette_result import determine_roulette_result
 from .resolve_slots_round import resolve_slots_round
 from .resolve_baccarat_round import resolve_baccarat_round
 from .process_baccarat_drawing import process_baccarat_drawing
+from .update_fair_commitment import update_fair_commitment
 from game_state import GameState
 
 def update_game(current_game_state: Dict[str, Any], game_state_manager: GameState, sounds: Dict[str, Any]) -> Dict[str, Any]:
@@ -130,4 +131,7 @@ def update_game(current_game_state: Dict[str, Any], game_state_manager: GameStat
                  new_state['message'] = f"GAME OVER! Need ${cost_next_game} for next round."
                  new_state['current_state'] = states.STATE_GAME_OVER
 
+    # Show (and log) the provably-fair commitment of the current or next round
+    new_state.update(update_fair_commitment(new_state))
+
     return new_state
@@ -1,3 +1,5 @@
+STARTING_MONEY = 10 # Money a new session (or a restart after going broke) starts with
+
 class GameState:
     """Manages the player's money and current game status."""
 
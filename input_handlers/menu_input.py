@@ -48,6 +48,8 @@ def handle_menu_event(event: pygame.event.Event, current_state: str) -> List[Tup
                 actions.append((actions_cfg.ACTION_VOLUME_DOWN, None))
             elif layout_general.VOLUME_UP_BUTTON_RECT.collidepoint(mouse_pos):
                 actions.append((actions_cfg.ACTION_VOLUME_UP, None))
+            elif layout_general.POKER_VARIANT_TOGGLE_RECT.collidepoint(mouse_pos):
+                actions.append((actions_cfg.ACTION_CYCLE_POKER_VARIANT, None))
             elif layout_general.SETTINGS_BACK_BUTTON_RECT.collidepoint(mouse_pos):
                 actions.append((actions_cfg.ACTION_RETURN_TO_TOP_MENU, None))
 
@@ -2,49 +2,41 @@
 import pygame
 import sys
 from typing import Dict, Any
-import os
 
 # Local Imports
 # --- Config Imports ---
 import config_display as display
-import config_fonts as fonts_cfg
-import config_colors as colors
-import config_states as states
-import config_assets as assets
 import config_animations as anim
+import config_rng as rng_cfg
 from card import Card
-from deck import Deck
-from game_state import GameState
+from fairness import get_session_log
+from game_state import GameState, STARTING_MONEY
 from input_handler import InputHandler
 from poker_rules import HandRank
+from poker_lookup import load_hand_table
+from poker_strategy import load_strategy_db
+from rng import get_rng_service
+from session_recording import start_recording
+from shuffle_queue import get_shuffle_queue, stop_shuffle_queues
 from blackjack_rules import get_hand_value, is_blackjack, determine_winner, BLACKJACK_PAYOUT, WIN_PAYOUT, LOSS_PAYOUT, PUSH_PAYOUT
+from blackjack_rules import SHOE_NUM_DECKS as BLACKJACK_SHOE_DECKS
 from baccarat_rules import (
     get_baccarat_hand_value, is_natural, determine_baccarat_winner, calculate_baccarat_payout,
     BET_PLAYER, BET_BANKER, BET_TIE
 )
+from baccarat_rules import SHOE_NUM_DECKS as BACCARAT_SHOE_DECKS
 
 # --- Import Extracted Functions ---
 # Renderer Functions
-from renderer_functions.get_font import get_font
-from renderer_functions.load_card_images import load_card_images
-from renderer_functions.draw_top_menu import draw_top_menu
-from renderer_functions.draw_game_selection_menu import draw_game_selection_menu
-from renderer_functions.draw_game_screen import draw_game_screen
-from renderer_functions.draw_settings_menu import draw_settings_menu
-from renderer_functions.draw_confirm_exit import draw_confirm_exit
-from renderer_functions.draw_blackjack_screen import draw_blackjack_screen
-from renderer_functions.draw_roulette_screen import draw_roulette_screen
-from renderer_functions.draw_spinning_wheel import draw_spinning_wheel
-from renderer_functions.draw_slots_screen import draw_slots_screen
-from renderer_functions.draw_baccarat_screen import draw_baccarat_screen
-from renderer_functions.draw_text import draw_text
+from renderer_functions.load_render_assets import load_render_assets
+from renderer_functions.draw_frame import draw_frame
 
 # Game Logic Functions
 from game_functions.load_sounds import load_sounds
 from game_functions.dummy_sound import DummySound
-from game_functions.process_input import process_input
-from game_functions.update_game import update_game
 from game_functions.reset_game_variables import reset_game_variables
+from game_functions.new_game_state import new_game_state
+from game_functions.step_game import step_game
 from game_functions.start_blackjack_round import start_blackjack_round
 from game_functions.process_blackjack_action import process_blackjack_action
 from game_functions.resolve_blackjack_round import resolve_blackjack_round
@@ -84,55 +76,24 @@ def main():
     clock = pygame.time.Clock()
 
     # --- Load Assets ---
-    fonts = {
-        'money': get_font(fonts_cfg.MONEY_FONT_SIZE),
-        'message': get_font(fonts_cfg.MESSAGE_FONT_SIZE),
-        'pay_table': get_font(fonts_cfg.PAY_TABLE_FONT_SIZE),
-        'button': get_font(fonts_cfg.BUTTON_FONT_SIZE),
-        'result': get_font(fonts_cfg.RESULT_FONT_SIZE),
-        'multi_result': get_font(fonts_cfg.MULTI_RESULT_FONT_SIZE),
-        'hold': get_font(fonts_cfg.HOLD_FONT_SIZE),
-        'game_over_large': get_font(64),
-        'game_over_medium': get_font(32),
-    }
-    card_images = load_card_images(assets.CARD_ASSET_PATH)
-    # Load Slot Images
-    from renderer_functions.load_slot_images import load_slot_images
-    from config_layout_slots import SLOT_SYMBOL_WIDTH, SLOT_SYMBOL_HEIGHT
-    slot_images = load_slot_images(assets.SLOTS_ASSET_PATH,
-                                   (SLOT_SYMBOL_WIDTH, SLOT_SYMBOL_HEIGHT))
-    # --- Load Slot Machine Overlay Image ---
-    slot_machine_overlay_image = None
-    overlay_path = os.path.join(assets.SLOTS_ASSET_PATH, "slotmachine_lion.png")
-    try:
-        if os.path.exists(overlay_path):
-            slot_machine_overlay_image = pygame.image.load(overlay_path).convert_alpha() # Use convert_alpha() for transparency
-            # --- MODIFICATION START ---
-            # Resize the image
-            target_size = (1040, 750)
-            slot_machine_overlay_image = pygame.transform.smoothscale(slot_machine_overlay_image, target_size)
-            # --- MODIFICATION END ---
-            print(f"Loaded and resized slot machine overlay image from: {overlay_path}")
-        else:
-            print(f"Warning: Slot machine overlay image not found at {overlay_path}.")
-    except pygame.error as e:
-        print(f"Warning: Failed to load slot machine overlay image: {e}")
-
-    # --- Load Backdrop Image ---
-    backdrop_image = None
-    backdrop_path = os.path.join("assets", "menu", "backdrop.png")
-    try:
-        if os.path.exists(backdrop_path):
-            backdrop_image = pygame.image.load(backdrop_path).convert()
-            # Scale if necessary to fit the screen
-            if backdrop_image.get_size() != (display.SCREEN_WIDTH, display.SCREEN_HEIGHT):
-                backdrop_image = pygame.transform.scale(backdrop_image, (display.SCREEN_WIDTH, display.SCREEN_HEIGHT))
-            print(f"Loaded backdrop image from: {backdrop_path}")
-        else:
-            print(f"Warning: Backdrop image not found at {backdrop_path}. Menus will use default background.")
-    except pygame.error as e:
-        print(f"Warning: Failed to load backdrop image: {e}")
-
+    render_assets = load_render_assets()
+    fonts = render_assets['fonts']
+
+    # --- Load Poker Hand Table (generated and cached on first run, then memory-mapped) ---
+    load_hand_table()
+    # Optimal-hold database is built offline (python poker_strategy.py build); mapped here if present
+    load_strategy_db()
+    # Report the RNG master seed so a session can be reproduced (set VIDEOPOKER_SEED to replay it)
+    if get_rng_service().secure:
+        print("RNG: secure mode (os.urandom entropy pool); rounds are not replayable")
+    else:
+        print(f"RNG seed: {get_rng_service().seed}")
+    # Start the background shuffle workers now so the first rounds find decks ready
+    get_shuffle_queue(rng_cfg.STREAM_POKER)
+    get_shuffle_queue(rng_cfg.STREAM_BLACKJACK, BLACKJACK_SHOE_DECKS)
+    get_shuffle_queue(rng_cfg.STREAM_BACCARAT, BACCARAT_SHOE_DECKS)
+    if get_session_log().path:
+        print(f"Provably-fair session log: {get_session_log().path} (check it with: python fairness.py)")
 
     # --- Initialize Game State Variables ---
     sounds = load_sounds(initial_sound_enabled)
@@ -140,77 +101,27 @@ def main():
 
     # --- Initialize Game Components ---
     input_handler = InputHandler()
-    game_state_manager = GameState(starting_money=10)
+    game_state_manager = GameState(starting_money=STARTING_MONEY)
 
     # --- Initialize Game State Variables ---
-    game_state: Dict[str, Any] = {
-        'current_state': states.STATE_TOP_MENU,
-        'hand': [],
-        'multi_hands': [],
-        'multi_results': [],
-        'held_indices': [],
-        'message': "",
-        'result_message': "",
-        'final_hand_rank': None,
-        'total_winnings': 0,
-        'money_animation_active': False,
-        'money_animation_timer': 0,
-        'money_animation_amount': 0,
-        'result_message_flash_active': False,
-        'result_message_flash_timer': 0,
-        'result_message_flash_visible': True,
-        'player_hand': [],
-        'dealer_hand': [],
-        'dealer_shows_one_card': False,
-        'deck': Deck(),
-        'running': True,
-        'sound_enabled': initial_sound_enabled,
-        'needs_money_reset': False,
-        'confirm_exit_destination': None,
-        'sound_setting_changed': False,
-        'volume_level': initial_volume,
-        'volume_changed': False,
-        'previous_state_before_confirm': None,
-        'confirm_action_type': None,
-        # --- Add Roulette Specific State ---
-        'roulette_bets': {},
-        'roulette_winning_number': None,
-        'roulette_spin_timer': 0,
-        'roulette_pause_timer': 0,
-        'winning_slot_flash_active': False,
-        'winning_slot_flash_count': 0,
-        'winning_slot_flash_visible': True,
-        # --- Add Slots Specific State ---
-        'slots_final_symbols': ["?", "?", "?"],
-        'slots_reel_positions': [0, 0, 0],
-        'slots_spin_timer': 0,
-        'slots_result_pause_timer': 0,
-        # --- Add Baccarat Specific State ---
-        'baccarat_bets': {},
-        'baccarat_bet_type': None,
-        'baccarat_total_bet': 0,
-        'baccarat_player_hand': [],
-        'baccarat_banker_hand': [],
-        'baccarat_player_value': None,
-        'baccarat_banker_value': None,
-        'baccarat_winner': None,
-    }
+    game_state = new_game_state(initial_sound_enabled, initial_volume)
 
     # Apply initial volume
     apply_volume(game_state['volume_level'], sounds)
 
+    # Record the session (seed + actions per frame) so it can be replayed: python session_recording.py
+    recorder = start_recording(get_rng_service().seed, get_rng_service().secure, initial_sound_enabled, initial_volume)
+    if recorder.path:
+        print(f"Session recording: {recorder.path}")
+
     # --- Main Game Loop ---
     while game_state['running']:
         # 1. Handle Input
         actions = input_handler.handle_events(game_state['current_state'])
 
-        # 2. Process Input Actions -> Update State
-        game_state = process_input(actions, game_state, game_state_manager, sounds, screen, fonts)
-
-        # Handle specific state changes triggered by input processing
-        if game_state.get('needs_money_reset', False):
-            game_state_manager = GameState(starting_money=10)
-            game_state['needs_money_reset'] = False
+        # 2. Game Logic: Input Actions, then Timers and Game Over Checks -> Update State
+        game_state, game_state_manager = step_game(actions, game_state, game_state_manager, sounds, screen, fonts)
+        recorder.record(actions, game_state, game_state_manager)
 
         # Check if quit action was processed
         if not game_state['running']:
@@ -227,65 +138,26 @@ def main():
             apply_volume(game_state['volume_level'], sounds)
             game_state['volume_changed'] = False
 
-        # 3. Update Game Logic (Timers, Game Over Checks) -> Update State
-        game_state = update_game(game_state, game_state_manager, sounds)
-
-        # 4. Render Output
-        # Default fill, may be overwritten by backdrop
-        screen.fill(colors.DARK_GREEN)
-
-        render_data = {
-            'current_state': game_state['current_state'],
-            'money': game_state_manager.money,
-            'hand': game_state['hand'],
-            'held_indices': game_state['held_indices'],
-            'message': game_state['message'],
-            'result_message': game_state['result_message'],
-            'winning_rank': game_state['final_hand_rank'],
-            'can_play': game_state_manager.can_play(),
-            'multi_hands': game_state['multi_hands'],
-            'multi_results': game_state['multi_results'],
-            'money_animation_active': game_state['money_animation_active'],
-            'money_animation_amount': game_state['money_animation_amount'],
-        }
-
-        if game_state['current_state'] == states.STATE_TOP_MENU:
-            draw_top_menu(screen, fonts, backdrop_image)
-        elif game_state['current_state'] == states.STATE_GAME_SELECTION:
-            draw_game_selection_menu(screen, fonts, game_state_manager.money, backdrop_image) # Pass backdrop
-        elif game_state['current_state'] == states.STATE_SETTINGS:
-            draw_settings_menu(screen, fonts, game_state['sound_enabled'], game_state['volume_level'], backdrop_image) # Pass backdrop
-        elif game_state['current_state'] == states.STATE_CONFIRM_EXIT:
-            # Confirmation dialog overlays, so no backdrop applied here intentionally
-            draw_confirm_exit(screen, fonts, game_state)
-        elif game_state['current_state'] in [states.STATE_BLACKJACK_IDLE, states.STATE_BLACKJACK_PLAYER_TURN,
-                                             states.STATE_BLACKJACK_DEALER_TURN, states.STATE_BLACKJACK_SHOWING_RESULT]:
-            draw_blackjack_screen(screen, fonts, card_images, game_state, game_state_manager)
-        elif game_state['current_state'] in [states.STATE_ROULETTE_BETTING, states.STATE_ROULETTE_SPINNING, states.STATE_ROULETTE_RESULT]:
-            # draw_roulette_screen handles drawing table OR wheel based on state
-            draw_roulette_screen(screen, fonts, game_state, game_state_manager)
-        elif game_state['current_state'] in [states.STATE_SLOTS_IDLE, states.STATE_SLOTS_SPINNING, states.STATE_SLOTS_SHOWING_RESULT]:
-            # Draw the slots screen
-            draw_slots_screen(screen, fonts, slot_images, game_state, game_state_manager, slot_machine_overlay_image) # Pass overlay image
-        elif game_state['current_state'] in [states.STATE_BACCARAT_BETTING, states.STATE_BACCARAT_DEALING,
-                                             states.STATE_BACCARAT_DRAWING, states.STATE_BACCARAT_RESULT]: # Added Baccarat draw call
-            draw_baccarat_screen(screen, fonts, card_images, game_state, game_state_manager)
-        else: # Draw/Multi Poker
-            # Ensure render_data includes necessary items like money animation status
-            render_data['money_animation_active'] = game_state.get('money_animation_active', False)
-            render_data['money_animation_amount'] = game_state.get('money_animation_amount', 0)
-            render_data['result_message_flash_active'] = game_state.get('result_message_flash_active', False)
-            render_data['result_message_flash_visible'] = game_state.get('result_message_flash_visible', True)
-
-            draw_game_screen(screen, fonts, card_images, render_data, game_state)
-
+        # 3. Render Output
+        draw_frame(screen, render_assets, game_state, game_state_manager)
 
         pygame.display.flip()
 
-        # 5. Control Frame Rate
+        # 4. Control Frame Rate
         clock.tick(30)
 
     # --- Clean up ---
+    # Reveal the shoes still in play (and any retired ones) so every logged round can be verified
+    fair_log = get_session_log()
+    for game, shoe_key in [(rng_cfg.STREAM_BLACKJACK, 'blackjack_shoe'), (rng_cfg.STREAM_BACCARAT, 'baccarat_shoe')]:
+        shoe = game_state.get(shoe_key)
+        if shoe is not None:
+            for commitment in shoe.take_retired_commitments() + [shoe.commitment]:
+                if commitment is not None:
+                    fair_log.reveal(game, commitment)
+    fair_log.close()
+    recorder.close(game_state, game_state_manager)
+    stop_shuffle_queues()
     pygame.quit()
     print("Game exited normally.")
     sys.exit()
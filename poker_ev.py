@@ -0,0 +1,234 @@
+# /poker_ev.py
+"""
+Exact expected values for every hold in draw poker.
+
+For a dealt hand there are 32 ways to hold cards (hold masks 0-31, bit i = hold
+hand[i]). For each hold this module counts, exactly, how many of the possible
+draws from the 47-card stub end in each hand category; the expected return of a
+hold is then the payout-weighted average of those counts.
+
+Instead of evaluating up to 1,533,939 completions per hold, draws are grouped by
+rank signature: every multiset of drawn ranks is scored once, weighted by the
+number of ways the stub can supply it (a product of binomials), and flushes are
+counted separately from per-suit rank bitmasks. Outcome counts depend only on
+the suit pattern of the held and discarded cards, so they are cached per
+suit-canonical subset signature.
+"""
+from collections import OrderedDict
+from itertools import combinations_with_replacement
+from math import comb
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from card import Card, RANKS, RANK_PRIMES, SUITS, SUIT_MASK, PRIME_MASK
+from poker_lookup import FLUSH_CLASSES, UNIQUE_CLASSES, PAIRED_CLASSES, RANK_BITS_MASK
+from poker_rules import HandRank, PAY_TABLE, CLASS_HAND_RANKS
+
+NUM_HOLDS = 32
+STUB_SIZE = 47 # Cards left after the 5-card deal
+
+# Jacks or Better categories: category i is JACKS_OR_BETTER_CATEGORIES[i]
+JACKS_OR_BETTER_CATEGORIES: List[HandRank] = list(HandRank)
+
+def hold_indices(hold_mask: int) -> List[int]:
+    """Converts a hold mask (bit i = hold card i) to a sorted list of held indices."""
+    return [i for i in range(5) if hold_mask & (1 << i)]
+
+def hold_mask(held_indices: Sequence[int]) -> int:
+    """Converts a list of held indices to a hold mask."""
+    mask = 0
+    for i in held_indices:
+        mask |= 1 << i
+    return mask
+
+
+def _build_draw_signatures() -> List[List[Tuple[Tuple[Tuple[int, int], ...], int, int]]]:
+    """
+    For each draw size n (0-5), lists every multiset of drawn ranks as
+    ((rank_index, multiplicity), ...), prime product and rank bits (0 when a
+    rank repeats).
+    """
+    signatures = []
+    for num_drawn in range(6):
+        entries = []
+        for rank_indices in combinations_with_replacement(range(len(RANKS)), num_drawn):
+            multiplicities: Dict[int, int] = {}
+            prime_product = 1
+            for i in rank_indices:
+                multiplicities[i] = multiplicities.get(i, 0) + 1
+                prime_product *= RANK_PRIMES[i]
+            if any(m > 4 for m in multiplicities.values()):
+                continue
+            distinct = len(multiplicities) == num_drawn
+            rank_bits = sum(1 << i for i in multiplicities) if distinct else 0
+            entries.append((tuple(multiplicities.items()), prime_product, rank_bits))
+        signatures.append(entries)
+    return signatures
+
+_DRAW_SIGNATURES = _build_draw_signatures()
+
+
+class HoldAnalyzer:
+    """
+    Counts draw outcomes per hand category for every hold of a dealt hand.
+    class_categories maps each hand class (see poker_lookup) to a category index.
+    """
+
+    def __init__(self, class_categories: Sequence[int], num_categories: int, cache_size: int = 1 << 16):
+        self.num_categories = num_categories
+        # Category lookups keyed like the poker_lookup class tables
+        self._flush_categories = {bits: class_categories[c] for bits, c in FLUSH_CLASSES.items()}
+        self._unique_categories = {bits: class_categories[c] for bits, c in UNIQUE_CLASSES.items()}
+        self._paired_categories = {product: class_categories[c] for product, c in PAIRED_CLASSES.items()}
+        self._cache: "OrderedDict[Tuple, Tuple[int, ...]]" = OrderedDict()
+        self._cache_size = cache_size
+
+    def _count_hold(self, held: Sequence[int], dealt: Sequence[int]) -> Tuple[int, ...]:
+        """Outcome counts per category for holding the encoded cards `held` out of `dealt`."""
+        num_drawn = 5 - len(held)
+        counts = [0] * self.num_categories
+
+        # Stub composition: cards left per rank, and per suit a bitmask of ranks left
+        avail = [4] * len(RANKS)
+        suit_stub_bits = [RANK_BITS_MASK] * len(SUITS)
+        for code in dealt:
+            rank_index = (code >> 8) & 0xF
+            avail[rank_index] -= 1
+            suit_index = ((code >> 12) & 0xF).bit_length() - 1
+            suit_stub_bits[suit_index] &= ~(1 << rank_index)
+
+        held_product = 1
+        held_bits = 0
+        held_suits = SUIT_MASK
+        for code in held:
+            held_product *= code & PRIME_MASK
+            held_bits |= (code >> 16) & RANK_BITS_MASK
+            held_suits &= code
+        held_distinct = bin(held_bits).count("1") == len(held)
+        if not held:
+            flush_suits = suit_stub_bits # Any suit can make a flush
+        elif held_suits:
+            flush_suits = [suit_stub_bits[((held_suits >> 12) & 0xF).bit_length() - 1]]
+        else:
+            flush_suits = [] # Held cards of mixed suits can never make a flush
+
+        unique_categories = self._unique_categories
+        flush_categories = self._flush_categories
+        paired_categories = self._paired_categories
+        for multiplicities, prime_product, rank_bits in _DRAW_SIGNATURES[num_drawn]:
+            ways = 1
+            for rank_index, multiplicity in multiplicities:
+                left = avail[rank_index]
+                if left < multiplicity:
+                    ways = 0
+                    break
+                ways *= comb(left, multiplicity)
+            if not ways:
+                continue
+
+            if held_distinct and (rank_bits or not num_drawn) and not rank_bits & held_bits:
+                final_bits = rank_bits | held_bits
+                # Draws where every drawn card is of the flush suit
+                flush_ways = 0
+                for stub_bits in flush_suits:
+                    if not rank_bits & ~stub_bits:
+                        flush_ways += 1
+                if flush_ways:
+                    counts[flush_categories[final_bits]] += flush_ways
+                    ways -= flush_ways
+                counts[unique_categories[final_bits]] += ways
+            else:
+                counts[paired_categories[held_product * prime_product]] += ways
+        return tuple(counts)
+
+    def _signature(self, held: Sequence[int], dealt: Sequence[int]) -> Tuple:
+        """
+        Suit-canonical cache key: per suit, the ranks held and the ranks dealt,
+        sorted so that hands differing only by a suit permutation share a key.
+        """
+        per_suit = [[0, 0] for _ in SUITS]
+        for code in dealt:
+            per_suit[((code >> 12) & 0xF).bit_length() - 1][1] |= 1 << ((code >> 8) & 0xF)
+        for code in held:
+            per_suit[((code >> 12) & 0xF).bit_length() - 1][0] |= 1 << ((code >> 8) & 0xF)
+        return tuple(sorted(map(tuple, per_suit)))
+
+    def hold_counts(self, held: Sequence[int], dealt: Sequence[int]) -> Tuple[int, ...]:
+        """Cached outcome counts for one hold (encoded cards) of a dealt hand."""
+        key = self._signature(held, dealt)
+        counts = self._cache.get(key)
+        if counts is None:
+            counts = self._count_hold(held, dealt)
+            self._cache[key] = counts
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return counts
+
+    def outcome_counts(self, hand: Sequence[Card]) -> List[Tuple[int, ...]]:
+        """Returns the outcome counts per category for all 32 holds, indexed by hold mask."""
+        if len(hand) != 5:
+            raise ValueError("Hand must contain exactly 5 cards.")
+        dealt = [card.code for card in hand]
+        return [
+            self.hold_counts([dealt[i] for i in range(5) if mask & (1 << i)], dealt)
+            for mask in range(NUM_HOLDS)
+        ]
+
+
+def _jacks_or_better_analyzer() -> HoldAnalyzer:
+    category_of_rank = {rank: i for i, rank in enumerate(JACKS_OR_BETTER_CATEGORIES)}
+    return HoldAnalyzer([category_of_rank[rank] for rank in CLASS_HAND_RANKS], len(JACKS_OR_BETTER_CATEGORIES))
+
+_default_analyzer: Optional[HoldAnalyzer] = None
+
+def get_default_analyzer() -> HoldAnalyzer:
+    """Returns the shared Jacks or Better analyzer (created on first use)."""
+    global _default_analyzer
+    if _default_analyzer is None:
+        _default_analyzer = _jacks_or_better_analyzer()
+    return _default_analyzer
+
+def hold_outcome_counts(hand: Sequence[Card]) -> List[Tuple[int, ...]]:
+    """
+    Returns, for each of the 32 hold masks, the number of draws ending in each
+    HandRank (in JACKS_OR_BETTER_CATEGORIES order). These counts do not depend
+    on the pay table.
+    """
+    return get_default_analyzer().outcome_counts(hand)
+
+def hold_expected_values(hand: Sequence[Card], pay_table: Optional[Dict[HandRank, Tuple[str, int]]] = None) -> List[float]:
+    """
+    Returns the exact expected return (per unit bet) of each of the 32 holds,
+    indexed by hold mask, scored against pay_table (defaults to PAY_TABLE).
+    """
+    pay_table = pay_table or PAY_TABLE
+    payouts = [pay_table[rank][1] for rank in JACKS_OR_BETTER_CATEGORIES]
+    expected_values = []
+    for mask, counts in enumerate(hold_outcome_counts(hand)):
+        total = comb(STUB_SIZE, 5 - bin(mask).count("1"))
+        expected_values.append(sum(count * payout for count, payout in zip(counts, payouts)) / total)
+    return expected_values
+
+def best_hold(hand: Sequence[Card], pay_table: Optional[Dict[HandRank, Tuple[str, int]]] = None) -> Tuple[List[int], float]:
+    """Returns the held indices and expected return of the best hold for a dealt hand."""
+    expected_values = hold_expected_values(hand, pay_table)
+    best_mask = max(range(NUM_HOLDS), key=lambda mask: expected_values[mask])
+    return hold_indices(best_mask), expected_values[best_mask]
+
+
+if __name__ == '__main__':
+    import time
+
+    hands = {
+        "Dealt royal": [Card('T', '♠'), Card('J', '♠'), Card('Q', '♠'), Card('K', '♠'), Card('A', '♠')],
+        "4 to a royal + pair": [Card('T', '♥'), Card('J', '♥'), Card('Q', '♥'), Card('K', '♥'), Card('K', '♣')],
+        "Low pair": [Card('6', '♣'), Card('6', '♦'), Card('A', '♥'), Card('Q', '♠'), Card('3', '♣')],
+        "Garbage": [Card('2', '♣'), Card('5', '♦'), Card('9', '♥'), Card('7', '♠'), Card('3', '♣')],
+    }
+    for name, hand in hands.items():
+        start = time.perf_counter()
+        held, expected_value = best_hold(hand)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        held_str = " ".join(f"{hand[i].rank}{hand[i].suit}" for i in held) or "(discard all)"
+        print(f"{name:<20}: hold {held_str:<16} EV {expected_value:.4f} ({elapsed_ms:.1f} ms)")
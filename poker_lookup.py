@@ -0,0 +1,266 @@
+# /poker_lookup.py
+"""
+Precomputed lookup tables for five-card poker hands.
+
+Every five-card hand belongs to one of 7462 hand classes (distinct hand values,
+ignoring suits except for flushes). Class 0 is the strongest hand (royal flush)
+and class 7461 the weakest (7-5-4-3-2 offsuit). Classes do not depend on any pay
+table, so variants and analysis tools can map them to their own categories.
+
+The full hand table stores the class of all 2,598,960 hands, indexed by a
+minimal perfect hash of the hand (the colex rank of its sorted card indices).
+It is generated once, cached on disk and memory-mapped, so looking up a hand is
+a single index.
+"""
+import mmap
+import os
+import time
+from array import array
+from collections import Counter
+from itertools import combinations_with_replacement
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import config_assets as assets
+from card import Card, CARDS, RANKS, RANK_PRIMES, SUIT_MASK, PRIME_MASK
+
+try:
+    import numpy as np
+except ImportError: # NumPy is only needed for batch lookups (hand_classes)
+    np = None
+
+NUM_HAND_CLASSES = 7462
+NUM_FIVE_CARD_HANDS = 2598960
+
+# --- Hand Class Kinds (strongest first) ---
+# The coarse shape of a class; pay tables are built on top of these.
+KIND_STRAIGHT_FLUSH = 0
+KIND_FOUR_OF_A_KIND = 1
+KIND_FULL_HOUSE = 2
+KIND_FLUSH = 3
+KIND_STRAIGHT = 4
+KIND_THREE_OF_A_KIND = 5
+KIND_TWO_PAIR = 6
+KIND_ONE_PAIR = 7
+KIND_HIGH_CARD = 8
+
+RANK_BITS_MASK = (1 << len(RANKS)) - 1
+WHEEL_BITS = 0b1000000001111 # A-2-3-4-5
+ROYAL_BITS = 0b1111100000000 # T-J-Q-K-A
+STRAIGHT_BITS = {0b11111 << low for low in range(len(RANKS) - 4)} | {WHEEL_BITS}
+
+# Cached table file; the version suffix changes whenever the layout does
+HAND_TABLE_FILENAME = "hand_classes_v1.bin"
+
+def _class_sort_key(kind: int, rank_counts: List[Tuple[int, int]], rank_bits: int) -> Tuple:
+    """Orders classes by kind, then by the ranks that break ties within the kind."""
+    if kind in (KIND_STRAIGHT_FLUSH, KIND_STRAIGHT):
+        high = 3 if rank_bits == WHEEL_BITS else rank_bits.bit_length() - 1 # Wheel is 5-high
+        return (kind, -high)
+    # Ranks ordered by count, then by rank (e.g. full house: trips rank, pair rank)
+    return (kind,) + tuple(-rank for rank, _ in rank_counts)
+
+def _build_hand_classes():
+    """
+    Enumerates every rank multiset (plus flush variants) and numbers them by strength.
+    Returns the three class lookup tables and per-class descriptions.
+    """
+    entries = [] # (sort_key, table_name, table_key, kind, rank_counts)
+    for rank_indices in combinations_with_replacement(range(len(RANKS)), 5):
+        counts = Counter(rank_indices)
+        # Ranks sorted by count then rank, highest first: [(rank_index, count), ...]
+        rank_counts = sorted(counts.items(), key=lambda item: (item[1], item[0]), reverse=True)
+        top_count = rank_counts[0][1]
+        if top_count == 5:
+            continue # Impossible with a single deck
+        prime_product = 1
+        for i in rank_indices:
+            prime_product *= RANK_PRIMES[i]
+
+        if len(counts) == 5:
+            rank_bits = sum(1 << i for i in rank_indices)
+            is_straight = rank_bits in STRAIGHT_BITS
+            flush_kind = KIND_STRAIGHT_FLUSH if is_straight else KIND_FLUSH
+            plain_kind = KIND_STRAIGHT if is_straight else KIND_HIGH_CARD
+            entries.append((_class_sort_key(flush_kind, rank_counts, rank_bits), "flush", rank_bits, flush_kind, rank_counts))
+            entries.append((_class_sort_key(plain_kind, rank_counts, rank_bits), "unique", rank_bits, plain_kind, rank_counts))
+            continue
+
+        if top_count == 4:
+            kind = KIND_FOUR_OF_A_KIND
+        elif top_count == 3:
+            kind = KIND_FULL_HOUSE if rank_counts[1][1] == 2 else KIND_THREE_OF_A_KIND
+        elif rank_counts[1][1] == 2:
+            kind = KIND_TWO_PAIR
+        else:
+            kind = KIND_ONE_PAIR
+        entries.append((_class_sort_key(kind, rank_counts, 0), "paired", prime_product, kind, rank_counts))
+
+    entries.sort(key=lambda entry: entry[0])
+
+    tables: Dict[str, Dict[int, int]] = {"flush": {}, "unique": {}, "paired": {}}
+    class_kinds: List[int] = []
+    class_rank_counts: List[Tuple[Tuple[int, int], ...]] = []
+    for hand_class, (_, table_name, table_key, kind, rank_counts) in enumerate(entries):
+        tables[table_name][table_key] = hand_class
+        class_kinds.append(kind)
+        class_rank_counts.append(tuple(rank_counts))
+    return tables["flush"], tables["unique"], tables["paired"], class_kinds, class_rank_counts
+
+# FLUSH_CLASSES / UNIQUE_CLASSES are keyed by rank bits, PAIRED_CLASSES by prime product
+FLUSH_CLASSES, UNIQUE_CLASSES, PAIRED_CLASSES, CLASS_KINDS, CLASS_RANK_COUNTS = _build_hand_classes()
+
+# The royal flush is the best straight flush, i.e. class 0
+ROYAL_FLUSH_CLASS = FLUSH_CLASSES[ROYAL_BITS]
+
+
+def hand_class_from_codes(c1: int, c2: int, c3: int, c4: int, c5: int) -> int:
+    """Returns the hand class of five encoded cards (see card.py)."""
+    rank_bits = ((c1 | c2 | c3 | c4 | c5) >> 16) & RANK_BITS_MASK
+    if c1 & c2 & c3 & c4 & c5 & SUIT_MASK: # All five cards share a suit bit
+        return FLUSH_CLASSES[rank_bits]
+    hand_class = UNIQUE_CLASSES.get(rank_bits)
+    if hand_class is None: # Repeated ranks: identify the rank multiset by its prime product
+        hand_class = PAIRED_CLASSES[(c1 & PRIME_MASK) * (c2 & PRIME_MASK) * (c3 & PRIME_MASK) * (c4 & PRIME_MASK) * (c5 & PRIME_MASK)]
+    return hand_class
+
+
+# --- Perfect Hash ---
+# BINOMIALS[k][n] = C(n, k) for the colex rank of a 5-card combination
+BINOMIALS: List[List[int]] = [[0] * 53 for _ in range(6)]
+for _n in range(53):
+    BINOMIALS[0][_n] = 1
+    for _k in range(1, 6):
+        BINOMIALS[_k][_n] = BINOMIALS[_k - 1][_n - 1] + BINOMIALS[_k][_n - 1] if _n > 0 else 0
+
+_C1, _C2, _C3, _C4, _C5 = BINOMIALS[1], BINOMIALS[2], BINOMIALS[3], BINOMIALS[4], BINOMIALS[5]
+
+def hand_index(hand: Sequence[Card]) -> int:
+    """
+    Returns the perfect-hash index (0 to 2,598,959) of a 5-card hand: the colex
+    rank of its sorted card indices. Card order within the hand does not matter.
+    """
+    a, b, c, d, e = sorted((hand[0].index, hand[1].index, hand[2].index, hand[3].index, hand[4].index))
+    return _C1[a] + _C2[b] + _C3[c] + _C4[d] + _C5[e]
+
+
+# --- Full Hand Table ---
+_hand_table: Optional[memoryview] = None
+
+def _generate_hand_table() -> array:
+    """
+    Computes the class of every 5-card hand in colex order. The nested loops
+    visit combinations in exactly that order, so the table fills sequentially
+    and partial OR/AND/products are shared between hands.
+    """
+    codes = [card.code for card in CARDS]
+    primes = [code & PRIME_MASK for code in codes]
+    flush_classes, unique_classes, paired_classes = FLUSH_CLASSES, UNIQUE_CLASSES, PAIRED_CLASSES
+    table = array('H')
+    append = table.append
+    for e in range(4, 52):
+        ce, pe = codes[e], primes[e]
+        for d in range(3, e):
+            cd = ce | codes[d]
+            ad = ce & codes[d]
+            pd = pe * primes[d]
+            for c in range(2, d):
+                cc = cd | codes[c]
+                ac = ad & codes[c]
+                pc = pd * primes[c]
+                for b in range(1, c):
+                    cb = cc | codes[b]
+                    ab = ac & codes[b]
+                    pb = pc * primes[b]
+                    for a in range(b):
+                        ca = codes[a]
+                        rank_bits = ((cb | ca) >> 16) & RANK_BITS_MASK
+                        if ab & ca & SUIT_MASK:
+                            append(flush_classes[rank_bits])
+                        else:
+                            hand_class = unique_classes.get(rank_bits)
+                            append(paired_classes[pb * primes[a]] if hand_class is None else hand_class)
+    return table
+
+def get_hand_table_path() -> str:
+    """Returns the path of the cached hand table file."""
+    return os.path.join(assets.TABLE_CACHE_PATH, HAND_TABLE_FILENAME)
+
+def load_hand_table() -> memoryview:
+    """
+    Memory-maps the cached hand table, generating and writing it first if it is
+    missing or has the wrong size. Safe to call more than once.
+    """
+    global _hand_table
+    if _hand_table is not None:
+        return _hand_table
+
+    path = get_hand_table_path()
+    expected_size = NUM_FIVE_CARD_HANDS * array('H').itemsize
+    if not os.path.isfile(path) or os.path.getsize(path) != expected_size:
+        print(f"Generating poker hand table ({NUM_FIVE_CARD_HANDS} hands)...")
+        start = time.perf_counter()
+        table = _generate_hand_table()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            table.tofile(f)
+        os.replace(tmp_path, path) # Atomic, so a half-written table is never loaded
+        print(f"Wrote {path} in {time.perf_counter() - start:.1f}s")
+
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    _hand_table = memoryview(mapped).cast('H')
+    return _hand_table
+
+def get_hand_table() -> Optional[memoryview]:
+    """Returns the hand table if it has been loaded, otherwise None."""
+    return _hand_table
+
+def lookup_hand_class(hand: Sequence[Card]) -> int:
+    """Returns the class of a 5-card hand from the full table (loading it if needed)."""
+    table = _hand_table if _hand_table is not None else load_hand_table()
+    return table[hand_index(hand)]
+
+
+# --- Batch Lookup ---
+# Hands are processed in chunks so the temporary arrays stay cache-sized.
+BATCH_CHUNK_SIZE = 1 << 15
+
+def hand_classes(batch: Any) -> Any:
+    """
+    Returns the hand class of every hand in an N x 5 array (or nested list) of
+    encoded cards, via the perfect hash into the hand table (requires NumPy).
+    """
+    if np is None:
+        raise ImportError("hand_classes requires NumPy.")
+    codes = np.asarray(batch, dtype=np.int32)
+    if codes.ndim != 2 or codes.shape[1] != 5:
+        raise ValueError("Batch must be an N x 5 array of encoded cards.")
+    table = np.frombuffer(_hand_table if _hand_table is not None else load_hand_table(), dtype=np.uint16)
+
+    classes = np.empty(codes.shape[0], dtype=np.uint16)
+    for start in range(0, codes.shape[0], BATCH_CHUNK_SIZE):
+        chunk = codes[start:start + BATCH_CHUNK_SIZE]
+        # Card index (position in CARDS) = suit index * 13 + rank index, sorted per hand
+        card_indices = _SUIT_INDEX_BY_BIT[(chunk >> 12) & 0xF] * len(RANKS) + ((chunk >> 8) & 0xF)
+        card_indices.sort(axis=1)
+        index = _BINOMIAL_ARRAYS[0][card_indices[:, 0]]
+        for k in range(1, 5):
+            index += _BINOMIAL_ARRAYS[k][card_indices[:, k]]
+        classes[start:start + BATCH_CHUNK_SIZE] = table[index]
+    return classes
+
+if np is not None:
+    _SUIT_INDEX_BY_BIT = np.zeros(16, dtype=np.int32)
+    _SUIT_INDEX_BY_BIT[[1, 2, 4, 8]] = [0, 1, 2, 3]
+    _BINOMIAL_ARRAYS = np.array(BINOMIALS[1:], dtype=np.int32)
+
+
+if __name__ == '__main__':
+    print(f"Hand classes: {len(CLASS_KINDS)} (expected {NUM_HAND_CLASSES})")
+    table = load_hand_table()
+    print(f"Hand table: {len(table)} entries")
+    royal = [Card('T', '♠'), Card('J', '♠'), Card('Q', '♠'), Card('K', '♠'), Card('A', '♠')]
+    worst = [Card('7', '♣'), Card('5', '♦'), Card('4', '♥'), Card('3', '♠'), Card('2', '♣')]
+    print(f"Royal flush: index {hand_index(royal)}, class {lookup_hand_class(royal)}")
+    print(f"7-5-4-3-2: index {hand_index(worst)}, class {lookup_hand_class(worst)}")
@@ -0,0 +1,82 @@
+# /poker_nplay.py
+"""
+N-play draw engine for Multi Poker (Triple Play, Ten Play, Hundred Play).
+
+Every hand in an N-play round keeps the same held cards and draws its
+replacements from the same 47-card stub: the deck minus the five dealt cards.
+The stub is built once per round; each hand then takes its draws with a partial
+Fisher–Yates shuffle of that stub (one random swap per card drawn), so no deck
+is constructed, shuffled or searched per hand. All hands are scored together
+with the variant's batch evaluator.
+"""
+import random
+from typing import List, Optional, Sequence, Tuple
+
+import config_rng as rng_cfg
+from card import Card, CARDS, JOKER
+from poker_variants import DEFAULT_VARIANT, get_variant
+from rng import get_stream
+
+def draw_stub(base_hand: Sequence[Card], num_jokers: int = 0) -> List[Card]:
+    """Returns the cards left after the base hand is dealt (47 cards, plus any jokers not dealt)."""
+    dealt = set(base_hand) # Cards are interned, so identity equals card equality
+    stub = [card for card in CARDS if card not in dealt]
+    stub.extend([JOKER] * (num_jokers - sum(1 for card in base_hand if card is JOKER)))
+    return stub
+
+def draw_hands(base_hand: Sequence[Card], held_indices: Sequence[int], num_hands: int,
+               num_jokers: int = 0, rng: Optional[random.Random] = None) -> List[List[Card]]:
+    """
+    Deals num_hands final hands: each keeps the held cards in place and fills
+    the other positions with cards drawn from the stub without replacement.
+    """
+    rng = rng or get_stream(rng_cfg.STREAM_POKER)
+    # Exact bounded draws when the stream offers them (rng.SecureRandom)
+    randbelow = getattr(rng, "randbelow", None) or (lambda n, rng_random=rng.random: int(rng_random() * n))
+    stub = draw_stub(base_hand, num_jokers)
+    stub_size = len(stub)
+    held = set(i for i in held_indices if 0 <= i < len(base_hand))
+    draw_positions = [i for i in range(len(base_hand)) if i not in held]
+    num_draws = len(draw_positions)
+
+    hands = []
+    for _ in range(num_hands):
+        # Partial Fisher–Yates: the first num_draws slots become a uniform sample of the stub.
+        # The stub is reused in whatever order the previous hand left it; any order works.
+        for k in range(num_draws):
+            j = k + randbelow(stub_size - k)
+            stub[k], stub[j] = stub[j], stub[k]
+        hand = list(base_hand)
+        for k, position in enumerate(draw_positions):
+            hand[position] = stub[k]
+        hands.append(hand)
+    return hands
+
+def play_n_hands(base_hand: Sequence[Card], held_indices: Sequence[int], num_hands: int,
+                 variant_key: str = DEFAULT_VARIANT, rng: Optional[random.Random] = None
+                 ) -> Tuple[List[List[Card]], List[Tuple[str, str, int]], int]:
+    """
+    Draws and scores one N-play round with the given variant.
+    Returns (hands, results as (category key, name, payout), total payout per unit bet).
+    """
+    variant = get_variant(variant_key)
+    hands = draw_hands(base_hand, held_indices, num_hands, variant.num_jokers, rng)
+    results = variant.evaluate_many(hands)
+    return hands, results, sum(payout for _, _, payout in results)
+
+
+if __name__ == '__main__':
+    import time
+    from deck import Deck
+
+    base_hand = Deck().deal(5)
+    held = [0, 1]
+    for key in ("jacks_or_better", "deuces_wild"):
+        get_variant(key) # Compile outside the timing
+        for num_hands in (3, 10, 100):
+            start = time.perf_counter()
+            rounds = 200
+            for _ in range(rounds):
+                hands, results, total = play_n_hands(base_hand, held, num_hands, key)
+            elapsed_ms = (time.perf_counter() - start) * 1000 / rounds
+            print(f"{key:<16} {num_hands:>3} hands: {elapsed_ms:.3f} ms per draw step (last total {total})")
@@ -0,0 +1,320 @@
+# /poker_rtp.py
+"""
+Exact return-to-player analysis of a video poker pay table under optimal play.
+
+Every one of the 134,459 suit-isomorphic deals (see poker_strategy.py) is
+solved once: the per-hold outcome counts from poker_ev do not depend on the
+pay table, so each deal picks its best hold by exact (integer) expected value
+and adds its weighted outcome counts to running totals. The totals give the
+exact probability of every final HandRank, from which the return, hit
+frequency and variance follow.
+
+For pay-table tuning, the outcome counts of every deal and hold can also be
+stored once (build_outcome_counts). Scoring a candidate pay table is then a
+matrix product plus a per-deal argmax over holds, so a whole grid of tables is
+evaluated in one pass over the stored counts (analyze_pay_tables).
+
+Usage:  python poker_rtp.py [--pay FULL_HOUSE=8 --pay FLUSH=5 ...] [--workers N]
+        python poker_rtp.py --grid FULL_HOUSE=7,8,9 --grid FLUSH=5,6
+"""
+import argparse
+import collections
+import itertools
+import mmap
+import os
+import struct
+import time
+from array import array
+from fractions import Fraction
+from math import comb, lcm
+from multiprocessing import Pool, cpu_count
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import config_assets as assets
+from poker_rules import HandRank, PAY_TABLE
+from poker_ev import JACKS_OR_BETTER_CATEGORIES, NUM_HOLDS, STUB_SIZE, hold_outcome_counts
+from poker_strategy import NUM_CANONICAL_DEALS, canonical_deals, canonical_hand
+
+try:
+    import numpy as np
+except ImportError: # NumPy is only needed to evaluate pay-table grids
+    np = None
+
+# Draws per number of cards drawn (0-5), and a common multiple so expected
+# values of different holds can be compared as exact integers
+DRAWS_BY_SIZE = [comb(STUB_SIZE, num_drawn) for num_drawn in range(6)]
+_DRAWS_LCM = lcm(*DRAWS_BY_SIZE)
+_DRAW_SCALES = [_DRAWS_LCM // draws for draws in DRAWS_BY_SIZE]
+_DRAWN_BY_MASK = [5 - bin(mask).count("1") for mask in range(NUM_HOLDS)]
+
+PayTable = Dict[HandRank, Tuple[str, int]]
+
+# Result of an analysis: return, variance and standard deviation per unit bet,
+# the probability of each final HandRank, the overall hit frequency (any paying
+# hand) and the number of deals covered
+RtpAnalysis = collections.namedtuple(
+    "RtpAnalysis", ["expected_return", "variance", "std_dev", "rank_probabilities", "hit_frequency", "num_deals"]
+)
+
+def best_hold_mask(hold_counts: Sequence[Sequence[int]], payouts: Sequence[int]) -> int:
+    """
+    Returns the hold mask with the highest expected value, compared exactly.
+    Ties go to the lowest mask, like poker_ev.best_hold.
+    """
+    best_mask, best_score = 0, -1
+    for mask, counts in enumerate(hold_counts):
+        score = sum(count * payout for count, payout in zip(counts, payouts) if payout) * _DRAW_SCALES[_DRAWN_BY_MASK[mask]]
+        if score > best_score:
+            best_mask, best_score = mask, score
+    return best_mask
+
+def _analyze_deals(task: Tuple[Sequence[Tuple[int, int]], Sequence[int]]) -> List[List[int]]:
+    """
+    Worker: for a chunk of (canonical_key, weight) deals, plays the best hold
+    and returns weighted outcome counts per category, split by number of cards
+    drawn (totals[num_drawn][category]) so the caller can normalize exactly.
+    """
+    deals, payouts = task
+    totals = [[0] * len(payouts) for _ in range(6)]
+    for key, weight in deals:
+        hold_counts = hold_outcome_counts(canonical_hand(key))
+        mask = best_hold_mask(hold_counts, payouts)
+        row = totals[_DRAWN_BY_MASK[mask]]
+        for category, count in enumerate(hold_counts[mask]):
+            row[category] += weight * count
+    return totals
+
+def analyze_pay_table(pay_table: Optional[PayTable] = None, workers: Optional[int] = None,
+                      limit: Optional[int] = None, chunk_size: int = 256) -> RtpAnalysis:
+    """
+    Computes the exact return, per-HandRank probabilities, hit frequency and
+    variance of a pay table (defaults to PAY_TABLE) under optimal play.
+    `limit` analyzes only the first N canonical deals (the result then covers
+    just those deals).
+    """
+    pay_table = pay_table or PAY_TABLE
+    payouts = [pay_table[rank][1] for rank in JACKS_OR_BETTER_CATEGORIES]
+    deals = canonical_deals()
+    if limit is not None:
+        deals = deals[:limit]
+    num_deals = sum(weight for _, weight in deals)
+    tasks = [(deals[start:start + chunk_size], payouts) for start in range(0, len(deals), chunk_size)]
+
+    totals = [[0] * len(payouts) for _ in range(6)]
+    with Pool(processes=workers or cpu_count()) as pool:
+        for chunk_totals in pool.imap_unordered(_analyze_deals, tasks):
+            for num_drawn in range(6):
+                for category, count in enumerate(chunk_totals[num_drawn]):
+                    totals[num_drawn][category] += count
+
+    probabilities = [
+        sum(Fraction(totals[num_drawn][category], DRAWS_BY_SIZE[num_drawn]) for num_drawn in range(6)) / num_deals
+        for category in range(len(payouts))
+    ]
+    expected_return = sum(p * payout for p, payout in zip(probabilities, payouts))
+    variance = sum(p * payout * payout for p, payout in zip(probabilities, payouts)) - expected_return * expected_return
+    return RtpAnalysis(
+        expected_return=float(expected_return),
+        variance=float(variance),
+        std_dev=float(variance) ** 0.5,
+        rank_probabilities={rank: float(p) for rank, p in zip(JACKS_OR_BETTER_CATEGORIES, probabilities)},
+        hit_frequency=float(sum(p for p, payout in zip(probabilities, payouts) if payout > 0)),
+        num_deals=num_deals,
+    )
+
+def parse_pay_overrides(overrides: Sequence[str], base: Optional[PayTable] = None) -> PayTable:
+    """Applies 'RANK=PAYOUT' overrides (e.g. 'FULL_HOUSE=8') to a copy of a pay table."""
+    pay_table = dict(base or PAY_TABLE)
+    for override in overrides:
+        rank_name, _, payout = override.partition("=")
+        try:
+            rank = HandRank[rank_name.strip().upper()]
+            pay_table[rank] = (pay_table[rank][0], int(payout))
+        except (KeyError, ValueError):
+            raise ValueError(f"Invalid pay table override: {override!r} (expected e.g. FULL_HOUSE=8)")
+    return pay_table
+
+def format_analysis(analysis: RtpAnalysis, pay_table: PayTable) -> str:
+    """Returns a printable report of an analysis."""
+    lines = [f"{'Hand':<16} {'Pays':>5} {'Probability':>12} {'Return':>9}"]
+    for rank in JACKS_OR_BETTER_CATEGORIES:
+        name, payout = pay_table[rank]
+        probability = analysis.rank_probabilities[rank]
+        lines.append(f"{name:<16} {payout:>5} {probability:>12.8f} {probability * payout:>9.6f}")
+    lines.append(f"Return:        {analysis.expected_return:.6%}")
+    lines.append(f"Hit frequency: {analysis.hit_frequency:.4%}")
+    lines.append(f"Variance:      {analysis.variance:.4f} (std dev {analysis.std_dev:.4f})")
+    lines.append(f"Deals covered: {analysis.num_deals}")
+    return "\n".join(lines)
+
+
+# --- Stored Outcome Counts ---
+# File layout: header, canonical keys (uint64), deal weights (uint32), then the
+# outcome counts (uint32) of every deal x hold x category in that order.
+OUTCOME_COUNTS_FILENAME = "outcome_counts_jacks_or_better_v1.bin"
+_COUNTS_MAGIC = b"VPCOUNT1"
+_COUNTS_HEADER = struct.Struct("<8sQII") # magic, deals, holds, categories (24 bytes keeps the arrays aligned)
+
+def get_outcome_counts_path() -> str:
+    """Returns the path of the stored outcome counts file."""
+    return os.path.join(assets.TABLE_CACHE_PATH, OUTCOME_COUNTS_FILENAME)
+
+def _count_deals(keys: Sequence[int]) -> array:
+    """Worker: outcome counts of every hold of each canonical deal, flattened."""
+    counts = array('I')
+    for key in keys:
+        for hold_counts in hold_outcome_counts(canonical_hand(key)):
+            counts.extend(hold_counts)
+    return counts
+
+def build_outcome_counts(path: Optional[str] = None, workers: Optional[int] = None,
+                         limit: Optional[int] = None, chunk_size: int = 256) -> str:
+    """
+    Computes the outcome counts of every canonical deal and hold across a
+    process pool and writes them to disk. They do not depend on the pay table,
+    so this only needs to run once. `limit` stores only the first N canonical
+    deals (for quick checks); it needs an explicit path, so a partial file never
+    lands in the cache. Returns the path written.
+    """
+    if limit is not None and path is None:
+        raise ValueError("A limited build needs an explicit path (it must not replace the cached counts).")
+    path = path or get_outcome_counts_path()
+    start = time.perf_counter()
+    deals = canonical_deals()
+    if limit is not None:
+        deals = deals[:limit]
+    keys = [key for key, _ in deals]
+    print(f"Counting outcomes of {len(deals)} canonical deals x {NUM_HOLDS} holds...")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f, Pool(processes=workers or cpu_count()) as pool:
+        f.write(_COUNTS_HEADER.pack(_COUNTS_MAGIC, len(deals), NUM_HOLDS, len(JACKS_OR_BETTER_CATEGORIES)))
+        array('Q', keys).tofile(f)
+        array('I', (weight for _, weight in deals)).tofile(f)
+        chunks = (keys[i:i + chunk_size] for i in range(0, len(keys), chunk_size))
+        for done, counts in enumerate(pool.imap(_count_deals, chunks), 1): # Ordered, so chunks stream to disk
+            counts.tofile(f)
+            if done % 32 == 0:
+                print(f"  {min(done * chunk_size, len(keys))}/{len(keys)} deals ({time.perf_counter() - start:.0f}s)")
+    os.replace(tmp_path, path)
+    print(f"Wrote {path} in {time.perf_counter() - start:.0f}s")
+    return path
+
+def load_outcome_counts(path: Optional[str] = None) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Memory-maps the stored outcome counts (see build_outcome_counts).
+    Returns (weights[deals], counts[deals, holds, categories]).
+    Raises FileNotFoundError if they were never built, and ValueError if the
+    file does not cover every deal (e.g. a --limit build).
+    """
+    if np is None:
+        raise RuntimeError("NumPy is required to evaluate stored outcome counts.")
+    path = path or get_outcome_counts_path()
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"No outcome counts at {path}: build them first with python poker_rtp.py --build-counts")
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, num_deals, num_holds, num_categories = _COUNTS_HEADER.unpack_from(mapped, 0)
+    if magic != _COUNTS_MAGIC:
+        raise ValueError(f"{path} is not an outcome counts file.")
+    if (num_deals, num_holds, num_categories) != (NUM_CANONICAL_DEALS, NUM_HOLDS, len(JACKS_OR_BETTER_CATEGORIES)):
+        raise ValueError(f"{path} holds {num_deals} deals x {num_holds} holds x {num_categories} categories, "
+                         f"expected {NUM_CANONICAL_DEALS} x {NUM_HOLDS} x {len(JACKS_OR_BETTER_CATEGORIES)} (partial build?)")
+    offset = _COUNTS_HEADER.size + 8 * num_deals
+    weights = np.frombuffer(mapped, dtype=np.uint32, count=num_deals, offset=offset)
+    if int(weights.sum(dtype=np.int64)) != comb(52, 5):
+        raise ValueError(f"{path}: deal weights do not add up to all {comb(52, 5)} deals.")
+    offset += 4 * num_deals
+    counts = np.frombuffer(mapped, dtype=np.uint32, count=num_deals * num_holds * num_categories, offset=offset)
+    return weights, counts.reshape(num_deals, num_holds, num_categories)
+
+def analyze_pay_tables(pay_tables: Sequence[PayTable], path: Optional[str] = None) -> List[RtpAnalysis]:
+    """
+    Evaluates a whole grid of pay tables against the stored outcome counts in
+    one pass: per chunk of deals, expected values of all holds under all tables
+    are a single matrix product, and the best hold per deal and table an argmax.
+    Results match analyze_pay_table to floating-point precision.
+    """
+    weights, counts = load_outcome_counts(path)
+    payouts = np.array([[pay_table[rank][1] for rank in JACKS_OR_BETTER_CATEGORIES] for pay_table in pay_tables], dtype=np.float64)
+    num_tables, num_categories = payouts.shape
+    draw_fractions = np.array([1.0 / DRAWS_BY_SIZE[num_drawn] for num_drawn in _DRAWN_BY_MASK])[None, :, None]
+
+    category_totals = np.zeros((num_tables, num_categories))
+    chunk_size = max(1, (1 << 22) // (NUM_HOLDS * num_tables)) # Bounds the (deals, tables, holds) EV block
+    for start in range(0, len(weights), chunk_size):
+        probabilities = counts[start:start + chunk_size] * draw_fractions # (deals, holds, categories)
+        # (tables, categories) @ (deals, categories, holds) -> (deals, tables, holds), so the
+        # argmax over holds runs along the contiguous last axis
+        expected_values = payouts @ probabilities.transpose(0, 2, 1)
+        best = expected_values.argmax(axis=2) # (deals, tables)
+        chosen = probabilities[np.arange(len(best))[:, None], best] # (deals, tables, categories)
+        category_totals += np.einsum('d,dtc->tc', weights[start:start + chunk_size].astype(np.float64), chosen)
+
+    num_deals = int(weights.sum(dtype=np.int64))
+    rank_probabilities = category_totals / num_deals
+    expected_returns = (rank_probabilities * payouts).sum(axis=1)
+    variances = (rank_probabilities * payouts ** 2).sum(axis=1) - expected_returns ** 2
+    hit_frequencies = (rank_probabilities * (payouts > 0)).sum(axis=1)
+    return [
+        RtpAnalysis(
+            expected_return=float(expected_returns[t]),
+            variance=float(variances[t]),
+            std_dev=float(variances[t]) ** 0.5,
+            rank_probabilities={rank: float(p) for rank, p in zip(JACKS_OR_BETTER_CATEGORIES, rank_probabilities[t])},
+            hit_frequency=float(hit_frequencies[t]),
+            num_deals=num_deals,
+        )
+        for t in range(num_tables)
+    ]
+
+def pay_table_grid(grid: Sequence[str], base: Optional[PayTable] = None) -> List[PayTable]:
+    """
+    Expands 'RANK=P1,P2,...' specs (e.g. 'FULL_HOUSE=7,8,9') into every
+    combination of payouts, applied to a copy of base (defaults to PAY_TABLE).
+    """
+    axes = []
+    for spec in grid:
+        rank_name, _, payouts = spec.partition("=")
+        axes.append([f"{rank_name}={payout}" for payout in payouts.split(",") if payout.strip()])
+    return [parse_pay_overrides(combination, base) for combination in itertools.product(*axes)]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Exact return of a Jacks or Better pay table under optimal play.")
+    parser.add_argument("--pay", action="append", default=[], metavar="RANK=PAYOUT",
+                        help="Override a payout of PAY_TABLE, e.g. --pay FULL_HOUSE=8 (repeatable).")
+    parser.add_argument("--grid", action="append", default=[], metavar="RANK=P1,P2,...",
+                        help="Evaluate every combination of these payouts from the stored outcome counts (repeatable).")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores).")
+    parser.add_argument("--limit", type=int, default=None, help="Only analyze the first N canonical deals.")
+    parser.add_argument("--build-counts", action="store_true", help="(Re)build the stored outcome counts and exit.")
+    parser.add_argument("--counts", default=None, metavar="PATH",
+                        help="Outcome counts file to build or read (default: the cache directory).")
+    args = parser.parse_args()
+    if args.limit is not None and args.grid:
+        parser.error("--limit does not apply to --grid, which always covers every deal")
+    if args.limit is not None and args.build_counts and args.counts is None:
+        parser.error("--build-counts with --limit needs --counts PATH (a partial file must not replace the cache)")
+
+    start = time.perf_counter()
+    if args.build_counts:
+        build_outcome_counts(args.counts, workers=args.workers, limit=args.limit)
+    elif args.grid:
+        base = parse_pay_overrides(args.pay)
+        pay_tables = pay_table_grid(args.grid, base)
+        try:
+            analyses = analyze_pay_tables(pay_tables, args.counts)
+        except (FileNotFoundError, ValueError) as e:
+            parser.error(str(e))
+        ranks = [HandRank[spec.partition("=")[0].strip().upper()] for spec in args.grid]
+        print("  ".join(f"{rank.name:>15}" for rank in ranks) + f"  {'Return':>11}  {'Hit freq':>9}  {'Std dev':>8}")
+        for pay_table, analysis in sorted(zip(pay_tables, analyses), key=lambda item: item[1].expected_return, reverse=True):
+            print("  ".join(f"{pay_table[rank][1]:>15}" for rank in ranks)
+                  + f"  {analysis.expected_return:>11.6%}  {analysis.hit_frequency:>9.4%}  {analysis.std_dev:>8.4f}")
+        print(f"Evaluated {len(pay_tables)} pay tables in {time.perf_counter() - start:.1f}s")
+    else:
+        pay_table = parse_pay_overrides(args.pay)
+        analysis = analyze_pay_table(pay_table, args.workers, args.limit)
+        print(format_analysis(analysis, pay_table))
+        print(f"Analyzed in {time.perf_counter() - start:.0f}s")
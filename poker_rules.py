@@ -1,8 +1,14 @@
-from collections import Counter
-from typing import List, Tuple, Optional, NewType
-from card import Card, RANK_VALUES
+from typing import Any, List, Tuple, Optional, NewType
+from card import Card
+from poker_lookup import hand_class_from_codes, hand_classes, hand_index, get_hand_table, load_hand_table
+from poker_variants import JACKS_OR_BETTER, get_variant
 from enum import Enum, auto # Using Enum for better type safety and clarity
 
+try:
+    import numpy as np
+except ImportError: # NumPy is only needed for batch evaluation (evaluate_hands)
+    np = None
+
 # Define Hand Ranks using Enum
 class HandRank(Enum):
     ROYAL_FLUSH = auto()
@@ -17,20 +23,9 @@ class HandRank(Enum):
     NOTHING = auto() # Represents hands below Jacks or Better
 
 
-# Standard Jacks or Better Pay Table (Bet = 1 unit)
+# Standard Jacks or Better Pay Table (Bet = 1 unit), from the variant spec in poker_variants.py
 # Maps Hand Rank constant to (Name, Payout Multiplier)
-PAY_TABLE = {
-    HandRank.ROYAL_FLUSH: ("Royal Flush", 250), # Often higher with max bet, but simplifying
-    HandRank.STRAIGHT_FLUSH: ("Straight Flush", 50),
-    HandRank.FOUR_OF_A_KIND: ("Four of a Kind", 25),
-    HandRank.FULL_HOUSE: ("Full House", 9),
-    HandRank.FLUSH: ("Flush", 6),
-    HandRank.STRAIGHT: ("Straight", 4),
-    HandRank.THREE_OF_A_KIND: ("Three of a Kind", 3),
-    HandRank.TWO_PAIR: ("Two Pair", 2),
-    HandRank.JACKS_OR_BETTER: ("Jacks or Better", 1),
-    HandRank.NOTHING: ("Nothing", 0)
-}
+PAY_TABLE = {HandRank[category.key]: (category.name, category.payout) for category in JACKS_OR_BETTER.categories}
 
 def get_pay_table_string() -> str:
     """Returns a formatted string representation of the pay table."""
@@ -50,6 +45,13 @@ def get_pay_table_string() -> str:
     return "\n".join(lines)
 
 
+# --- Hand Class -> HandRank ---
+# The compiled Jacks or Better spec maps each of the 7462 hand classes to a pay
+# category once at import, so evaluating a hand is a class lookup plus a list index.
+_JACKS_OR_BETTER = get_variant(JACKS_OR_BETTER.key)
+CLASS_HAND_RANKS: List[HandRank] = [HandRank[_JACKS_OR_BETTER.categories[i].key] for i in _JACKS_OR_BETTER.class_categories]
+
+
 def evaluate_hand(hand: List[Card]) -> Tuple[HandRank, str, int]:
     """
     Evaluates a 5-card hand and returns its rank, name, and payout multiplier.
@@ -66,83 +68,66 @@ def evaluate_hand(hand: List[Card]) -> Tuple[HandRank, str, int]:
     if len(hand) != 5:
         raise ValueError("Hand must contain exactly 5 cards.")
 
-    ranks = sorted([RANK_VALUES[card.rank] for card in hand], reverse=True)
-    suits = [card.suit for card in hand]
-    rank_counts = Counter(ranks)
-    most_common_ranks = rank_counts.most_common() # List of (rank_value, count) tuples
-
-    is_flush = len(set(suits)) == 1
-    # Check for straight: difference between max and min rank is 4, and no duplicates
-    # Special case: A-2-3-4-5 straight (ranks are 14, 2, 3, 4, 5 -> sorted 14, 5, 4, 3, 2)
-    is_straight = (len(set(ranks)) == 5 and (ranks[0] - ranks[4] == 4)) or \
-                  (set(ranks) == {RANK_VALUES['A'], RANK_VALUES['2'], RANK_VALUES['3'], RANK_VALUES['4'], RANK_VALUES['5']})
-
-    # Handle Ace-low straight rank sorting if necessary for evaluation
-    if set(ranks) == {RANK_VALUES['A'], RANK_VALUES['2'], RANK_VALUES['3'], RANK_VALUES['4'], RANK_VALUES['5']}:
-         # Treat Ace as low for straight calculation (value 1)
-         ranks = sorted([1 if r == RANK_VALUES['A'] else r for r in ranks], reverse=True)
-         is_straight = True # Re-confirm as straight might have been missed above if Ace was high
-
-    # --- Evaluate hands from highest rank to lowest ---
-
-    # Royal Flush / Straight Flush
-    if is_straight and is_flush:
-        if ranks[0] == RANK_VALUES['A'] and ranks[1] == RANK_VALUES['K']: # Ace-high straight flush
-            rank = HandRank.ROYAL_FLUSH
-        else:
-            rank = HandRank.STRAIGHT_FLUSH
-        name, payout = PAY_TABLE[rank]
-        return rank, name, payout
+    # Bit operations on the card codes find the class directly; this is cheaper
+    # per call than hashing the hand into the full table.
+    rank = CLASS_HAND_RANKS[hand_class_from_codes(hand[0].code, hand[1].code, hand[2].code, hand[3].code, hand[4].code)]
+    name, payout = PAY_TABLE[rank]
+    return rank, name, payout
 
-    # Four of a Kind
-    if most_common_ranks[0][1] == 4:
-        rank = HandRank.FOUR_OF_A_KIND
-        name, payout = PAY_TABLE[rank]
-        return rank, name, payout
+def evaluate_hand_index(index: int) -> Tuple[HandRank, str, int]:
+    """
+    Evaluates a hand given its perfect-hash index (see poker_lookup.hand_index)
+    with a single lookup in the memory-mapped hand table.
+    Returns the same (rank, name, payout) tuple as evaluate_hand.
+    """
+    table = get_hand_table()
+    if table is None:
+        table = load_hand_table()
+    rank = CLASS_HAND_RANKS[table[index]]
+    name, payout = PAY_TABLE[rank]
+    return rank, name, payout
 
-    # Full House
-    if most_common_ranks[0][1] == 3 and most_common_ranks[1][1] == 2:
-        rank = HandRank.FULL_HOUSE
-        name, payout = PAY_TABLE[rank]
-        return rank, name, payout
 
-    # Flush (but not Straight Flush)
-    if is_flush:
-        rank = HandRank.FLUSH
-        name, payout = PAY_TABLE[rank]
-        return rank, name, payout
+# --- Batch Evaluation ---
+def evaluate_hands(batch: Any) -> Tuple[Any, Any]:
+    """
+    Evaluates many 5-card hands with array operations instead of one Python
+    call per hand (requires NumPy).
 
-    # Straight (but not Straight Flush)
-    if is_straight:
-        rank = HandRank.STRAIGHT
-        name, payout = PAY_TABLE[rank]
-        return rank, name, payout
+    Args:
+        batch: An N x 5 integer array (or nested list) of encoded cards (Card.code).
 
-    # Three of a Kind
-    if most_common_ranks[0][1] == 3:
-        rank = HandRank.THREE_OF_A_KIND
-        name, payout = PAY_TABLE[rank]
-        return rank, name, payout
+    Returns:
+        A tuple of two length-N NumPy arrays:
+        - Rank codes (HandRank values; HandRank(code) gives the enum member).
+        - Payout multipliers based on PAY_TABLE.
+    """
+    if np is None:
+        raise ImportError("evaluate_hands requires NumPy.")
+    rank_codes = _RANK_CODES_BY_CLASS[hand_classes(batch)]
+    return rank_codes, _PAYOUTS_BY_RANK_CODE[rank_codes]
 
-    # Two Pair
-    if most_common_ranks[0][1] == 2 and most_common_ranks[1][1] == 2:
-        rank = HandRank.TWO_PAIR
+def evaluate_multi_hands(hands: List[List[Card]]) -> List[Tuple[HandRank, str, int]]:
+    """
+    Evaluates several 5-card hands, in one evaluate_hands pass when NumPy is
+    available. Returns one (rank, name, payout) tuple per hand, like evaluate_hand.
+    """
+    if np is None or not hands:
+        return [evaluate_hand(hand) for hand in hands]
+    rank_codes, _ = evaluate_hands([[card.code for card in hand] for hand in hands])
+    results = []
+    for rank_code in rank_codes.tolist():
+        rank = HandRank(rank_code)
         name, payout = PAY_TABLE[rank]
-        return rank, name, payout
-
-    # Jacks or Better (One Pair)
-    if most_common_ranks[0][1] == 2:
-        pair_rank_value = most_common_ranks[0][0]
-        # Check if the pair rank is Jack (11) or higher
-        if pair_rank_value >= RANK_VALUES['J']:
-            rank = HandRank.JACKS_OR_BETTER
-            name, payout = PAY_TABLE[rank]
-            return rank, name, payout
-
-    # Nothing
-    rank = HandRank.NOTHING
-    name, payout = PAY_TABLE[rank]
-    return rank, name, payout
+        results.append((rank, name, payout))
+    return results
+
+if np is not None:
+    _RANK_CODES_BY_CLASS = np.array([rank.value for rank in CLASS_HAND_RANKS], dtype=np.int8)
+    # Indexed by HandRank value (index 0 is unused)
+    _PAYOUTS_BY_RANK_CODE = np.zeros(len(HandRank) + 1, dtype=np.int32)
+    for _rank, (_, _payout) in PAY_TABLE.items():
+        _PAYOUTS_BY_RANK_CODE[_rank.value] = _payout
 
 
 if __name__ == '__main__':
@@ -185,3 +170,11 @@ if __name__ == '__main__':
         hand_str = ", ".join([f"{c.rank}{c.suit}" for c in hand])
         rank, hand_name, payout = evaluate_hand(hand)
         print(f"Hand: {hand_str:<30} -> {name:<18} | Result: {hand_name} ({payout}x)")
+        assert evaluate_hand_index(hand_index(hand)) == (rank, hand_name, payout)
+
+    if np is not None:
+        batch = [[card.code for card in hand] for hand in hands_to_test.values()]
+        rank_codes, payouts = evaluate_hands(batch)
+        print("-" * 30)
+        print(f"Batch: {[HandRank(code).name for code in rank_codes]}")
+        print(f"Batch payouts: {payouts.tolist()}")
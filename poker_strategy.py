@@ -0,0 +1,227 @@
+# /poker_strategy.py
+"""
+Offline optimal-strategy database for Jacks or Better.
+
+The 2,598,960 possible deals collapse into 134,459 classes that differ only by a
+permutation of suits. A build step solves the best hold (and its expected
+return) for one representative of every class across all cores, and writes a
+compact binary file keyed by the canonical hand key. At runtime the file is
+memory-mapped and a lookup is a canonicalization plus a binary search, so no
+enumeration ever happens on the render thread.
+
+Build it with:  python poker_strategy.py build [--workers N]
+"""
+import argparse
+import bisect
+import mmap
+import os
+import struct
+import time
+from array import array
+from itertools import combinations
+from multiprocessing import Pool, cpu_count
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import config_assets as assets
+from card import Card, CARDS, RANKS, SUITS
+
+NUM_CANONICAL_DEALS = 134459
+STRATEGY_DB_FILENAME = "strategy_jacks_or_better_v1.bin"
+_MAGIC = b"VPSTRAT1"
+_HEADER = struct.Struct("<8sQ") # magic, number of records
+
+# --- Suit-Isomorphic Canonical Form ---
+# A hand's canonical key is its four per-suit rank bitmasks, sorted descending
+# and packed 13 bits each. Hands that differ only by relabelling suits share it.
+
+def _suit_masks(hand: Sequence[Card]) -> List[int]:
+    masks = [0, 0, 0, 0]
+    for card in hand:
+        masks[((card.code >> 12) & 0xF).bit_length() - 1] |= 1 << ((card.code >> 8) & 0xF)
+    return masks
+
+def _pack_masks(masks: Sequence[int]) -> int:
+    return (masks[0] << 39) | (masks[1] << 26) | (masks[2] << 13) | masks[3]
+
+def canonical_key(hand: Sequence[Card]) -> int:
+    """Returns the suit-isomorphic canonical key of a 5-card hand."""
+    return _pack_masks(sorted(_suit_masks(hand), reverse=True))
+
+def canonical_hand(key: int) -> List[Card]:
+    """
+    Returns the representative hand of a canonical key: suit slot i (in SUITS
+    order) gets the i-th mask. Cards are ordered by slot, then rank.
+    """
+    hand = []
+    for slot in range(4):
+        mask = (key >> (39 - 13 * slot)) & 0x1FFF
+        for rank_index in range(len(RANKS)):
+            if mask & (1 << rank_index):
+                hand.append(Card(RANKS[rank_index], SUITS[slot]))
+    return hand
+
+def _canonical_positions(hand: Sequence[Card]) -> Tuple[int, List[int]]:
+    """
+    Returns the canonical key of a hand and, for each card in the hand, its
+    position in the representative hand of that key.
+    """
+    masks = _suit_masks(hand)
+    # Stable sort: suits with equal masks are interchangeable, so any order is valid
+    suit_order = sorted(range(4), key=lambda suit: masks[suit], reverse=True)
+    slot_of_suit = [0] * 4
+    for slot, suit in enumerate(suit_order):
+        slot_of_suit[suit] = slot
+    canonical_cards = [(slot_of_suit[((card.code >> 12) & 0xF).bit_length() - 1], (card.code >> 8) & 0xF) for card in hand]
+    order = sorted(range(len(hand)), key=lambda i: canonical_cards[i])
+    positions = [0] * len(hand)
+    for position, i in enumerate(order):
+        positions[i] = position
+    return _pack_masks([masks[suit] for suit in suit_order]), positions
+
+def canonical_deals() -> List[Tuple[int, int]]:
+    """
+    Enumerates all 2,598,960 deals and returns (canonical_key, number_of_deals)
+    for each of the 134,459 classes, sorted by key.
+    """
+    suit_bits = [(card.code >> 12) & 0xF for card in CARDS]
+    rank_bits = [1 << ((card.code >> 8) & 0xF) for card in CARDS]
+    shifts = {1: 0, 2: 13, 4: 26, 8: 39}
+    weights: Dict[int, int] = {}
+    for combo in combinations(range(52), 5):
+        packed = 0 # Unsorted masks, packed by suit
+        for i in combo:
+            packed |= rank_bits[i] << shifts[suit_bits[i]]
+        masks = sorted(((packed >> 39) & 0x1FFF, (packed >> 26) & 0x1FFF, (packed >> 13) & 0x1FFF, packed & 0x1FFF), reverse=True)
+        key = _pack_masks(masks)
+        weights[key] = weights.get(key, 0) + 1
+    return sorted(weights.items())
+
+
+# --- Build Step ---
+def _solve_keys(keys: Sequence[int]) -> List[Tuple[int, int, float]]:
+    """Worker: solves the best hold mask and expected return for each canonical key."""
+    from poker_ev import hold_expected_values, NUM_HOLDS
+    results = []
+    for key in keys:
+        expected_values = hold_expected_values(canonical_hand(key))
+        best_mask = max(range(NUM_HOLDS), key=lambda mask: expected_values[mask])
+        results.append((key, best_mask, expected_values[best_mask]))
+    return results
+
+def _chunks(items: Sequence[int], size: int) -> Iterable[Sequence[int]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def get_strategy_db_path() -> str:
+    """Returns the path of the strategy database file."""
+    return os.path.join(assets.TABLE_CACHE_PATH, STRATEGY_DB_FILENAME)
+
+def build_strategy_db(path: Optional[str] = None, workers: Optional[int] = None, limit: Optional[int] = None) -> str:
+    """
+    Solves every canonical deal with a process pool and writes the database.
+    `limit` solves only the first N classes (for quick checks).
+    Returns the path written.
+    """
+    path = path or get_strategy_db_path()
+    workers = workers or cpu_count()
+    start = time.perf_counter()
+    keys = [key for key, _ in canonical_deals()]
+    if limit is not None:
+        keys = keys[:limit]
+    print(f"Solving {len(keys)} canonical deals on {workers} worker(s)...")
+
+    results: List[Tuple[int, int, float]] = []
+    with Pool(processes=workers) as pool:
+        for chunk_results in pool.imap_unordered(_solve_keys, _chunks(keys, 256)):
+            results.extend(chunk_results)
+            if len(results) % 8192 < len(chunk_results):
+                print(f"  {len(results)}/{len(keys)} solved ({time.perf_counter() - start:.0f}s)")
+    results.sort()
+
+    record_keys = array('Q', (key for key, _, _ in results))
+    record_evs = array('f', (expected_value for _, _, expected_value in results))
+    record_holds = array('B', (mask for _, mask, _ in results))
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, len(results)))
+        record_keys.tofile(f)
+        record_evs.tofile(f)
+        record_holds.tofile(f)
+    os.replace(tmp_path, path)
+    print(f"Wrote {path} ({len(results)} records) in {time.perf_counter() - start:.0f}s")
+    return path
+
+
+# --- Runtime Lookup ---
+_strategy_db: Optional[Tuple[memoryview, memoryview, memoryview]] = None
+
+def load_strategy_db(path: Optional[str] = None) -> bool:
+    """
+    Memory-maps the strategy database if it exists. Returns True when loaded.
+    Never builds it: that is an offline step.
+    """
+    global _strategy_db
+    path = path or get_strategy_db_path()
+    if not os.path.isfile(path):
+        print(f"Strategy database not found at {path}. Run 'python poker_strategy.py build'.")
+        return False
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, count = _HEADER.unpack_from(mapped, 0)
+    if magic != _MAGIC:
+        print(f"Warning: {path} is not a strategy database.")
+        return False
+    view = memoryview(mapped)
+    offset = _HEADER.size
+    keys = view[offset:offset + 8 * count].cast('Q')
+    offset += 8 * count
+    evs = view[offset:offset + 4 * count].cast('f')
+    offset += 4 * count
+    holds = view[offset:offset + count]
+    _strategy_db = (keys, evs, holds)
+    return True
+
+def lookup_best_hold(hand: Sequence[Card]) -> Optional[Tuple[List[int], float]]:
+    """
+    Returns (held_indices, expected_return) of the optimal hold for a dealt hand
+    (e.g. game_state['hand']), or None if the database is not loaded or does not
+    contain the hand.
+    """
+    if _strategy_db is None or len(hand) != 5:
+        return None
+    keys, evs, holds = _strategy_db
+    key, positions = _canonical_positions(hand)
+    record = bisect.bisect_left(keys, key)
+    if record == len(keys) or keys[record] != key:
+        return None
+    canonical_mask = holds[record]
+    held_indices = [i for i in range(5) if canonical_mask & (1 << positions[i])]
+    return held_indices, evs[record]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Jacks or Better optimal-strategy database.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser("build", help="Solve every canonical deal and write the database.")
+    build_parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores).")
+    build_parser.add_argument("--limit", type=int, default=None, help="Only solve the first N canonical deals.")
+    build_parser.add_argument("--output", default=None, help="Output path (default: cache directory).")
+    lookup_parser = subparsers.add_parser("lookup", help="Look up the best hold for a hand, e.g. 'Th Jh Qh Kh Kc'.")
+    lookup_parser.add_argument("cards", nargs=5)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        build_strategy_db(args.output, args.workers, args.limit)
+    else:
+        hand = [Card(text[0].upper(), text[1].upper()) for text in args.cards]
+        if load_strategy_db():
+            start = time.perf_counter()
+            result = lookup_best_hold(hand)
+            elapsed_us = (time.perf_counter() - start) * 1e6
+            if result is None:
+                print("Hand not in database.")
+            else:
+                held, expected_value = result
+                held_str = " ".join(f"{hand[i].rank}{hand[i].suit}" for i in held) or "(discard all)"
+                print(f"Hold {held_str}  EV {expected_value:.4f}  ({elapsed_us:.0f} us)")
@@ -0,0 +1,244 @@
+# /poker_variants.py
+"""
+Declarative video poker variants.
+
+A variant is an ordered list of pay categories. Each category describes the
+hands it pays for (hand kind, plus optional rank and kicker restrictions such
+as "four aces with a 2, 3 or 4 kicker"); a hand belongs to the first category
+that matches it, and the last category catches everything else.
+
+Compiling a variant checks every category against the 7462 hand classes of
+poker_lookup once, producing a class -> category table. Evaluating a hand is
+then a class lookup plus a list index, whatever the variant, so adding a game
+adds no branching to the hot path. Wild-card games (Deuces Wild, Joker Poker)
+compile to a similar table keyed by the natural cards and the wild count; see
+poker_wild.py.
+"""
+import collections
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from card import Card, RANKS
+from poker_lookup import (
+    NUM_HAND_CLASSES, CLASS_KINDS, CLASS_RANK_COUNTS, ROYAL_FLUSH_CLASS,
+    KIND_STRAIGHT_FLUSH, KIND_FOUR_OF_A_KIND, KIND_FULL_HOUSE, KIND_FLUSH, KIND_STRAIGHT,
+    KIND_THREE_OF_A_KIND, KIND_TWO_PAIR, KIND_ONE_PAIR,
+    hand_class_from_codes, hand_classes
+)
+
+try:
+    import numpy as np
+except ImportError: # NumPy is only needed for batch evaluation
+    np = None
+
+# A pay category:
+#   key     - identifier stored in game state (e.g. "FOUR_ACES")
+#   name    - display name for the pay table
+#   payout  - multiplier per unit bet
+#   kind    - poker_lookup KIND_* the hand must have (None matches any hand)
+#   ranks   - ranks allowed for the main rank group (quads, trips or highest
+#             pair), e.g. "JQKA" for Jacks or Better (None = any)
+#   kickers - ranks allowed for the kicker of four of a kind (None = any)
+#   royal   - only the royal flush matches
+#   min_wilds / max_wilds - wild cards the hand must contain (wild-card games
+#             only, e.g. a natural royal has max_wilds=0; None = no limit)
+PayCategory = collections.namedtuple(
+    "PayCategory", ["key", "name", "payout", "kind", "ranks", "kickers", "royal", "min_wilds", "max_wilds"],
+    defaults=(None, None, None, False, 0, None)
+)
+# A variant: its pay categories, plus for wild-card games the wild rank (e.g.
+# "2" for Deuces Wild) and the number of jokers added to the deck
+VariantSpec = collections.namedtuple(
+    "VariantSpec", ["key", "name", "categories", "wild_rank", "num_jokers"],
+    defaults=(None, 0)
+)
+
+# Five of a kind has no natural hand class; it only exists with wild cards
+KIND_FIVE_OF_A_KIND = -1
+
+def category_matches(category: PayCategory, kind: int, rank_counts: Sequence[Tuple[int, int]],
+                     is_royal: bool, num_wilds: int = 0) -> bool:
+    """
+    Checks a category against a hand described by its kind, (rank_index, count)
+    pairs (as in poker_lookup.CLASS_RANK_COUNTS) and royal flag. Compile time only.
+    """
+    if category.royal and not is_royal:
+        return False
+    if category.kind is not None and kind != category.kind:
+        return False
+    if category.ranks is not None and RANKS[rank_counts[0][0]] not in category.ranks:
+        return False
+    if category.kickers is not None and RANKS[rank_counts[-1][0]] not in category.kickers:
+        return False
+    if num_wilds < category.min_wilds or (category.max_wilds is not None and num_wilds > category.max_wilds):
+        return False
+    return True
+
+
+class CompiledVariant:
+    """A variant compiled into per-class lookup tables."""
+
+    def __init__(self, spec: VariantSpec):
+        self.key = spec.key
+        self.name = spec.name
+        self.num_jokers = spec.num_jokers
+        self.categories: List[PayCategory] = list(spec.categories)
+        self.payouts: List[int] = [category.payout for category in self.categories]
+        self.category_index: Dict[str, int] = {category.key: i for i, category in enumerate(self.categories)}
+        # class_categories[hand_class] = index of the first matching category
+        self.class_categories: List[int] = []
+        for hand_class in range(NUM_HAND_CLASSES):
+            kind, rank_counts = CLASS_KINDS[hand_class], CLASS_RANK_COUNTS[hand_class]
+            for i, category in enumerate(self.categories):
+                if category_matches(category, kind, rank_counts, hand_class == ROYAL_FLUSH_CLASS):
+                    self.class_categories.append(i)
+                    break
+            else:
+                raise ValueError(f"Variant {spec.key!r} has no category for hand class {hand_class}.")
+        # Per-class (key, name, payout) results, so evaluate() is a single index
+        self.class_results: List[Tuple[str, str, int]] = [
+            (self.categories[i].key, self.categories[i].name, self.categories[i].payout) for i in self.class_categories
+        ]
+        self._class_category_array = np.array(self.class_categories, dtype=np.int8) if np is not None else None
+
+    def evaluate(self, hand: Sequence[Card]) -> Tuple[str, str, int]:
+        """Evaluates a 5-card hand, returning (category key, name, payout)."""
+        if len(hand) != 5:
+            raise ValueError("Hand must contain exactly 5 cards.")
+        return self.class_results[hand_class_from_codes(hand[0].code, hand[1].code, hand[2].code, hand[3].code, hand[4].code)]
+
+    def evaluate_categories(self, batch: Any) -> Any:
+        """Returns the category index of every hand in an N x 5 array of encoded cards (requires NumPy)."""
+        return self._class_category_array[hand_classes(batch)]
+
+    def evaluate_many(self, hands: Sequence[Sequence[Card]]) -> List[Tuple[str, str, int]]:
+        """Evaluates several hands, in one batch lookup when NumPy is available."""
+        if np is None or not hands:
+            return [self.evaluate(hand) for hand in hands]
+        category_results = [(c.key, c.name, c.payout) for c in self.categories]
+        categories = self.evaluate_categories([[card.code for card in hand] for hand in hands])
+        return [category_results[i] for i in categories.tolist()]
+
+    def pay_table_rows(self) -> List[Tuple[str, str, int]]:
+        """Paying categories as (key, name, payout), highest payout first, for display."""
+        rows = [(c.key, c.name, c.payout) for c in self.categories if c.payout > 0]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+
+
+# --- Variant Specs ---
+_ROYAL = PayCategory("ROYAL_FLUSH", "Royal Flush", 250, KIND_STRAIGHT_FLUSH, royal=True)
+_STRAIGHT_FLUSH = PayCategory("STRAIGHT_FLUSH", "Straight Flush", 50, KIND_STRAIGHT_FLUSH)
+_NOTHING = PayCategory("NOTHING", "Nothing", 0)
+
+def _lower_hands(full_house: int, flush: int, straight: int, two_pair: int) -> List[PayCategory]:
+    """The categories below four of a kind shared by the Jacks or Better family."""
+    return [
+        PayCategory("FULL_HOUSE", "Full House", full_house, KIND_FULL_HOUSE),
+        PayCategory("FLUSH", "Flush", flush, KIND_FLUSH),
+        PayCategory("STRAIGHT", "Straight", straight, KIND_STRAIGHT),
+        PayCategory("THREE_OF_A_KIND", "Three of a Kind", 3, KIND_THREE_OF_A_KIND),
+        PayCategory("TWO_PAIR", "Two Pair", two_pair, KIND_TWO_PAIR),
+        PayCategory("JACKS_OR_BETTER", "Jacks or Better", 1, KIND_ONE_PAIR, ranks="JQKA"),
+        _NOTHING,
+    ]
+
+JACKS_OR_BETTER = VariantSpec("jacks_or_better", "Jacks or Better", [
+    _ROYAL, _STRAIGHT_FLUSH,
+    PayCategory("FOUR_OF_A_KIND", "Four of a Kind", 25, KIND_FOUR_OF_A_KIND),
+] + _lower_hands(full_house=9, flush=6, straight=4, two_pair=2))
+
+BONUS_POKER = VariantSpec("bonus_poker", "Bonus Poker", [
+    _ROYAL, _STRAIGHT_FLUSH,
+    PayCategory("FOUR_ACES", "Four Aces", 80, KIND_FOUR_OF_A_KIND, ranks="A"),
+    PayCategory("FOUR_2_4", "Four 2s-4s", 40, KIND_FOUR_OF_A_KIND, ranks="234"),
+    PayCategory("FOUR_5_K", "Four 5s-Ks", 25, KIND_FOUR_OF_A_KIND),
+] + _lower_hands(full_house=8, flush=5, straight=4, two_pair=2))
+
+DOUBLE_BONUS = VariantSpec("double_bonus", "Double Bonus", [
+    _ROYAL, _STRAIGHT_FLUSH,
+    PayCategory("FOUR_ACES", "Four Aces", 160, KIND_FOUR_OF_A_KIND, ranks="A"),
+    PayCategory("FOUR_2_4", "Four 2s-4s", 80, KIND_FOUR_OF_A_KIND, ranks="234"),
+    PayCategory("FOUR_5_K", "Four 5s-Ks", 50, KIND_FOUR_OF_A_KIND),
+] + _lower_hands(full_house=10, flush=7, straight=5, two_pair=1))
+
+DOUBLE_DOUBLE_BONUS = VariantSpec("double_double_bonus", "Double Double Bonus", [
+    _ROYAL, _STRAIGHT_FLUSH,
+    PayCategory("FOUR_ACES_2_4", "Four Aces + 2-4", 400, KIND_FOUR_OF_A_KIND, ranks="A", kickers="234"),
+    PayCategory("FOUR_2_4_A_4", "Four 2s-4s + A-4", 160, KIND_FOUR_OF_A_KIND, ranks="234", kickers="A234"),
+    PayCategory("FOUR_ACES", "Four Aces", 160, KIND_FOUR_OF_A_KIND, ranks="A"),
+    PayCategory("FOUR_2_4", "Four 2s-4s", 80, KIND_FOUR_OF_A_KIND, ranks="234"),
+    PayCategory("FOUR_5_K", "Four 5s-Ks", 50, KIND_FOUR_OF_A_KIND),
+] + _lower_hands(full_house=9, flush=6, straight=4, two_pair=1))
+
+# Wild-card games: the best interpretation of the wild cards is paid
+DEUCES_WILD = VariantSpec("deuces_wild", "Deuces Wild", [
+    PayCategory("NATURAL_ROYAL", "Natural Royal", 250, KIND_STRAIGHT_FLUSH, royal=True, max_wilds=0),
+    PayCategory("FOUR_DEUCES", "Four Deuces", 200, min_wilds=4),
+    PayCategory("WILD_ROYAL", "Wild Royal", 25, KIND_STRAIGHT_FLUSH, royal=True),
+    PayCategory("FIVE_OF_A_KIND", "Five of a Kind", 15, KIND_FIVE_OF_A_KIND),
+    PayCategory("STRAIGHT_FLUSH", "Straight Flush", 9, KIND_STRAIGHT_FLUSH),
+    PayCategory("FOUR_OF_A_KIND", "Four of a Kind", 5, KIND_FOUR_OF_A_KIND),
+    PayCategory("FULL_HOUSE", "Full House", 3, KIND_FULL_HOUSE),
+    PayCategory("FLUSH", "Flush", 2, KIND_FLUSH),
+    PayCategory("STRAIGHT", "Straight", 2, KIND_STRAIGHT),
+    PayCategory("THREE_OF_A_KIND", "Three of a Kind", 1, KIND_THREE_OF_A_KIND),
+    _NOTHING,
+], wild_rank="2")
+
+JOKER_POKER = VariantSpec("joker_poker", "Joker Poker", [
+    PayCategory("NATURAL_ROYAL", "Natural Royal", 250, KIND_STRAIGHT_FLUSH, royal=True, max_wilds=0),
+    PayCategory("FIVE_OF_A_KIND", "Five of a Kind", 200, KIND_FIVE_OF_A_KIND),
+    PayCategory("WILD_ROYAL", "Wild Royal", 100, KIND_STRAIGHT_FLUSH, royal=True),
+    PayCategory("STRAIGHT_FLUSH", "Straight Flush", 50, KIND_STRAIGHT_FLUSH),
+    PayCategory("FOUR_OF_A_KIND", "Four of a Kind", 20, KIND_FOUR_OF_A_KIND),
+    PayCategory("FULL_HOUSE", "Full House", 7, KIND_FULL_HOUSE),
+    PayCategory("FLUSH", "Flush", 5, KIND_FLUSH),
+    PayCategory("STRAIGHT", "Straight", 3, KIND_STRAIGHT),
+    PayCategory("THREE_OF_A_KIND", "Three of a Kind", 2, KIND_THREE_OF_A_KIND),
+    PayCategory("TWO_PAIR", "Two Pair", 1, KIND_TWO_PAIR),
+    PayCategory("KINGS_OR_BETTER", "Kings or Better", 1, KIND_ONE_PAIR, ranks="KA"),
+    _NOTHING,
+], num_jokers=1)
+
+# Selectable variants, in menu order
+VARIANTS: Dict[str, VariantSpec] = {
+    spec.key: spec for spec in (JACKS_OR_BETTER, BONUS_POKER, DOUBLE_BONUS, DOUBLE_DOUBLE_BONUS, DEUCES_WILD, JOKER_POKER)
+}
+DEFAULT_VARIANT = JACKS_OR_BETTER.key
+
+_compiled_variants: Dict[str, Any] = {}
+
+def get_variant(key: Optional[str] = None) -> CompiledVariant:
+    """
+    Returns the compiled variant for a key (default Jacks or Better), compiling
+    it on first use. Wild-card variants compile to a poker_wild.WildVariant,
+    which has the same evaluate / evaluate_many / pay_table_rows interface.
+    """
+    key = key or DEFAULT_VARIANT
+    variant = _compiled_variants.get(key)
+    if variant is None:
+        if key not in VARIANTS:
+            raise ValueError(f"Unknown poker variant: {key}")
+        spec = VARIANTS[key]
+        if spec.wild_rank is not None or spec.num_jokers:
+            from poker_wild import WildVariant # Imported here: poker_wild builds on this module
+            variant = WildVariant(spec)
+        else:
+            variant = CompiledVariant(spec)
+        _compiled_variants[key] = variant
+    return variant
+
+def next_variant_key(key: Optional[str]) -> str:
+    """Returns the key of the variant after `key` in menu order (wrapping around)."""
+    keys = list(VARIANTS)
+    key = key if key in VARIANTS else DEFAULT_VARIANT
+    return keys[(keys.index(key) + 1) % len(keys)]
+
+
+if __name__ == '__main__':
+    four_aces_trey = [Card('A', '♣'), Card('A', '♦'), Card('A', '♥'), Card('A', '♠'), Card('3', '♣')]
+    four_threes_ace = [Card('3', '♣'), Card('3', '♦'), Card('3', '♥'), Card('3', '♠'), Card('A', '♣')]
+    four_nines = [Card('9', '♣'), Card('9', '♦'), Card('9', '♥'), Card('9', '♠'), Card('K', '♣')]
+    for key in VARIANTS:
+        variant = get_variant(key)
+        results = [variant.evaluate(hand)[1:] for hand in (four_aces_trey, four_threes_ace, four_nines)]
+        print(f"{variant.name:<20}: {results}")
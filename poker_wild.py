@@ -0,0 +1,163 @@
+# /poker_wild.py
+"""
+Lookup-table evaluation for wild-card video poker (Deuces Wild, Joker Poker).
+
+Substituting every possible value for each wild card and evaluating the result
+would cost up to 13^4 evaluations per hand. Instead, a wild variant is compiled
+once: for every combination of natural cards (their rank multiset, as a prime
+product, and whether they share a suit) and wild count, all wild substitutions
+are scored and the best-paying category is stored. Evaluating a hand is then a
+pass over its five card codes plus one dict lookup, the same cost as a natural
+game.
+"""
+from collections import Counter
+from itertools import combinations_with_replacement
+from typing import Dict, List, Sequence, Tuple
+
+from card import Card, CARDS, JOKER, RANKS, RANK_PRIMES, SUIT_MASK, PRIME_MASK
+from poker_lookup import (
+    FLUSH_CLASSES, UNIQUE_CLASSES, PAIRED_CLASSES, CLASS_KINDS, CLASS_RANK_COUNTS, ROYAL_FLUSH_CLASS
+)
+from poker_variants import VariantSpec, PayCategory, KIND_FIVE_OF_A_KIND, category_matches
+
+def signature_key(prime_product: int, suited: bool, num_wilds: int) -> int:
+    """Packs a natural-card signature and wild count into one table key."""
+    return (prime_product << 4) | (8 if suited else 0) | num_wilds
+
+def _resolve(rank_indices: Sequence[int], suited: bool) -> Tuple[int, Tuple[Tuple[int, int], ...], bool]:
+    """
+    Returns (kind, rank_counts, is_royal) of five ranks, which may include a
+    five of a kind. `suited` means all cards can share one suit.
+    """
+    counts = Counter(rank_indices)
+    if len(counts) == 1:
+        return KIND_FIVE_OF_A_KIND, ((rank_indices[0], 5),), False
+    if len(counts) == 5:
+        rank_bits = sum(1 << i for i in rank_indices)
+        hand_class = FLUSH_CLASSES[rank_bits] if suited else UNIQUE_CLASSES[rank_bits]
+    else:
+        prime_product = 1
+        for i in rank_indices:
+            prime_product *= RANK_PRIMES[i]
+        hand_class = PAIRED_CLASSES[prime_product]
+    return CLASS_KINDS[hand_class], CLASS_RANK_COUNTS[hand_class], hand_class == ROYAL_FLUSH_CLASS
+
+
+class WildVariant:
+    """A wild-card variant compiled into a (natural signature, wild count) -> result table."""
+
+    def __init__(self, spec: VariantSpec):
+        self.key = spec.key
+        self.name = spec.name
+        self.num_jokers = spec.num_jokers
+        self.categories: List[PayCategory] = list(spec.categories)
+        self.payouts: List[int] = [category.payout for category in self.categories]
+        self.category_index: Dict[str, int] = {category.key: i for i, category in enumerate(self.categories)}
+
+        # Wild cards: every card of the wild rank, plus the joker
+        wild_cards = [card for card in CARDS if card.rank == spec.wild_rank]
+        if spec.num_jokers:
+            wild_cards.append(JOKER)
+        self._wild_codes = frozenset(card.code for card in wild_cards)
+        natural_ranks = [i for i, rank in enumerate(RANKS) if rank != spec.wild_rank]
+        max_wilds = min(len(wild_cards), 5)
+
+        self._category_memo: Dict[Tuple, int] = {}
+        # signature key -> (key, name, payout) of the best-paying interpretation
+        self._results: Dict[int, Tuple[str, str, int]] = {}
+        self.table_categories: Dict[int, int] = {} # signature key -> category index
+        for num_wilds in range(max_wilds + 1):
+            num_natural = 5 - num_wilds
+            for naturals in combinations_with_replacement(natural_ranks, num_natural):
+                if any(count > 4 for count in Counter(naturals).values()):
+                    continue
+                prime_product = 1
+                for i in naturals:
+                    prime_product *= RANK_PRIMES[i]
+                distinct = len(set(naturals)) == num_natural
+                # Fewer than two natural cards are always "suited"; paired cards never are
+                for suited in ((True,) if num_natural < 2 else (False, True) if distinct else (False,)):
+                    category = self._best_category(naturals, suited, num_wilds)
+                    key = signature_key(prime_product, suited, num_wilds)
+                    self.table_categories[key] = category
+                    c = self.categories[category]
+                    self._results[key] = (c.key, c.name, c.payout)
+        del self._category_memo
+
+    def _category_of(self, rank_indices: Tuple[int, ...], suited: bool, num_wilds: int) -> int:
+        """First category matching five resolved ranks; memoized, as many substitutions resolve alike."""
+        memo_key = (tuple(sorted(rank_indices)), suited, num_wilds)
+        category = self._category_memo.get(memo_key)
+        if category is None:
+            kind, rank_counts, is_royal = _resolve(rank_indices, suited)
+            category = next(i for i, c in enumerate(self.categories) if category_matches(c, kind, rank_counts, is_royal, num_wilds))
+            self._category_memo[memo_key] = category
+        return category
+
+    def _best_category(self, naturals: Sequence[int], suited: bool, num_wilds: int) -> int:
+        """Scores every substitution of the wild cards; returns the best-paying category (compile time only)."""
+        best = len(self.categories) - 1
+        for wild_ranks in combinations_with_replacement(range(len(RANKS)), num_wilds):
+            i = self._category_of(tuple(naturals) + wild_ranks, suited, num_wilds)
+            if self.payouts[i] > self.payouts[best] or (self.payouts[i] == self.payouts[best] and i < best):
+                best = i
+        return best
+
+    def evaluate(self, hand: Sequence[Card]) -> Tuple[str, str, int]:
+        """Evaluates a 5-card hand, returning (category key, name, payout) of its best interpretation."""
+        if len(hand) != 5:
+            raise ValueError("Hand must contain exactly 5 cards.")
+        wild_codes = self._wild_codes
+        prime_product = 1
+        suits = SUIT_MASK
+        num_wilds = 0
+        for card in hand:
+            code = card.code
+            if code in wild_codes:
+                num_wilds += 1
+            else:
+                prime_product *= code & PRIME_MASK
+                suits &= code
+        return self._results[(prime_product << 4) | (8 if suits else 0) | num_wilds]
+
+    def evaluate_many(self, hands: Sequence[Sequence[Card]]) -> List[Tuple[str, str, int]]:
+        """Evaluates several hands."""
+        return [self.evaluate(hand) for hand in hands]
+
+    def pay_table_rows(self) -> List[Tuple[str, str, int]]:
+        """Paying categories as (key, name, payout), highest payout first, for display."""
+        rows = [(c.key, c.name, c.payout) for c in self.categories if c.payout > 0]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+
+
+if __name__ == '__main__':
+    import time
+    from poker_variants import get_variant
+
+    start = time.perf_counter()
+    deuces = get_variant("deuces_wild")
+    joker = get_variant("joker_poker")
+    print(f"Compiled wild tables in {time.perf_counter() - start:.2f}s "
+          f"({len(deuces.table_categories)} + {len(joker.table_categories)} signatures)")
+
+    hands = {
+        "deuces_wild": [
+            [Card('2', '♣'), Card('2', '♦'), Card('2', '♥'), Card('2', '♠'), Card('9', '♣')],
+            [Card('2', '♣'), Card('J', '♥'), Card('Q', '♥'), Card('K', '♥'), Card('A', '♥')],
+            [Card('2', '♣'), Card('2', '♦'), Card('7', '♥'), Card('7', '♠'), Card('7', '♣')],
+            [Card('2', '♣'), Card('3', '♦'), Card('4', '♥'), Card('5', '♠'), Card('A', '♣')],
+            [Card('2', '♣'), Card('K', '♦'), Card('9', '♥'), Card('5', '♠'), Card('3', '♣')],
+        ],
+        "joker_poker": [
+            [JOKER, Card('K', '♦'), Card('K', '♥'), Card('K', '♠'), Card('K', '♣')],
+            [JOKER, Card('T', '♠'), Card('J', '♠'), Card('Q', '♠'), Card('A', '♠')],
+            [JOKER, Card('K', '♦'), Card('9', '♥'), Card('5', '♠'), Card('3', '♣')],
+            [JOKER, Card('Q', '♦'), Card('9', '♥'), Card('5', '♠'), Card('3', '♣')],
+        ],
+    }
+    for key, variant_hands in hands.items():
+        variant = get_variant(key)
+        for hand in variant_hands:
+            hand_str = " ".join(f"{card.rank}{card.suit}" for card in hand)
+            _, name, payout = variant.evaluate(hand)
+            print(f"{variant.name:<12} {hand_str:<20} -> {name} ({payout}x)")
@@ -9,7 +9,7 @@ import config_animations as animations
 import config_states as states
 from card import Card
 from game_state import GameState
-from blackjack_rules import get_hand_value, BLACKJACK_PAYOUT, WIN_PAYOUT, BLACKJACK_VALUES
+from blackjack_rules import get_hand_value, BLACKJACK_PAYOUT, WIN_PAYOUT
 from .draw_text import draw_text
 from .draw_button import draw_button
 from .get_card_image import get_card_image
@@ -37,7 +37,7 @@ def draw_blackjack_screen(surface: pygame.Surface, fonts: Dict[str, pygame.font.
                 # Placeholder: Green rectangle
                 pygame.draw.rect(surface, colors.GREEN, (x, dealer_y, layout_cards.CARD_WIDTH, layout_cards.CARD_HEIGHT), border_radius=5)
                 pygame.draw.rect(surface, colors.WHITE, (x, dealer_y, layout_cards.CARD_WIDTH, layout_cards.CARD_HEIGHT), 1, border_radius=5)
-                dealer_value_text = f"Dealer Shows: {BLACKJACK_VALUES.get(dealer_hand[1].rank, '?')}" # Show value of upcard
+                dealer_value_text = f"Dealer Shows: {dealer_hand[1].blackjack_value}" # Show value of upcard
             else:
                 img = get_card_image(card, card_images)
                 surface.blit(img, (x, dealer_y))
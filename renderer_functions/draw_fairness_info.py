@@ -0,0 +1,19 @@
+import pygame
+from typing import Dict, Any
+
+import config_colors as colors
+import config_display as display
+from .draw_text import draw_text
+
+HASH_CHARS_SHOWN = 24 # Leading hex digits of each hash shown on screen (the session log has them in full)
+
+def draw_fairness_info(surface: pygame.Surface, font: pygame.font.Font, game_state: Dict[str, Any]):
+    """Draws the provably-fair commitment of the current/next round and the last reveal at the bottom of the screen."""
+    y = display.SCREEN_HEIGHT - 2 * font.get_linesize() - 4
+    commitment = game_state.get('fair_commitment')
+    if commitment is not None:
+        draw_text(surface, f"Commitment: {commitment.digest[:HASH_CHARS_SHOWN]}...", font, 10, y, colors.GREY)
+    reveal = game_state.get('fair_reveal')
+    if reveal is not None:
+        draw_text(surface, f"Revealed {reveal['commitment'][:HASH_CHARS_SHOWN]}... salt {reveal['salt']}",
+                  font, 10, y + font.get_linesize(), colors.GREY)
@@ -0,0 +1,85 @@
+# /renderer_functions/draw_frame.py
+import pygame
+from typing import Dict, Any, Callable
+
+import config_colors as colors
+import config_states as states
+from game_state import GameState
+from poker_variants import get_variant
+from .draw_top_menu import draw_top_menu
+from .draw_game_selection_menu import draw_game_selection_menu
+from .draw_game_screen import draw_game_screen
+from .draw_settings_menu import draw_settings_menu
+from .draw_confirm_exit import draw_confirm_exit
+from .draw_blackjack_screen import draw_blackjack_screen
+from .draw_roulette_screen import draw_roulette_screen
+from .draw_slots_screen import draw_slots_screen
+from .draw_baccarat_screen import draw_baccarat_screen
+from .draw_fairness_info import draw_fairness_info
+
+BLACKJACK_STATES = [states.STATE_BLACKJACK_IDLE, states.STATE_BLACKJACK_PLAYER_TURN,
+                    states.STATE_BLACKJACK_DEALER_TURN, states.STATE_BLACKJACK_SHOWING_RESULT]
+ROULETTE_STATES = [states.STATE_ROULETTE_BETTING, states.STATE_ROULETTE_SPINNING, states.STATE_ROULETTE_RESULT]
+SLOTS_STATES = [states.STATE_SLOTS_IDLE, states.STATE_SLOTS_SPINNING, states.STATE_SLOTS_SHOWING_RESULT]
+BACCARAT_STATES = [states.STATE_BACCARAT_BETTING, states.STATE_BACCARAT_DEALING,
+                   states.STATE_BACCARAT_DRAWING, states.STATE_BACCARAT_RESULT]
+MENU_STATES = [states.STATE_TOP_MENU, states.STATE_GAME_SELECTION, states.STATE_SETTINGS, states.STATE_CONFIRM_EXIT]
+
+def _draw_poker_screen(surface: pygame.Surface, render_assets: Dict[str, Any], game_state: Dict[str, Any], game_state_manager: GameState):
+    render_data = {
+        'current_state': game_state['current_state'],
+        'money': game_state_manager.money,
+        'hand': game_state['hand'],
+        'held_indices': game_state['held_indices'],
+        'message': game_state['message'],
+        'result_message': game_state['result_message'],
+        'winning_rank': game_state['final_hand_rank'],
+        'can_play': game_state_manager.can_play(),
+        'multi_hands': game_state['multi_hands'],
+        'multi_results': game_state['multi_results'],
+        'money_animation_active': game_state.get('money_animation_active', False),
+        'money_animation_amount': game_state.get('money_animation_amount', 0),
+        'result_message_flash_active': game_state.get('result_message_flash_active', False),
+        'result_message_flash_visible': game_state.get('result_message_flash_visible', True),
+    }
+    draw_game_screen(surface, render_assets['fonts'], render_assets['card_images'], render_data, game_state)
+
+def get_screen_drawer(current_state: str) -> Callable[[pygame.Surface, Dict[str, Any], Dict[str, Any], GameState], None]:
+    """
+    Returns the function drawing the screen for a game state, called as
+    drawer(surface, render_assets, game_state, game_state_manager).
+    """
+    if current_state == states.STATE_TOP_MENU:
+        return lambda surface, ra, gs, gsm: draw_top_menu(surface, ra['fonts'], ra['backdrop_image'])
+    if current_state == states.STATE_GAME_SELECTION:
+        return lambda surface, ra, gs, gsm: draw_game_selection_menu(surface, ra['fonts'], gsm.money, ra['backdrop_image'])
+    if current_state == states.STATE_SETTINGS:
+        return lambda surface, ra, gs, gsm: draw_settings_menu(surface, ra['fonts'], gs['sound_enabled'], gs['volume_level'],
+                                                              ra['backdrop_image'], get_variant(gs['poker_variant']).name)
+    if current_state == states.STATE_CONFIRM_EXIT:
+        # Confirmation dialog overlays, so no backdrop applied here intentionally
+        return lambda surface, ra, gs, gsm: draw_confirm_exit(surface, ra['fonts'], gs)
+    if current_state in BLACKJACK_STATES:
+        return lambda surface, ra, gs, gsm: draw_blackjack_screen(surface, ra['fonts'], ra['card_images'], gs, gsm)
+    if current_state in ROULETTE_STATES:
+        # draw_roulette_screen handles drawing table OR wheel based on state
+        return lambda surface, ra, gs, gsm: draw_roulette_screen(surface, ra['fonts'], gs, gsm)
+    if current_state in SLOTS_STATES:
+        return lambda surface, ra, gs, gsm: draw_slots_screen(surface, ra['fonts'], ra['slot_images'], gs, gsm,
+                                                             ra['slot_machine_overlay_image'])
+    if current_state in BACCARAT_STATES:
+        return lambda surface, ra, gs, gsm: draw_baccarat_screen(surface, ra['fonts'], ra['card_images'], gs, gsm)
+    return _draw_poker_screen # Draw/Multi Poker
+
+def draw_frame(surface: pygame.Surface, render_assets: Dict[str, Any], game_state: Dict[str, Any], game_state_manager: GameState):
+    """
+    Draws one whole frame for the current game state (see load_render_assets for
+    render_assets). Does not flip the display.
+    """
+    # Default fill, may be overwritten by backdrop
+    surface.fill(colors.DARK_GREEN)
+    get_screen_drawer(game_state['current_state'])(surface, render_assets, game_state, game_state_manager)
+
+    # Commitment of the current/next round and the last reveal (not on menus or the exit dialog)
+    if game_state['current_state'] not in MENU_STATES:
+        draw_fairness_info(surface, render_assets['fonts']['fairness'], game_state)
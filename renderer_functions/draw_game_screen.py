@@ -13,6 +13,7 @@ import config_animations as anim
 
 from card import Card
 from poker_rules import HandRank
+from poker_variants import get_variant
 from .draw_pay_table import draw_pay_table
 from .draw_text import draw_text
 from .draw_hand import draw_hand
@@ -32,7 +33,8 @@ def draw_game_screen(surface: pygame.Surface, fonts: Dict[str, pygame.font.Font]
     pay_table_x = layout_cards.PAY_TABLE_X # Always use the standard X position
     pay_table_y = layout_cards.PAY_TABLE_Y
     # Highlight only works well for single hand mode, disable for multi (already handled by passing None)
-    draw_pay_table(surface, fonts, x=pay_table_x, y=pay_table_y, winning_rank=winning_rank if not is_multi_poker else None)
+    variant = get_variant(game_state.get('poker_variant'))
+    draw_pay_table(surface, fonts, x=pay_table_x, y=pay_table_y, variant=variant, winning_rank=winning_rank if not is_multi_poker else None)
 
     # Draw Money
     money_text = f"Money: ${render_data.get('money', 0)}"
@@ -6,11 +6,10 @@ from typing import List, Tuple, Dict
 import config_layout_cards as layout_cards # Added
 import config_colors as colors # Added
 from card import Card
-from poker_rules import HandRank
 from .get_card_image import get_card_image
 from .draw_text import draw_text
 
-def draw_multi_hands(surface: pygame.Surface, multi_hands: List[List[Card]], multi_results: List[Tuple[HandRank, str, int]], card_images: Dict[str, pygame.Surface], fonts: Dict[str, pygame.font.Font]):
+def draw_multi_hands(surface: pygame.Surface, multi_hands: List[List[Card]], multi_results: List[Tuple[str, str, int]], card_images: Dict[str, pygame.Surface], fonts: Dict[str, pygame.font.Font]):
     """Draws the multiple smaller hands above the main hand area."""
     # Updated constants references
     card_width = layout_cards.MULTI_CARD_WIDTH
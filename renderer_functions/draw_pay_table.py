@@ -3,11 +3,11 @@ from typing import Optional, Dict
 
 import config_colors as colors
 import config_fonts as fonts_cfg
-from poker_rules import PAY_TABLE, HandRank
+from poker_variants import CompiledVariant
 from .get_font import get_font
 
-def draw_pay_table(surface: pygame.Surface, fonts: Dict[str, pygame.font.Font], x: int, y: int, winning_rank: Optional[HandRank] = None):
-    """Draws the pay table."""
+def draw_pay_table(surface: pygame.Surface, fonts: Dict[str, pygame.font.Font], x: int, y: int, variant: CompiledVariant, winning_rank: Optional[str] = None):
+    """Draws the pay table of a compiled poker variant, highlighting the winning category key."""
     pay_table_font = fonts['pay_table']
     line_height = pay_table_font.get_linesize()
     padding = 5
@@ -18,14 +18,13 @@ def draw_pay_table(surface: pygame.Surface, fonts: Dict[str, pygame.font.Font],
     colon_color = colors.WHITE # Color for the colon separator
     colon_str = ":"
 
-    # Sort ranks by payout (highest first)
-    sorted_ranks = sorted([rank for rank in PAY_TABLE if PAY_TABLE[rank][1] > 0],
-                          key=lambda k: PAY_TABLE[k][1], reverse=True)
+    # Paying categories, highest payout first
+    pay_rows = variant.pay_table_rows()
 
     # Prepare title
     # Use get_font directly here as it's a helper within the original class logic
     title_font = get_font(fonts_cfg.PAY_TABLE_FONT_SIZE + 2)
-    title_text = "--- Pay Table (Bet: 1) ---"
+    title_text = f"--- {variant.name} (Bet: 1) ---"
     title_surf = title_font.render(title_text, True, title_color)
     title_width = title_surf.get_width()
     current_y = y + line_height * 1.5 # Start below title
@@ -36,8 +35,7 @@ def draw_pay_table(surface: pygame.Surface, fonts: Dict[str, pygame.font.Font],
     max_name_width = 0
     max_payout_width = 0
 
-    for rank in sorted_ranks:
-        name, payout = PAY_TABLE[rank]
+    for rank, name, payout in pay_rows:
         name_surf = pay_table_font.render(name, True, text_color)
         payout_str = f"{payout}x"
         payout_surf = pay_table_font.render(payout_str, True, text_color)
@@ -56,7 +54,7 @@ def draw_pay_table(surface: pygame.Surface, fonts: Dict[str, pygame.font.Font],
     # Calculate total width and height for background
     total_content_width = max_name_width + column_spacing + colon_width + column_spacing + max_payout_width
     max_width = max(title_width, total_content_width)
-    total_height = (line_height * 1.5) + (len(sorted_ranks) * line_height) # Title + entries
+    total_height = (line_height * 1.5) + (len(pay_rows) * line_height) # Title + entries
 
     # Draw background rectangle
     bg_rect = pygame.Rect(x - padding, y - padding, max_width + 2 * padding, total_height + 2 * padding)
@@ -0,0 +1,47 @@
+# /renderer_functions/draw_replay_scrubber.py
+import pygame
+from typing import List
+
+import config_colors as colors
+import config_display as display
+from .draw_text import draw_text
+
+SCRUBBER_PANEL_HEIGHT = 34
+SCRUBBER_PANEL_ALPHA = 190 # Translucent, over the top of the game screen
+SCRUBBER_BAR_RECT = pygame.Rect(10, 22, display.SCREEN_WIDTH - 20, 8) # The timeline: frame 0 on the left
+SCRUBBER_HELP = "Space play  Left/Right round  ,/. frame  Up/Down speed  Esc quit"
+
+def scrubber_frame_at(x: int, last_frame: int) -> int:
+    """Returns the frame under x on the timeline of a recording with last_frame frames."""
+    fraction = (x - SCRUBBER_BAR_RECT.left) / SCRUBBER_BAR_RECT.width
+    return round(min(max(fraction, 0.0), 1.0) * (last_frame - 1))
+
+def _frame_x(frame: int, last_frame: int) -> int:
+    return SCRUBBER_BAR_RECT.left + round(max(frame, 0) / max(last_frame - 1, 1) * SCRUBBER_BAR_RECT.width)
+
+def draw_replay_scrubber(surface: pygame.Surface, font: pygame.font.Font, frame: int, last_frame: int,
+                         round_frames: List[int], keyframe_frames: List[int], rounds_played: int, money: int,
+                         speed: int, paused: bool):
+    """
+    Draws the replay timeline across the top of the screen: a tick per round
+    (gold) and per keyframe (grey), the playhead, and the position, money
+    (the panel covers the game's own display of it) and speed.
+    """
+    panel = pygame.Surface((display.SCREEN_WIDTH, SCRUBBER_PANEL_HEIGHT), pygame.SRCALPHA)
+    panel.fill((*colors.BLACK, SCRUBBER_PANEL_ALPHA))
+    surface.blit(panel, (0, 0))
+
+    status = "PAUSED" if paused else f"x{speed}"
+    draw_text(surface, f"Frame {max(frame, 0)}/{last_frame}  {max(frame, 0) / 30:.0f} s  "
+                       f"Round {rounds_played}/{len(round_frames)}  ${money}  {status}", font, 10, 3, colors.WHITE)
+    draw_text(surface, SCRUBBER_HELP, font, display.SCREEN_WIDTH - 10 - font.size(SCRUBBER_HELP)[0], 3, colors.GREY)
+
+    bar = SCRUBBER_BAR_RECT
+    pygame.draw.rect(surface, colors.BUTTON_OFF, bar)
+    # One tick per pixel column, however many rounds share it (sessions can have tens of thousands)
+    for x in {_frame_x(keyframe_frame, last_frame) for keyframe_frame in keyframe_frames}:
+        pygame.draw.line(surface, colors.GREY, (x, bar.top - 3), (x, bar.top - 1))
+    for x in {_frame_x(round_frame, last_frame) for round_frame in round_frames}:
+        pygame.draw.line(surface, colors.GOLD, (x, bar.top), (x, bar.bottom - 1))
+    playhead_x = _frame_x(frame, last_frame)
+    pygame.draw.rect(surface, colors.WHITE, (playhead_x - 2, bar.top - 4, 5, bar.height + 8))
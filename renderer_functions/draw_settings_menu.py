@@ -9,7 +9,7 @@ import config_layout_general as layout # Added
 from .draw_text import draw_text
 from .draw_button import draw_button
 
-def draw_settings_menu(surface: pygame.Surface, fonts: Dict[str, pygame.font.Font], sound_enabled: bool, volume_level: float, backdrop_image: Optional[pygame.Surface] = None):
+def draw_settings_menu(surface: pygame.Surface, fonts: Dict[str, pygame.font.Font], sound_enabled: bool, volume_level: float, backdrop_image: Optional[pygame.Surface] = None, poker_variant_name: str = ""):
     """Draws the settings menu screen."""
     if backdrop_image:
         surface.blit(backdrop_image, (0, 0))
@@ -50,6 +50,11 @@ def draw_settings_menu(surface: pygame.Surface, fonts: Dict[str, pygame.font.Fon
         text_y = layout.SOUND_TOGGLE_RECT.bottom + 30
         draw_text(surface, volume_text, fonts['message'], display.SCREEN_WIDTH // 2, text_y, colors.WHITE, center=True)
 
+    # Video Poker Variant Toggle (click to cycle)
+    if poker_variant_name:
+        draw_text(surface, f"Video Poker: {poker_variant_name}", fonts['button'], layout.POKER_VARIANT_TOGGLE_RECT.centerx, layout.POKER_VARIANT_TOGGLE_RECT.centery, colors.WHITE, center=True)
+        pygame.draw.rect(surface, colors.WHITE, layout.POKER_VARIANT_TOGGLE_RECT, 2, border_radius=5)
+
     # Back Button
     # Updated constants references
     draw_button(surface, fonts, "Back", layout.SETTINGS_BACK_BUTTON_RECT, colors.BUTTON_OFF, colors.WHITE)
@@ -1,22 +1,29 @@
 import pygame
-from typing import Dict
+from typing import Dict, Optional, Set
 
 import config_colors as colors
 import config_layout_cards as layout_cards
 from card import Card
 
-def get_card_image(card: Card, card_images: Dict[str, pygame.Surface]) -> pygame.Surface:
-    """Gets the pre-loaded image surface for a specific card."""
-    suit_map = {"♠": "S", "♥": "H", "♦": "D", "♣": "C"}
-    suit_short = suit_map.get(card.suit, '?')
-    key = f"{card.rank}{suit_short}"
+# Shared stand-in for missing images: built once, and each missing key is reported once
+_fallback_surface: Optional[pygame.Surface] = None
+_reported_missing: Set[str] = set()
+
+def _get_fallback_surface() -> pygame.Surface:
+    """A plain black card with a white border, created on first use."""
+    global _fallback_surface
+    if _fallback_surface is None:
+        _fallback_surface = pygame.Surface((layout_cards.CARD_WIDTH, layout_cards.CARD_HEIGHT))
+        _fallback_surface.fill(colors.BLACK)
+        pygame.draw.rect(_fallback_surface, colors.WHITE, _fallback_surface.get_rect(), 1) # Add border
+    return _fallback_surface
 
-    if key not in card_images:
-        print(f"Error: Image not found for card key: {key}")
-        # Return a blank surface or a default 'back' image if available
-        # Create a simple black rectangle as a fallback
-        fallback_surface = pygame.Surface((layout_cards.CARD_WIDTH, layout_cards.CARD_HEIGHT))
-        fallback_surface.fill(colors.BLACK)
-        pygame.draw.rect(fallback_surface, colors.WHITE, fallback_surface.get_rect(), 1) # Add border
-        return fallback_surface
-    return card_images[key]
+def get_card_image(card: Card, card_images: Dict[str, pygame.Surface]) -> pygame.Surface:
+    """Gets the pre-loaded image surface for a specific card (keyed by its precomputed image_key)."""
+    image = card_images.get(card.image_key)
+    if image is None:
+        if card.image_key not in _reported_missing:
+            _reported_missing.add(card.image_key)
+            print(f"Error: Image not found for card key: {card.image_key}")
+        return _get_fallback_surface()
+    return image
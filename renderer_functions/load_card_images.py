@@ -5,6 +5,8 @@ from typing import Dict
 
 import config_colors as colors
 import config_layout_cards as layout_cards
+from card import CARDS, JOKER
+from .get_font import get_font
 
 def load_card_images(path: str) -> Dict[str, pygame.Surface]:
     """Loads card images from the specified path."""
@@ -17,22 +19,17 @@ def load_card_images(path: str) -> Dict[str, pygame.Surface]:
         sys.exit()
 
     try:
-        # Standard ranks and suits for filenames
-        ranks = ['A', 'K', 'Q', 'J', 'T', '9', '8', '7', '6', '5', '4', '3', '2']
-        suits_short = ['S', 'H', 'D', 'C'] # Spades, Hearts, Diamonds, Clubs
-
-        for suit_short in suits_short:
-            for rank in ranks:
-                filename = f"{rank}{suit_short}.png"
-                filepath = os.path.join(path, filename)
-                if not os.path.isfile(filepath):
-                     print(f"Warning: Card image file not found: {filepath}")
-                     continue # Skip if a specific file is missing
-
-                img = pygame.image.load(filepath).convert_alpha()
-                # Scale image if needed (optional, adjust CARD_WIDTH/HEIGHT in constants)
-                img = pygame.transform.scale(img, (layout_cards.CARD_WIDTH, layout_cards.CARD_HEIGHT))
-                images[f"{rank}{suit_short}"] = img
+        # Filenames are the cards' precomputed image keys (e.g. "AS.png", "TH.png")
+        for card in CARDS:
+            filepath = os.path.join(path, f"{card.image_key}.png")
+            if not os.path.isfile(filepath):
+                 print(f"Warning: Card image file not found: {filepath}")
+                 continue # Skip if a specific file is missing
+
+            img = pygame.image.load(filepath).convert_alpha()
+            # Scale image if needed (optional, adjust CARD_WIDTH/HEIGHT in constants)
+            img = pygame.transform.scale(img, (layout_cards.CARD_WIDTH, layout_cards.CARD_HEIGHT))
+            images[card.image_key] = img
 
     except pygame.error as e:
         print(f"Error loading image: {e}")
@@ -40,11 +37,28 @@ def load_card_images(path: str) -> Dict[str, pygame.Surface]:
         pygame.quit()
         sys.exit()
 
-    if len(images) < 52:
-        print(f"Warning: Loaded only {len(images)} card images from {os.path.abspath(path)}. Expected 52.")
+    # Joker (Joker Poker): use JK.png if provided, otherwise draw a plain face
+    joker_path = os.path.join(path, f"{JOKER.image_key}.png")
+    if os.path.isfile(joker_path):
+        img = pygame.image.load(joker_path).convert_alpha()
+        images[JOKER.image_key] = pygame.transform.scale(img, (layout_cards.CARD_WIDTH, layout_cards.CARD_HEIGHT))
+    else:
+        images[JOKER.image_key] = _draw_joker_face()
+
+    if len(images) < 53:
+        print(f"Warning: Loaded only {len(images)} card images from {os.path.abspath(path)}. Expected 52 (plus the joker).")
         if not images: # Exit if no images loaded at all
              print("Error: No card images loaded. Exiting.")
              pygame.quit()
              sys.exit()
 
     return images
+
+def _draw_joker_face() -> pygame.Surface:
+    """Draws a simple joker card face for when no joker image is available."""
+    surface = pygame.Surface((layout_cards.CARD_WIDTH, layout_cards.CARD_HEIGHT))
+    surface.fill(colors.WHITE)
+    pygame.draw.rect(surface, colors.BLACK, surface.get_rect(), 2) # Border
+    text = get_font(layout_cards.CARD_WIDTH // 4).render("JOKER", True, colors.RED)
+    surface.blit(text, text.get_rect(center=surface.get_rect().center))
+    return surface
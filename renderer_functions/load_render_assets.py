@@ -0,0 +1,73 @@
+# /renderer_functions/load_render_assets.py
+import os
+import pygame
+from typing import Dict, Any
+
+import config_assets as assets
+import config_display as display
+import config_fonts as fonts_cfg
+from config_layout_slots import SLOT_SYMBOL_WIDTH, SLOT_SYMBOL_HEIGHT
+from .get_font import get_font
+from .load_card_images import load_card_images
+from .load_slot_images import load_slot_images
+
+SLOT_MACHINE_OVERLAY_SIZE = (1040, 750)
+
+def load_render_assets() -> Dict[str, Any]:
+    """
+    Loads the fonts and images every screen draws with (needs a display mode set).
+    Returns a dictionary with 'fonts', 'card_images', 'slot_images',
+    'slot_machine_overlay_image' and 'backdrop_image' (the last two may be None).
+    """
+    fonts = {
+        'money': get_font(fonts_cfg.MONEY_FONT_SIZE),
+        'message': get_font(fonts_cfg.MESSAGE_FONT_SIZE),
+        'pay_table': get_font(fonts_cfg.PAY_TABLE_FONT_SIZE),
+        'button': get_font(fonts_cfg.BUTTON_FONT_SIZE),
+        'result': get_font(fonts_cfg.RESULT_FONT_SIZE),
+        'multi_result': get_font(fonts_cfg.MULTI_RESULT_FONT_SIZE),
+        'hold': get_font(fonts_cfg.HOLD_FONT_SIZE),
+        'game_over_large': get_font(64),
+        'game_over_medium': get_font(32),
+        'fairness': get_font(fonts_cfg.FAIRNESS_FONT_SIZE),
+    }
+    card_images = load_card_images(assets.CARD_ASSET_PATH)
+    # Load Slot Images
+    slot_images = load_slot_images(assets.SLOTS_ASSET_PATH,
+                                   (SLOT_SYMBOL_WIDTH, SLOT_SYMBOL_HEIGHT))
+    # --- Load Slot Machine Overlay Image ---
+    slot_machine_overlay_image = None
+    overlay_path = os.path.join(assets.SLOTS_ASSET_PATH, "slotmachine_lion.png")
+    try:
+        if os.path.exists(overlay_path):
+            slot_machine_overlay_image = pygame.image.load(overlay_path).convert_alpha() # Use convert_alpha() for transparency
+            # Resize the image
+            slot_machine_overlay_image = pygame.transform.smoothscale(slot_machine_overlay_image, SLOT_MACHINE_OVERLAY_SIZE)
+            print(f"Loaded and resized slot machine overlay image from: {overlay_path}")
+        else:
+            print(f"Warning: Slot machine overlay image not found at {overlay_path}.")
+    except pygame.error as e:
+        print(f"Warning: Failed to load slot machine overlay image: {e}")
+
+    # --- Load Backdrop Image ---
+    backdrop_image = None
+    backdrop_path = os.path.join("assets", "menu", "backdrop.png")
+    try:
+        if os.path.exists(backdrop_path):
+            backdrop_image = pygame.image.load(backdrop_path).convert()
+            # Scale if necessary to fit the screen
+            if backdrop_image.get_size() != (display.SCREEN_WIDTH, display.SCREEN_HEIGHT):
+                backdrop_image = pygame.transform.scale(backdrop_image, (display.SCREEN_WIDTH, display.SCREEN_HEIGHT))
+            print(f"Loaded backdrop image from: {backdrop_path}")
+        else:
+            print(f"Warning: Backdrop image not found at {backdrop_path}. Menus will use default background.")
+    except pygame.error as e:
+        print(f"Warning: Failed to load backdrop image: {e}")
+
+    return {
+        'fonts': fonts,
+        'card_images': card_images,
+        'slot_images': slot_images,
+        'slot_machine_overlay_image': slot_machine_overlay_image,
+        'backdrop_image': backdrop_image,
+    }
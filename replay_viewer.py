@@ -0,0 +1,137 @@
+# /replay_viewer.py
+"""
+Replay viewer with a scrubber: plays a session recording (see
+session_recording.py) on screen and seeks anywhere in it. A seek restores the
+keyframe before the target and replays only the frames after it, so jumping
+around an hours-long session is as quick as jumping around a short one.
+
+Controls:
+  Space          play / pause
+  Left / Right   previous / next round (paused on its result)
+  , / .          one frame back / forward
+  Up / Down      faster / slower (1x to 64x the game's 30 FPS)
+  Home / End     start / end of the session
+  Click / drag   seek on the timeline
+  Esc            quit
+
+Usage:  python replay_viewer.py [RECORDING] [--round N]
+"""
+import argparse
+import glob
+import os
+from typing import Optional
+
+import pygame
+
+import config_display as display
+import config_rng as rng_cfg
+from renderer_functions.draw_frame import draw_frame
+from renderer_functions.draw_replay_scrubber import SCRUBBER_BAR_RECT, draw_replay_scrubber, scrubber_frame_at
+from renderer_functions.load_render_assets import load_render_assets
+from session_recording import SessionPlayer
+
+MAX_SPEED = 64
+SCRUB_HIT_MARGIN = 8 # Pixels above/below the timeline that still grab it
+
+def _previous_round(player: SessionPlayer):
+    """Seeks to the round before the one on screen (or the start)."""
+    round_number = player.rounds_played
+    if round_number and player.frame == player.round_frame(round_number):
+        round_number -= 1 # Already on that round's result: go one further back
+    if round_number >= 1:
+        player.seek_round(round_number)
+    else:
+        player.seek(-1)
+
+def run_viewer(path: str, start_round: Optional[int] = None):
+    """Opens the viewer window on a recording and runs it until closed."""
+    pygame.init()
+    screen = pygame.display.set_mode((display.SCREEN_WIDTH, display.SCREEN_HEIGHT))
+    pygame.display.set_caption(f"AceHigh Casino - replay of {os.path.basename(path)}")
+    render_assets = load_render_assets()
+    clock = pygame.time.Clock()
+    player = SessionPlayer(path, screen, render_assets['fonts'])
+    round_frames = player.recording["rounds"]
+    keyframe_frames = sorted(player.recording["keyframes"])
+    scrub_rect = SCRUBBER_BAR_RECT.inflate(0, 2 * SCRUB_HIT_MARGIN)
+
+    speed, paused, dragging = 1, False, False
+    if start_round is not None:
+        player.seek_round(start_round)
+        paused = True
+    try:
+        while True:
+            scrub_target = None
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                    return
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_SPACE:
+                        paused = not paused
+                    elif event.key == pygame.K_RIGHT:
+                        if player.rounds_played < player.num_rounds:
+                            player.seek_round(player.rounds_played + 1)
+                        paused = True
+                    elif event.key == pygame.K_LEFT:
+                        _previous_round(player)
+                        paused = True
+                    elif event.key == pygame.K_PERIOD:
+                        player.seek(player.frame + 1)
+                        paused = True
+                    elif event.key == pygame.K_COMMA:
+                        player.seek(player.frame - 1)
+                        paused = True
+                    elif event.key == pygame.K_UP:
+                        speed = min(speed * 2, MAX_SPEED)
+                    elif event.key == pygame.K_DOWN:
+                        speed = max(speed // 2, 1)
+                    elif event.key == pygame.K_HOME:
+                        player.seek(-1)
+                    elif event.key == pygame.K_END:
+                        player.seek(player.last_frame - 1)
+                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and scrub_rect.collidepoint(event.pos):
+                    dragging = True
+                    scrub_target = scrubber_frame_at(event.pos[0], player.last_frame)
+                elif event.type == pygame.MOUSEMOTION and dragging:
+                    scrub_target = scrubber_frame_at(event.pos[0], player.last_frame)
+                elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+                    dragging = False
+            # One seek per displayed frame, however many motion events the drag produced
+            if scrub_target is not None:
+                player.seek(scrub_target)
+
+            if not paused and not dragging:
+                for _ in range(speed):
+                    if player.finished():
+                        paused = True
+                        break
+                    player.step()
+                    player.end_frame()
+
+            draw_frame(screen, render_assets, player.game_state, player.game_state_manager)
+            draw_replay_scrubber(screen, render_assets['fonts']['fairness'], player.frame, player.last_frame,
+                                 round_frames, keyframe_frames, player.rounds_played, player.game_state_manager.money,
+                                 speed, paused)
+            pygame.display.flip()
+            clock.tick(30)
+    finally:
+        player.close()
+        pygame.quit()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Play back and scrub through a recorded session.")
+    parser.add_argument("recording", nargs="?", help="Recording (default: the newest in SESSION_RECORD_DIR)")
+    parser.add_argument("--round", type=int, default=None, help="Open paused on this round's result (from 1).")
+    args = parser.parse_args()
+
+    path = args.recording
+    if path is None:
+        found = sorted(glob.glob(os.path.join(rng_cfg.SESSION_RECORD_DIR, "*.jsonl")), key=os.path.getmtime)
+        if not found:
+            parser.error(f"no recordings in {rng_cfg.SESSION_RECORD_DIR}")
+        path = found[-1]
+    try:
+        run_viewer(path, args.round)
+    except IndexError as e: # --round past the last round
+        parser.error(str(e))
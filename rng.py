@@ -0,0 +1,233 @@
+# /rng.py
+"""
+Seedable random number service with named, independent streams.
+
+Every stream is derived from one master seed and a name (e.g. "blackjack" or
+"blackjack/table2") by hashing, so streams are reproducible, independent of each
+other, and independent of the order in which they are first used.
+
+- stream(name) returns a random.Random (Mersenne Twister, implemented in C) for
+  the per-event draws the games make: shuffles, reel stops, wheel spins. In
+  secure mode it returns a SecureRandom instead (see below).
+- HashDrawRandom(seed) is SecureRandom's deterministic counterpart: SHA-256 in
+  counter mode over a committed seed, for draws that must be redrawn to verify them.
+- spawn(count) returns child services with their own derived seeds, for
+  parallel workers (one child per worker process).
+- bulk_generator(name, jump) returns a NumPy Generator on PCG64 for bulk
+  simulation draws; `jump` advances it by jump * 2^127 draws, so workers sharing
+  a name get non-overlapping sequences without any coordination.
+"""
+import hashlib
+import os
+import random
+from array import array
+from typing import Any, Dict, List, Optional
+
+import config_rng as rng_cfg
+
+_RECIP_BPF = 2.0 ** -53 # Same float construction as random.random()
+
+def _import_numpy() -> Any:
+    """NumPy, imported on first use so the RNG (and the headless engine) load without it. None if missing."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+class SecureRandom(random.Random):
+    """
+    A random.Random drawing from os.urandom through a refillable buffer, so a
+    shuffle or spin costs one syscall per ENTROPY_BLOCK_SIZE bytes instead of
+    one per number. Bounded integers (randbelow, and through getrandbits also
+    randrange/choice/shuffle) use rejection sampling, so they are unbiased.
+    Not seedable. Each instance has its own buffer; use one per thread.
+    """
+
+    def __init__(self, block_size: int = rng_cfg.ENTROPY_BLOCK_SIZE):
+        self._block_size = block_size
+        self._buffer = b""
+        self._pos = 0
+        # Separate pool of 16-bit words for the small bounds of shuffles and spins
+        self._words = array('H')
+        self._word_pos = 0
+        super().__init__()
+
+    def seed(self, *args: Any, **kwargs: Any):
+        """Ignored: entropy always comes from the OS."""
+
+    def getstate(self):
+        raise NotImplementedError("SecureRandom has no reproducible state.")
+
+    def setstate(self, state: Any):
+        raise NotImplementedError("SecureRandom has no reproducible state.")
+
+    def _entropy(self, num_bytes: int) -> bytes:
+        return os.urandom(num_bytes)
+
+    def _take(self, num_bytes: int) -> int:
+        """Returns the next num_bytes of the buffer as an int, refilling it from the OS when short."""
+        pos = self._pos
+        end = pos + num_bytes
+        if end > len(self._buffer):
+            self._buffer = self._entropy(max(self._block_size, num_bytes))
+            pos, end = 0, num_bytes
+        self._pos = end
+        return int.from_bytes(self._buffer[pos:end], "little")
+
+    def getrandbits(self, k: int) -> int:
+        if k < 0:
+            raise ValueError("Number of bits must be non-negative.")
+        num_bytes = (k + 7) // 8
+        return self._take(num_bytes) >> (num_bytes * 8 - k)
+
+    def random(self) -> float:
+        return (self._take(7) >> 3) * _RECIP_BPF
+
+    def randbelow(self, n: int) -> int:
+        """Returns an unbiased int in [0, n) by rejection sampling."""
+        k = (n - 1).bit_length() # Fewest bits covering [0, n): at most half the draws are rejected
+        if k <= 16:
+            shift = 16 - k
+            words = self._words
+            pos = self._word_pos
+            while True:
+                if pos == len(words):
+                    words = self._words = array('H', self._entropy(self._block_size))
+                    pos = 0
+                r = words[pos] >> shift
+                pos += 1
+                if r < n:
+                    self._word_pos = pos
+                    return r
+        num_bytes = (k + 7) // 8
+        shift = num_bytes * 8 - k
+        r = self._take(num_bytes) >> shift
+        while r >= n:
+            r = self._take(num_bytes) >> shift
+        return r
+
+class HashDrawRandom(SecureRandom):
+    """
+    A SecureRandom whose bytes are SHA-256(seed || counter) blocks instead of
+    os.urandom: a cryptographic stream that the same seed always reproduces.
+    Used for the N-play draws of a secure-mode deck, from its committed draw
+    seed, so a revealed deck's extra hands can be redrawn to verify them.
+    """
+
+    def __init__(self, seed: int, block_size: int = rng_cfg.HASH_DRAW_BLOCK_SIZE):
+        self._seed_bytes = seed.to_bytes(32, "little") # Seeds up to 256 bits
+        self._counter = 0
+        super().__init__(block_size)
+
+    def _entropy(self, num_bytes: int) -> bytes:
+        blocks = []
+        for _ in range((num_bytes + 31) // 32):
+            blocks.append(hashlib.sha256(self._seed_bytes + self._counter.to_bytes(8, "little")).digest())
+            self._counter += 1
+        return b"".join(blocks)[:num_bytes]
+
+
+class RngService:
+    """A master seed plus lazily created named streams derived from it."""
+
+    def __init__(self, seed: Optional[int] = None, secure: bool = False):
+        # Unseeded services still pick a concrete seed, so any session can be replayed
+        self.seed: int = seed if seed is not None else int.from_bytes(os.urandom(8), "little")
+        # Secure services hand out SecureRandom streams; the seed then only drives bulk_generator
+        self.secure = secure
+        self._streams: Dict[str, random.Random] = {}
+
+    def derive_seed(self, name: str) -> int:
+        """Returns the 256-bit seed of the stream with the given name."""
+        digest = hashlib.sha256(f"{self.seed}/{name}".encode("utf-8")).digest()
+        return int.from_bytes(digest, "little")
+
+    def stream(self, name: str) -> random.Random:
+        """Returns the named stream, creating it on first use."""
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = SecureRandom() if self.secure else random.Random(self.derive_seed(name))
+            self._streams[name] = stream
+        return stream
+
+    def streams(self) -> Dict[str, random.Random]:
+        """Returns the streams created so far, by name."""
+        return dict(self._streams)
+
+    def getstate(self) -> Dict[str, Any]:
+        """
+        Returns the state of every stream created so far, to resume them later
+        with setstate(). Raises NotImplementedError in secure mode.
+        """
+        return {name: stream.getstate() for name, stream in self._streams.items()}
+
+    def setstate(self, states: Dict[str, Any]):
+        """Resumes the named streams from states returned by getstate() (on a service with the same seed)."""
+        for name, state in states.items():
+            self.stream(name).setstate(state)
+
+    def spawn(self, count: int, name: str = "worker") -> List["RngService"]:
+        """Returns `count` independent child services (e.g. one per worker process)."""
+        return [RngService(self.derive_seed(f"{name}/{i}"), self.secure) for i in range(count)]
+
+    def bulk_generator(self, name: str, jump: int = 0) -> Any:
+        """
+        Returns a NumPy Generator (PCG64) for the named stream, jumped ahead
+        `jump` times. Raises RuntimeError if NumPy is not installed.
+        """
+        np = _import_numpy()
+        if np is None:
+            raise RuntimeError("Bulk generators require NumPy.")
+        bit_generator = np.random.PCG64(self.derive_seed(name))
+        if jump:
+            bit_generator = bit_generator.jumped(jump)
+        return np.random.Generator(bit_generator)
+
+
+def _configured_seed() -> Optional[int]:
+    env_seed = os.environ.get(rng_cfg.RNG_SEED_ENV_VAR)
+    if env_seed:
+        return int(env_seed)
+    return rng_cfg.RNG_SEED
+
+def _configured_secure() -> bool:
+    return os.environ.get(rng_cfg.SECURE_RNG_ENV_VAR, "") == "1" or rng_cfg.SECURE_RNG
+
+_service = RngService(_configured_seed(), _configured_secure())
+
+def get_rng_service() -> RngService:
+    """Returns the process-wide RNG service."""
+    return _service
+
+def seed_rng(seed: Optional[int] = None, secure: Optional[bool] = None) -> RngService:
+    """
+    Replaces the process-wide service with a freshly seeded one (None: seed
+    from the OS). `secure` switches secure mode (None: keep the current mode).
+    """
+    global _service
+    _service = RngService(seed, _service.secure if secure is None else secure)
+    return _service
+
+def get_stream(name: str) -> random.Random:
+    """Returns the named stream of the process-wide service."""
+    return _service.stream(name)
+
+
+if __name__ == '__main__':
+    service = RngService(1234)
+    print(f"Seed {service.seed}")
+    print("blackjack:", [service.stream("blackjack").randrange(52) for _ in range(8)])
+    print("roulette: ", [service.stream("roulette").randrange(37) for _ in range(8)])
+    # Same seed and name -> same sequence, whatever else has been drawn
+    print("replayed: ", [RngService(1234).stream("blackjack").randrange(52) for _ in range(1)])
+    for i, child in enumerate(service.spawn(3)):
+        print(f"worker {i}:  ", [child.stream("sim").randrange(100) for _ in range(5)])
+    if _import_numpy() is not None:
+        for jump in range(3):
+            print(f"bulk jump {jump}:", service.bulk_generator("sim", jump).integers(0, 100, 5))
+    secure = RngService(secure=True).stream("roulette")
+    print("secure:   ", [secure.randbelow(37) for _ in range(8)])
+    # Same committed seed -> same draws
+    hashed, rehashed = HashDrawRandom(1234), HashDrawRandom(1234)
+    print("hash draw:", [hashed.randbelow(47) for _ in range(8)], [rehashed.randbelow(47) for _ in range(8)])
@@ -0,0 +1,338 @@
+# /rng_audit.py
+"""
+Streaming statistical audit of the game RNG paths.
+
+Streams outcomes from the same code the games use (Deck shuffles, spin_reels,
+spin_wheel) through:
+- chi-square goodness of fit (roulette pockets, reel stops, first card),
+- positional uniformity (deck: card x position contingency table),
+- lag-1 serial correlation,
+- a runs test above/below the median.
+
+Every statistic is an incremental accumulator of fixed size, so memory does
+not grow with the number of samples. Samples are split into jobs, each with
+its own stream spawned from the audit seed, and run on a process pool; the
+accumulators are merged and a JSON report is written.
+
+Run it with:  python rng_audit.py --samples 1000000 [--secure] [--report path]
+"""
+import argparse
+import json
+import math
+import time
+from multiprocessing import Pool, cpu_count
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from card import CARDS
+from deck import Deck
+from rng import RngService
+from roulette_rules import WHEEL_NUMBERS, spin_wheel
+from slots_rules import REEL_STRIPS, spin_reels
+
+AUDIT_SOURCES = ("deck", "roulette", "slots")
+DEFAULT_ALPHA = 0.001 # Significance level for pass/fail; expect about 1 false alarm per 1000 tests
+DEFAULT_JOB_SIZE = 50_000 # Samples per job
+REPORT_FILENAME = "rng_audit_report.json"
+
+# --- p-values (no SciPy needed) ---
+def _upper_gamma_regularized(a: float, x: float) -> float:
+    """Q(a, x) = Gamma(a, x) / Gamma(a): series for x < a + 1, continued fraction otherwise."""
+    if x <= 0:
+        return 1.0
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1:
+        term = total = 1.0 / a
+        n = a
+        while abs(term) > abs(total) * 1e-15:
+            n += 1
+            term *= x / n
+            total += term
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+    # Lentz's method
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 10_000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return math.exp(log_prefix) * h
+
+def chi_square_p_value(statistic: float, df: int) -> float:
+    """Probability of a chi-square statistic at least this large under the null hypothesis."""
+    return _upper_gamma_regularized(df / 2, statistic / 2)
+
+def normal_two_sided_p_value(z: float) -> float:
+    return math.erfc(abs(z) / math.sqrt(2))
+
+
+# --- Accumulators ---
+class ChiSquareAccumulator:
+    """Counts per bin, tested against expected bin probabilities."""
+
+    def __init__(self, probabilities: Sequence[float]):
+        self.probabilities = list(probabilities)
+        self.counts = [0] * len(self.probabilities)
+
+    def merge(self, other: "ChiSquareAccumulator"):
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+
+    def result(self) -> Dict[str, Any]:
+        n = sum(self.counts)
+        statistic = sum((count - n * p) ** 2 / (n * p) for count, p in zip(self.counts, self.probabilities) if p > 0)
+        df = sum(1 for p in self.probabilities if p > 0) - 1
+        return {"samples": n, "statistic": statistic, "df": df, "p_value": chi_square_p_value(statistic, df)}
+
+
+class ContingencyAccumulator:
+    """Counts per (row, column) cell, tested for independence (e.g. card x position)."""
+
+    def __init__(self, num_rows: int, num_cols: int):
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.counts = [0] * (num_rows * num_cols)
+
+    def merge(self, other: "ContingencyAccumulator"):
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+
+    def result(self) -> Dict[str, Any]:
+        cols = self.num_cols
+        row_sums = [sum(self.counts[r * cols:(r + 1) * cols]) for r in range(self.num_rows)]
+        col_sums = [sum(self.counts[c::cols]) for c in range(cols)]
+        n = sum(row_sums)
+        statistic = 0.0
+        for r, row_sum in enumerate(row_sums):
+            for c, col_sum in enumerate(col_sums):
+                expected = row_sum * col_sum / n
+                if expected > 0:
+                    statistic += (self.counts[r * cols + c] - expected) ** 2 / expected
+        df = (self.num_rows - 1) * (cols - 1)
+        return {"samples": n, "statistic": statistic, "df": df, "p_value": chi_square_p_value(statistic, df)}
+
+
+class SerialCorrelationAccumulator:
+    """Lag-1 serial correlation of a numeric sequence (pairs across merged jobs are not joined)."""
+
+    def __init__(self):
+        self.n = 0 # Pairs
+        self.sum_x = self.sum_y = self.sum_xx = self.sum_yy = self.sum_xy = 0.0
+        self.last: Optional[float] = None
+
+    def add(self, value: float):
+        last = self.last
+        if last is not None:
+            self.n += 1
+            self.sum_x += last
+            self.sum_y += value
+            self.sum_xx += last * last
+            self.sum_yy += value * value
+            self.sum_xy += last * value
+        self.last = value
+
+    def merge(self, other: "SerialCorrelationAccumulator"):
+        self.n += other.n
+        self.sum_x += other.sum_x
+        self.sum_y += other.sum_y
+        self.sum_xx += other.sum_xx
+        self.sum_yy += other.sum_yy
+        self.sum_xy += other.sum_xy
+
+    def result(self) -> Dict[str, Any]:
+        n = self.n
+        denominator = math.sqrt(max(n * self.sum_xx - self.sum_x ** 2, 0.0) * max(n * self.sum_yy - self.sum_y ** 2, 0.0))
+        r = (n * self.sum_xy - self.sum_x * self.sum_y) / denominator if denominator else 0.0
+        z = r * math.sqrt(n)
+        return {"samples": n, "statistic": r, "z": z, "p_value": normal_two_sided_p_value(z)}
+
+
+class RunsAccumulator:
+    """Wald–Wolfowitz runs test of values above vs. at-or-below a threshold."""
+
+    def __init__(self, threshold: float):
+        self.threshold = threshold
+        self.n_above = self.n_below = self.runs = 0
+        self.last_above: Optional[bool] = None
+        # Totals of finished segments (merged jobs): independent, so runs, means and variances add up
+        self.closed_n = self.closed_runs = 0
+        self.closed_mean = self.closed_variance = 0.0
+
+    def add(self, value: float):
+        above = value > self.threshold
+        if above:
+            self.n_above += 1
+        else:
+            self.n_below += 1
+        if above != self.last_above:
+            self.runs += 1
+            self.last_above = above
+
+    def _close_segment(self):
+        n1, n2 = self.n_above, self.n_below
+        n = n1 + n2
+        self.closed_n += n
+        self.closed_runs += self.runs
+        if n1 and n2:
+            self.closed_mean += 2 * n1 * n2 / n + 1
+            self.closed_variance += 2 * n1 * n2 * (2 * n1 * n2 - n) / (n * n * (n - 1))
+        else:
+            self.closed_mean += self.runs # A one-sided segment has exactly its runs (0 or 1)
+        self.n_above = self.n_below = self.runs = 0
+        self.last_above = None
+
+    def merge(self, other: "RunsAccumulator"):
+        self._close_segment()
+        other._close_segment()
+        self.closed_n += other.closed_n
+        self.closed_runs += other.closed_runs
+        self.closed_mean += other.closed_mean
+        self.closed_variance += other.closed_variance
+
+    def result(self) -> Dict[str, Any]:
+        self._close_segment()
+        z = (self.closed_runs - self.closed_mean) / math.sqrt(self.closed_variance) if self.closed_variance else 0.0
+        return {"samples": self.closed_n, "statistic": self.closed_runs, "expected": self.closed_mean, "z": z,
+                "p_value": normal_two_sided_p_value(z)}
+
+
+# --- Sources ---
+_CARD_POSITION = {card.code: card.index for card in CARDS}
+_SLOT_SYMBOLS = sorted({symbol for strip in REEL_STRIPS for symbol in strip})
+_POCKET_INDEX = {number: i for i, number in enumerate(sorted(WHEEL_NUMBERS))}
+
+def _new_accumulators(source: str) -> Dict[str, Any]:
+    if source == "deck":
+        return {
+            "first_card": ChiSquareAccumulator([1 / 52] * 52),
+            "card_position": ContingencyAccumulator(52, 52),
+            "serial_first_card": SerialCorrelationAccumulator(),
+            "runs_first_card": RunsAccumulator(25.5),
+        }
+    if source == "roulette":
+        return {
+            "pockets": ChiSquareAccumulator([1 / 37] * 37),
+            "serial": SerialCorrelationAccumulator(),
+            "runs": RunsAccumulator(18),
+        }
+    accumulators: Dict[str, Any] = {}
+    for reel, strip in enumerate(REEL_STRIPS):
+        accumulators[f"reel_{reel + 1}"] = ChiSquareAccumulator([strip.count(symbol) / len(strip) for symbol in _SLOT_SYMBOLS])
+    accumulators["serial_reel_1"] = SerialCorrelationAccumulator()
+    accumulators["runs_reel_1"] = RunsAccumulator((len(_SLOT_SYMBOLS) - 1) / 2)
+    return accumulators
+
+def _audit_job(task: Tuple[str, int, int, bool]) -> Dict[str, Any]:
+    """Worker: streams `count` outcomes of one source from its own seeded stream."""
+    source, count, seed, secure = task
+    rng = RngService(seed, secure).stream(f"audit/{source}")
+    accumulators = _new_accumulators(source)
+    if source == "deck":
+        first_card = accumulators["first_card"].counts
+        cells = accumulators["card_position"].counts
+        serial, runs = accumulators["serial_first_card"], accumulators["runs_first_card"]
+        for _ in range(count):
+            deck = Deck(rng=rng)
+            codes = deck.deal_codes(52)
+            first = _CARD_POSITION[codes[0]]
+            first_card[first] += 1
+            serial.add(first)
+            runs.add(first)
+            for position, code in enumerate(codes):
+                cells[_CARD_POSITION[code] * 52 + position] += 1
+    elif source == "roulette":
+        pockets = accumulators["pockets"].counts
+        serial, runs = accumulators["serial"], accumulators["runs"]
+        for _ in range(count):
+            number = spin_wheel(rng)
+            pockets[_POCKET_INDEX[number]] += 1
+            serial.add(number)
+            runs.add(number)
+    else:
+        symbol_index = {symbol: i for i, symbol in enumerate(_SLOT_SYMBOLS)}
+        reels = [accumulators[f"reel_{reel + 1}"].counts for reel in range(len(REEL_STRIPS))]
+        serial, runs = accumulators["serial_reel_1"], accumulators["runs_reel_1"]
+        for _ in range(count):
+            symbols = spin_reels(rng)
+            for reel, symbol in enumerate(symbols):
+                reels[reel][symbol_index[symbol]] += 1
+            first = symbol_index[symbols[0]]
+            serial.add(first)
+            runs.add(first)
+    return {"source": source, "accumulators": accumulators}
+
+def run_audit(samples: int, sources: Sequence[str] = AUDIT_SOURCES, seed: Optional[int] = None,
+              secure: bool = False, workers: Optional[int] = None, job_size: int = DEFAULT_JOB_SIZE,
+              alpha: float = DEFAULT_ALPHA) -> Dict[str, Any]:
+    """Runs the audit with `samples` outcomes per source and returns the report as a dict."""
+    start = time.perf_counter()
+    service = RngService(seed, secure)
+    tasks: List[Tuple[str, int, int, bool]] = []
+    for source in sources:
+        num_jobs = max(1, math.ceil(samples / job_size))
+        for i, child in enumerate(service.spawn(num_jobs, f"audit/{source}")):
+            count = min(job_size, samples - i * job_size)
+            tasks.append((source, count, child.seed, secure))
+
+    merged: Dict[str, Dict[str, Any]] = {}
+    with Pool(processes=workers or cpu_count()) as pool:
+        for done, job in enumerate(pool.imap_unordered(_audit_job, tasks), 1):
+            totals = merged.setdefault(job["source"], _new_accumulators(job["source"]))
+            for name, accumulator in job["accumulators"].items():
+                totals[name].merge(accumulator)
+            if done % 20 == 0:
+                print(f"  {done}/{len(tasks)} jobs ({time.perf_counter() - start:.0f}s)")
+
+    results = {}
+    for source in sources:
+        results[source] = {}
+        for name, accumulator in merged[source].items():
+            result = accumulator.result()
+            result["passed"] = result["p_value"] >= alpha
+            results[source][name] = result
+    return {
+        "samples_per_source": samples,
+        "seed": None if secure else service.seed,
+        "secure": secure,
+        "alpha": alpha,
+        "elapsed_seconds": time.perf_counter() - start,
+        "passed": all(r["passed"] for tests in results.values() for r in tests.values()),
+        "results": results,
+    }
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [f"RNG audit: {report['samples_per_source']} samples per source, "
+             f"{'secure' if report['secure'] else 'seed ' + str(report['seed'])}, alpha {report['alpha']}"]
+    for source, tests in report["results"].items():
+        for name, result in tests.items():
+            status = "PASS" if result["passed"] else "FAIL"
+            lines.append(f"  {source:<9} {name:<18} stat {result['statistic']:>14.4f}  p {result['p_value']:.4f}  {status}")
+    lines.append(f"Overall: {'PASS' if report['passed'] else 'FAIL'} ({report['elapsed_seconds']:.0f}s)")
+    return "\n".join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Statistical audit of the Deck, slots and roulette RNG paths.")
+    parser.add_argument("--samples", type=int, default=1_000_000, help="Outcomes per source.")
+    parser.add_argument("--sources", nargs="+", choices=AUDIT_SOURCES, default=list(AUDIT_SOURCES))
+    parser.add_argument("--seed", type=int, default=None, help="Audit seed (default: drawn from the OS).")
+    parser.add_argument("--secure", action="store_true", help="Audit the os.urandom (secure mode) streams.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores).")
+    parser.add_argument("--job-size", type=int, default=DEFAULT_JOB_SIZE, help="Samples per job.")
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA, help="Significance level.")
+    parser.add_argument("--report", default=REPORT_FILENAME, help="JSON report path.")
+    args = parser.parse_args()
+
+    report = run_audit(args.samples, args.sources, args.seed, args.secure, args.workers, args.job_size, args.alpha)
+    print(format_report(report))
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Report written to {args.report}")
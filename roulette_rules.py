@@ -1,5 +1,9 @@
 # /roulette_rules.py
-from typing import Dict, Tuple, Set, Any
+import random
+from typing import Dict, List, Optional, Tuple, Set, Any
+
+import config_rng as rng_cfg
+from rng import get_stream
 
 # --- Bet Types ---
 # Using strings for bet keys for easy storage in game_state
@@ -26,6 +30,14 @@ RED_NUMBERS: Set[int] = {1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30,
 BLACK_NUMBERS: Set[int] = {2, 4, 6, 8, 10, 11, 13, 15, 17, 20, 22, 24, 26, 28, 29, 31, 33, 35}
 GREEN_NUMBER: Set[int] = {0}
 
+# --- Wheel ---
+# Pockets in wheel order (single-zero European wheel); the layout config and renderer use this order too
+WHEEL_NUMBERS: List[int] = [0, 32, 15, 19, 4, 21, 2, 25, 17, 34, 6, 27, 13, 36, 11, 30, 8, 23, 10, 5, 24, 16, 33, 1, 20, 14, 31, 9, 22, 18, 29, 7, 28, 12, 35, 3, 26]
+
+def spin_wheel(rng: Optional[random.Random] = None) -> int:
+    """Spins the wheel (with the "roulette" stream by default) and returns the winning number."""
+    return (rng or get_stream(rng_cfg.STREAM_ROULETTE)).choice(WHEEL_NUMBERS)
+
 # --- Bet Definitions (Mapping bet keys to winning numbers) ---
 # This helps determine if a bet wins based on the winning number.
 # We can generate this dynamically or define it explicitly. Let's define some common ones.
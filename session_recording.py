@@ -0,0 +1,505 @@
+# /session_recording.py
+"""
+Deterministic session recording and replay.
+
+Everything a session does follows from the RNG master seed (see rng.py) and
+the actions InputHandler.handle_events returned on each frame: step_game is
+the only thing that changes the game state. A recording is a JSON-lines file:
+- a "session" header: seed, starting money and the initial sound settings,
+- a "frame" record per frame that had input: frame number, milliseconds since
+  the start, and the actions,
+- a "round" record on the frame each round is played (the rounds of the
+  fairness session log, numbered from 1),
+- a "checkpoint" record every CHECKPOINT_FRAMES frames: the bankroll and a
+  digest of the game state,
+- a "keyframe" record every KEYFRAME_FRAMES frames, pointing into a sidecar
+  .keyframes file holding a compressed snapshot of the whole session: game
+  state, bankroll, round count, RNG stream states and the shuffle/outcome queue
+  positions,
+- an "end" record when the session closes: frame count, bankroll and digest.
+
+Replay starts a new session from the header, feeds the recorded actions to
+step_game on the same frames, and checks every checkpoint and the end record.
+Without rendering it runs as fast as the state machine allows; with --render
+it draws every frame on screen at --speed times the game's 30 FPS.
+
+Seeking (SessionPlayer.seek, --round, and the scrubber in replay_viewer.py)
+restores the keyframe at or before the target, found by arithmetic on the
+frame number (and the round index), and replays at most KEYFRAME_FRAMES frames
+from there. Snapshots are pickles: only seek in recordings you trust. Plain
+replay never reads them.
+
+Sessions in secure RNG mode cannot be replayed and are not recorded.
+
+Usage:  python session_recording.py [RECORDING] [--render] [--speed 4] [--round N] [--check-keyframes]
+"""
+import argparse
+import glob
+import hashlib
+import io
+import json
+import os
+import pickle
+import random
+import time
+import zlib
+from array import array
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+import pygame
+
+import config_display as display
+import config_rng as rng_cfg
+from deck import Deck
+from fairness import Commitment, get_outcome_queue_states, get_session_log, restore_outcome_queues, set_session_log
+from game_state import GameState, STARTING_MONEY
+from game_functions.load_sounds import load_sounds
+from game_functions.new_game_state import new_game_state
+from game_functions.step_game import step_game
+from renderer_functions.draw_frame import draw_frame
+from renderer_functions.load_render_assets import load_render_assets
+from rng import RngService, get_rng_service, get_stream, seed_rng
+from shuffle_queue import (ShuffleQueue, get_shuffle_queue, get_shuffle_queue_states, get_shuffle_queue_stream_names,
+                           restore_shuffle_queues, stop_shuffle_queues)
+
+RECORDING_VERSION = 1
+# Fairness reveals carry random salts, which differ on every run; the spinning reels
+# are a cosmetic animation the renderer advances (replays may not render)
+DIGEST_EXCLUDED_KEYS = ('fair_reveal', 'slots_reel_positions')
+# Flags main.py clears after each frame once it has reloaded sounds / applied the volume
+SOUND_FLAGS = ('sound_setting_changed', 'volume_changed')
+
+# --- State Digest ---
+def _canonical(obj: Any) -> Any:
+    """JSON stand-in for the non-JSON values in the game state."""
+    if isinstance(obj, Enum):
+        return obj.name
+    if isinstance(obj, (array, memoryview)):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    if isinstance(obj, Commitment):
+        return obj.payload # The digest depends on the salt; the payload doesn't
+    if isinstance(obj, Deck):
+        return {"position": obj.position, "remaining": len(obj), "commitment": obj.commitment}
+    slots = getattr(type(obj), "__slots__", None)
+    if slots: # Engine rounds (see engine/)
+        return {name: getattr(obj, name, None) for name in slots}
+    return type(obj).__name__
+
+def state_digest(game_state: Dict[str, Any], game_state_manager: GameState) -> str:
+    """SHA-256 of the game state and bankroll, identical for identical sessions."""
+    state = {key: value for key, value in game_state.items() if key not in DIGEST_EXCLUDED_KEYS}
+    state["_bankroll"] = vars(game_state_manager)
+    encoded = json.dumps(state, default=_canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+# --- Snapshots ---
+class _SnapshotPickler(pickle.Pickler):
+    """Pickles the shared RNG streams and shuffle queues the state refers to by name, not by value."""
+
+    def __init__(self, file: io.BytesIO, service: RngService):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self._stream_names = {id(stream): name for name, stream in service.streams().items()}
+
+    def persistent_id(self, obj: Any) -> Optional[Tuple]:
+        if isinstance(obj, random.Random):
+            name = self._stream_names.get(id(obj))
+            return None if name is None else ("stream", name)
+        if isinstance(obj, ShuffleQueue):
+            return ("shuffle_queue", obj.stream_name, obj.num_decks, obj.num_jokers)
+        return None
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Resolves the references _SnapshotPickler wrote against the (restored) RNG service and queues."""
+
+    def persistent_load(self, pid: Tuple) -> Any:
+        if pid[0] == "stream":
+            return get_stream(pid[1])
+        if pid[0] == "shuffle_queue":
+            return get_shuffle_queue(*pid[1:])
+        raise pickle.UnpicklingError(f"unknown reference {pid!r}")
+
+def take_snapshot(game_state: Dict[str, Any], game_state_manager: GameState) -> bytes:
+    """
+    Returns a compressed snapshot of the session: game state, bankroll, rounds
+    played and the RNG position (stream states, shuffle and outcome queues).
+    Raises NotImplementedError in secure mode, which can't be restored.
+    """
+    service = get_rng_service()
+    if service.secure:
+        raise NotImplementedError("Secure RNG sessions can't be snapshotted.")
+    # The queue workers' own streams are saved as the queue positions (their live state is ahead of them)
+    worker_streams = get_shuffle_queue_stream_names()
+    streams = {name: state for name, state in service.getstate().items() if name not in worker_streams}
+    state_file = io.BytesIO()
+    _SnapshotPickler(state_file, service).dump((game_state, game_state_manager))
+    snapshot = {"rounds": get_session_log().rounds, "streams": streams, "shuffle_queues": get_shuffle_queue_states(),
+                "outcome_queues": get_outcome_queue_states(), "state": state_file.getvalue()}
+    return zlib.compress(pickle.dumps(snapshot, pickle.HIGHEST_PROTOCOL))
+
+def restore_snapshot(snapshot: bytes, seed: int) -> Tuple[Dict[str, Any], GameState]:
+    """
+    Restores a session from take_snapshot() in a service seeded with the
+    session's seed. Returns the game state and bankroll; the rest is restored in place.
+    """
+    snapshot = pickle.loads(zlib.decompress(snapshot))
+    seed_rng(seed, secure=False).setstate(snapshot["streams"])
+    restore_shuffle_queues(snapshot["shuffle_queues"])
+    restore_outcome_queues(snapshot["outcome_queues"])
+    set_session_log(None).rounds = snapshot["rounds"]
+    # Loaded last: it refers to the restored streams and queues
+    game_state, game_state_manager = _SnapshotUnpickler(io.BytesIO(snapshot["state"])).load()
+    return game_state, game_state_manager
+
+# --- Recording ---
+class SessionRecorder:
+    """
+    Writes one session's recording (see the module docstring). Call record()
+    once per frame, after step_game, and close() when the session ends.
+    A recorder with no path records nothing.
+    """
+
+    def __init__(self, path: Optional[str], seed: int, sound_enabled: bool, volume_level: float,
+                 starting_money: int = STARTING_MONEY):
+        self.path = path
+        self.frame = 0
+        self.rounds = 0
+        self._start = time.perf_counter()
+        self._file = None
+        self._keyframe_file = None
+        if path is not None:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            keyframe_path = os.path.splitext(path)[0] + ".keyframes"
+            self._file = open(path, "w", encoding="utf-8", buffering=1) # Line-buffered: survives a crash
+            self._keyframe_file = open(keyframe_path, "wb")
+            self._write({"type": "session", "version": RECORDING_VERSION, "seed": seed, "starting_money": starting_money,
+                         "sound_enabled": sound_enabled, "volume_level": volume_level,
+                         "keyframes": os.path.basename(keyframe_path), "keyframe_frames": rng_cfg.KEYFRAME_FRAMES,
+                         "started": time.strftime("%Y-%m-%dT%H:%M:%S")})
+
+    def _write(self, record: Dict[str, Any]):
+        if self._file is not None:
+            self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def record(self, actions: List[Tuple[str, Optional[Any]]], game_state: Dict[str, Any], game_state_manager: GameState):
+        """
+        Records the frame's actions (if any) and the rounds played on it, a
+        checkpoint every CHECKPOINT_FRAMES frames and a keyframe every KEYFRAME_FRAMES.
+        """
+        if self._file is None:
+            return
+        if actions:
+            self._write({"type": "frame", "frame": self.frame, "t": round((time.perf_counter() - self._start) * 1000),
+                         "actions": [list(action) for action in actions]})
+        rounds = get_session_log().rounds
+        while self.rounds < rounds:
+            self.rounds += 1
+            self._write({"type": "round", "round": self.rounds, "frame": self.frame})
+        if self.frame % rng_cfg.CHECKPOINT_FRAMES == rng_cfg.CHECKPOINT_FRAMES - 1:
+            self._write({"type": "checkpoint", "frame": self.frame, "money": game_state_manager.money,
+                         "digest": state_digest(game_state, game_state_manager)})
+        if self.frame % rng_cfg.KEYFRAME_FRAMES == rng_cfg.KEYFRAME_FRAMES - 1:
+            snapshot = take_snapshot(game_state, game_state_manager)
+            offset = self._keyframe_file.tell()
+            self._keyframe_file.write(snapshot)
+            self._keyframe_file.flush() # Before the record pointing at it
+            self._write({"type": "keyframe", "frame": self.frame, "round": self.rounds, "offset": offset, "size": len(snapshot)})
+        self.frame += 1
+
+    def close(self, game_state: Dict[str, Any], game_state_manager: GameState):
+        """Writes the end record (the state after the last recorded frame) and closes the file."""
+        if self._file is None:
+            return
+        self._write({"type": "end", "frames": self.frame, "money": game_state_manager.money,
+                     "digest": state_digest(game_state, game_state_manager)})
+        self._file.close()
+        self._file = None
+        self._keyframe_file.close()
+        self._keyframe_file = None
+
+def _default_record_path() -> Optional[str]:
+    env_path = os.environ.get(rng_cfg.SESSION_RECORD_ENV_VAR)
+    if env_path:
+        return None if env_path == "0" else env_path
+    filename = time.strftime("session_%Y%m%d_%H%M%S") + f"_{os.getpid()}.jsonl"
+    return os.path.join(rng_cfg.SESSION_RECORD_DIR, filename)
+
+def start_recording(seed: int, secure: bool, sound_enabled: bool, volume_level: float) -> SessionRecorder:
+    """Starts recording the session at the default path (none in secure mode, which can't be replayed)."""
+    return SessionRecorder(None if secure else _default_record_path(), seed, sound_enabled, volume_level)
+
+# --- Replay ---
+def load_recording(path: str) -> Dict[str, Any]:
+    """
+    Reads a recording: returns its header, the actions and checkpoints by frame
+    number, the frame of each round (rounds[n - 1] for round n), the keyframe
+    records by frame number, and the end record (None if the session didn't close).
+    """
+    header, end = None, None
+    frames: Dict[int, List[Tuple[str, Optional[Any]]]] = {}
+    checkpoints: Dict[int, Dict[str, Any]] = {}
+    rounds: List[int] = []
+    keyframes: Dict[int, Dict[str, Any]] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            kind = record["type"]
+            if kind == "session":
+                header = record
+            elif kind == "frame":
+                frames[record["frame"]] = [tuple(action) for action in record["actions"]]
+            elif kind == "round":
+                rounds.append(record["frame"])
+            elif kind == "checkpoint":
+                checkpoints[record["frame"]] = record
+            elif kind == "keyframe":
+                keyframes[record["frame"]] = record
+            elif kind == "end":
+                end = record
+    if header is None:
+        raise ValueError(f"{path}: not a session recording (no header)")
+    if header["version"] != RECORDING_VERSION:
+        raise ValueError(f"{path}: recording version {header['version']}, expected {RECORDING_VERSION}")
+    return {"header": header, "frames": frames, "checkpoints": checkpoints, "rounds": rounds,
+            "keyframes": keyframes, "end": end}
+
+class SessionPlayer:
+    """
+    Plays a recording back through step_game one frame at a time, and seeks to
+    any frame or round from the nearest keyframe before it. `frame` is the last
+    frame played (-1 before the first); game_state and game_state_manager are
+    the session as it was right after that frame.
+    """
+
+    def __init__(self, path: str, screen: Optional[pygame.Surface] = None,
+                 fonts: Optional[Dict[str, pygame.font.Font]] = None):
+        self.path = path
+        self.recording = load_recording(path)
+        self.header = self.recording["header"]
+        end = self.recording["end"]
+        self.last_frame = end["frames"] if end is not None else max([*self.recording["frames"],
+                                                                     *self.recording["checkpoints"]], default=-1) + 1
+        self.screen = screen
+        self.fonts = fonts
+        self.sounds = load_sounds(False)
+        self._keyframe_path = None
+        if self.header.get("keyframes"):
+            self._keyframe_path = os.path.join(os.path.dirname(path), self.header["keyframes"])
+        self.restart()
+
+    @property
+    def num_rounds(self) -> int:
+        return len(self.recording["rounds"])
+
+    @property
+    def rounds_played(self) -> int:
+        """Rounds played up to the current frame."""
+        return get_session_log().rounds
+
+    def finished(self) -> bool:
+        """True once the session has quit or every recorded frame has been played."""
+        return self.frame + 1 >= self.last_frame or not self.game_state['running']
+
+    def restart(self):
+        """Starts the session over from its header (before frame 0)."""
+        seed_rng(self.header["seed"], secure=False)
+        set_session_log(None) # The original session already logged its commitments
+        self.game_state = new_game_state(self.header["sound_enabled"], self.header["volume_level"])
+        self.game_state_manager = GameState(starting_money=self.header["starting_money"])
+        self.frame = -1
+
+    def step(self):
+        """Plays the next recorded frame."""
+        self.frame += 1
+        self.game_state, self.game_state_manager = step_game(self.recording["frames"].get(self.frame, []), self.game_state,
+                                                             self.game_state_manager, self.sounds, self.screen, self.fonts)
+
+    def end_frame(self):
+        """Call after each step, once the frame is checked or drawn: clears the flags main.py applies each frame."""
+        for flag in SOUND_FLAGS:
+            self.game_state[flag] = False
+
+    def keyframe_at_or_before(self, frame: int) -> Optional[Dict[str, Any]]:
+        """The keyframe record of the latest keyframe taken at or before `frame` (None: start from the header)."""
+        interval = self.header.get("keyframe_frames")
+        if not interval or self._keyframe_path is None:
+            return None
+        keyframes = self.recording["keyframes"]
+        keyframe_frame = (frame + 1) // interval * interval - 1 # Keyframes are taken after frames interval-1, 2*interval-1, ...
+        while keyframe_frame >= 0:
+            keyframe = keyframes.get(keyframe_frame)
+            if keyframe is not None:
+                return keyframe
+            keyframe_frame -= interval # Missing (e.g. a truncated file): try the one before
+        return None
+
+    def restore(self, keyframe: Dict[str, Any], end_frame: bool = True):
+        """
+        Restores the session as it was after the keyframe's frame. With
+        end_frame=False the frame's sound flags are left set, as they were when
+        its checkpoint digest was taken (call end_frame() before stepping on).
+        """
+        with open(self._keyframe_path, "rb") as f:
+            f.seek(keyframe["offset"])
+            snapshot = f.read(keyframe["size"])
+        self.game_state, self.game_state_manager = restore_snapshot(snapshot, self.header["seed"])
+        self.frame = keyframe["frame"]
+        if end_frame:
+            self.end_frame()
+
+    def seek(self, frame: int):
+        """
+        Moves to right after `frame` (clamped to the recording): restores the
+        nearest keyframe at or before it, unless the current frame is closer,
+        and plays the frames in between.
+        """
+        frame = max(-1, min(frame, self.last_frame - 1))
+        keyframe = self.keyframe_at_or_before(frame)
+        if frame < self.frame or (keyframe is not None and keyframe["frame"] > self.frame):
+            if keyframe is None:
+                self.restart()
+            else:
+                self.restore(keyframe)
+        while self.frame < frame and not self.finished():
+            self.step()
+            self.end_frame()
+
+    def round_frame(self, round_number: int) -> int:
+        """The frame round `round_number` (from 1) was played on. Raises IndexError if there is no such round."""
+        if not 1 <= round_number <= self.num_rounds:
+            raise IndexError(f"round {round_number} not in the recording (1-{self.num_rounds})")
+        return self.recording["rounds"][round_number - 1]
+
+    def seek_round(self, round_number: int):
+        """Moves to right after round `round_number` was played (its result on screen)."""
+        self.seek(self.round_frame(round_number))
+
+    def close(self):
+        stop_shuffle_queues()
+
+def replay_session(path: str, render: bool = False, speed: float = 1.0) -> Dict[str, Any]:
+    """
+    Replays a recording through step_game and checks its checkpoints and end record.
+    Returns a report: frames replayed, elapsed time, final money and digest, and errors.
+    """
+    screen, render_assets, clock = None, None, None
+    if render:
+        pygame.init()
+        screen = pygame.display.set_mode((display.SCREEN_WIDTH, display.SCREEN_HEIGHT))
+        pygame.display.set_caption(f"AceHigh Casino - replay x{speed:g}")
+        render_assets = load_render_assets()
+        clock = pygame.time.Clock()
+    player = SessionPlayer(path, screen, render_assets['fonts'] if render else None)
+    checkpoints, end = player.recording["checkpoints"], player.recording["end"]
+
+    errors: List[str] = []
+    start = time.perf_counter()
+    try:
+        while not player.finished():
+            player.step()
+            checkpoint = checkpoints.get(player.frame)
+            if checkpoint is not None:
+                digest = state_digest(player.game_state, player.game_state_manager)
+                if digest != checkpoint["digest"] or player.game_state_manager.money != checkpoint["money"]:
+                    errors.append(f"frame {player.frame}: state diverged from the recording "
+                                  f"(money {player.game_state_manager.money}, recorded {checkpoint['money']})")
+                    break # Everything after the first divergence differs too
+            if not player.game_state['running']:
+                break
+            player.end_frame()
+            if render:
+                if any(event.type == pygame.QUIT for event in pygame.event.get()):
+                    errors.append(f"frame {player.frame}: replay stopped from the window")
+                    break
+                draw_frame(screen, render_assets, player.game_state, player.game_state_manager)
+                pygame.display.flip()
+                clock.tick(30 * speed)
+    finally:
+        player.close()
+        if render:
+            pygame.quit()
+    elapsed = time.perf_counter() - start
+
+    replayed = player.frame + 1
+    money = player.game_state_manager.money
+    digest = state_digest(player.game_state, player.game_state_manager)
+    if end is not None and not errors:
+        if replayed != end["frames"]:
+            errors.append(f"session ended after {replayed} frames, recorded {end['frames']}")
+        if money != end["money"]:
+            errors.append(f"final money {money}, recorded {end['money']}")
+        if digest != end["digest"]:
+            errors.append("final state digest differs from the recording")
+    return {"path": path, "frames": replayed, "actions": sum(len(actions) for actions in player.recording["frames"].values()),
+            "checkpoints": len(checkpoints), "rounds": player.num_rounds, "elapsed_seconds": elapsed, "money": money,
+            "digest": digest, "complete": end is not None, "errors": errors}
+
+def check_keyframes(path: str) -> List[str]:
+    """Restores every keyframe of a recording and checks it against the checkpoint of its frame. Returns errors."""
+    player = SessionPlayer(path)
+    errors: List[str] = []
+    try:
+        for keyframe_frame, keyframe in sorted(player.recording["keyframes"].items()):
+            player.restore(keyframe, end_frame=False) # The checkpoint digest was taken before the flags were cleared
+            checkpoint = player.recording["checkpoints"].get(keyframe_frame)
+            if checkpoint is None:
+                errors.append(f"keyframe at frame {keyframe_frame}: no checkpoint to check it against")
+            elif state_digest(player.game_state, player.game_state_manager) != checkpoint["digest"]:
+                errors.append(f"keyframe at frame {keyframe_frame}: restored state differs from the recording")
+            elif player.rounds_played != keyframe["round"]:
+                errors.append(f"keyframe at frame {keyframe_frame}: {player.rounds_played} rounds, recorded {keyframe['round']}")
+    finally:
+        player.close()
+    return errors
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Replay a recorded session and check it reproduces.")
+    parser.add_argument("recording", nargs="?", help="Recording (default: the newest in SESSION_RECORD_DIR)")
+    parser.add_argument("--render", action="store_true", help="Draw the replay on screen.")
+    parser.add_argument("--speed", type=float, default=1.0, help="Playback speed with --render (4 = 4x the game's 30 FPS).")
+    parser.add_argument("--round", type=int, default=None, help="Seek to this round (from 1) instead and print the session there.")
+    parser.add_argument("--check-keyframes", action="store_true", help="Also check that every keyframe restores its checkpoint.")
+    args = parser.parse_args()
+
+    path = args.recording
+    if path is None:
+        found = sorted(glob.glob(os.path.join(rng_cfg.SESSION_RECORD_DIR, "*.jsonl")), key=os.path.getmtime)
+        if not found:
+            parser.error(f"no recordings in {rng_cfg.SESSION_RECORD_DIR}")
+        path = found[-1]
+
+    if args.round is not None:
+        player = SessionPlayer(path)
+        try:
+            start = time.perf_counter()
+            player.seek_round(args.round)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            keyframe = player.keyframe_at_or_before(player.frame)
+            print(f"Round {args.round} of {player.num_rounds}: frame {player.frame} "
+                  f"({player.frame / 30:.0f} s into the session), reached in {elapsed_ms:.1f} ms "
+                  f"from {'the keyframe at frame ' + str(keyframe['frame']) if keyframe else 'the start'}")
+            print(f"  state {player.game_state['current_state']}, money ${player.game_state_manager.money}")
+            print(f"  message: {player.game_state.get('result_message') or player.game_state.get('message')}")
+            print(f"  state digest {state_digest(player.game_state, player.game_state_manager)}")
+        except IndexError as e:
+            parser.error(str(e))
+        finally:
+            player.close()
+        raise SystemExit(0)
+
+    report = replay_session(path, args.render, args.speed)
+    if args.check_keyframes:
+        report["errors"] += check_keyframes(path)
+    status = "FAIL" if report["errors"] else "PASS"
+    fps = report["frames"] / report["elapsed_seconds"] if report["elapsed_seconds"] else 0.0
+    print(f"{status} {path}: {report['frames']} frames ({report['frames'] / 30:.0f} s of play), {report['actions']} actions, "
+          f"{report['rounds']} rounds, {report['checkpoints']} checkpoints, replayed in {report['elapsed_seconds']:.2f} s ({fps:,.0f} frames/s); "
+          f"final money ${report['money']}")
+    if not report["complete"]:
+        print("  The session did not close (no end record): only its checkpoints were checked.")
+    for error in report["errors"]:
+        print(f"  {error}")
+    raise SystemExit(1 if status == "FAIL" else 0)
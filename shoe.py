@@ -0,0 +1,155 @@
+import random
+from array import array
+from typing import Any, Dict, List, Optional
+
+import config_rng as rng_cfg
+from card import Card, RANKS, card_rank_index
+from deck import Deck, fresh_codes
+from rng import get_stream
+from shuffle_queue import ShuffleQueue
+
+class Shoe(Deck):
+    """
+    A multi-deck shoe (e.g. 6 decks for Blackjack, 8 for Baccarat) with a cut card.
+
+    The shoe is kept across rounds instead of building a new deck every hand.
+    Once the cut card has come out, start_round() reshuffles before the next
+    round, as at a real table. The shoe also keeps running per-rank counts of
+    the undealt cards for analytics and hints.
+
+    rank_counts is the exact count of undealt cards: it already excludes a
+    face-down card such as the dealer's hole card, so it is for analytics only.
+    Hints and counting use rank_composition(), the cards a player can't see yet
+    (undealt or dealt face down and not yet revealed).
+    """
+
+    def __init__(self, num_decks: int = 6, penetration: float = 0.75, rng: Optional[random.Random] = None,
+                 shuffle_queue: Optional[ShuffleQueue] = None, codes: Optional[array] = None):
+        """
+        Initializes a shuffled shoe of num_decks decks. `penetration` is the
+        fraction of the shoe dealt before the cut card comes out. With a
+        shuffle_queue (of the same number of decks), reshuffles pop a
+        pre-shuffled permutation, and its commitment, instead of shuffling on the spot.
+        `codes` supplies the first shoe order (e.g. a row of deck_batch.shuffled_batch),
+        used as-is; later reshuffles shuffle as usual.
+        """
+        if num_decks < 1:
+            raise ValueError("A shoe needs at least one deck.")
+        if not 0.0 < penetration <= 1.0:
+            raise ValueError("Penetration must be in (0, 1].")
+        self.num_decks = num_decks
+        self.penetration = penetration
+        self.cut_card_position = int(52 * num_decks * penetration)
+        self.num_shuffles = 0 # Completed shuffles, for stats
+        if shuffle_queue is not None and (shuffle_queue.num_decks, shuffle_queue.num_jokers) != (num_decks, 0):
+            raise ValueError("Shuffle queue does not match the shoe size.")
+        self._shuffle_queue = shuffle_queue
+        self.commitment: Optional[Any] = None # fairness.Commitment of the current shoe order, if any
+        self.retired_commitments: List[Any] = [] # Commitments of reshuffled-away shoes, not yet revealed
+        # Same layout as Deck: a fixed array of card codes plus a deal cursor
+        self._rng = rng or get_stream(rng_cfg.STREAM_DECK)
+        if codes is None:
+            self._codes = fresh_codes(num_decks)
+            self._view = memoryview(self._codes)
+            self.reshuffle()
+        else:
+            if len(codes) != 52 * num_decks:
+                raise ValueError(f"A {num_decks}-deck shoe needs {52 * num_decks} cards, got {len(codes)}.")
+            self._codes = codes
+            self._view = memoryview(self._codes)
+            self._cursor = 0
+            self._reset_counts()
+
+    def _reset_counts(self):
+        """Starts the counts of a freshly shuffled shoe (cut card back in, every card undealt)."""
+        self.num_shuffles += 1
+        self.rank_counts: List[int] = [4 * self.num_decks] * len(RANKS) # Undealt cards per rank index
+        self.face_down_codes: List[int] = [] # Dealt face down and not yet revealed (see reveal)
+
+    def reshuffle(self):
+        """Gathers every card back into the shoe, shuffles it and resets the counts."""
+        self._cursor = 0
+        if self.commitment is not None:
+            self.retired_commitments.append(self.commitment) # Safe to reveal now: no card of it is dealt again
+        if self._shuffle_queue is not None:
+            self._codes, self.commitment = self._shuffle_queue.get()
+            self._view = memoryview(self._codes)
+        else:
+            self.shuffle()
+            self.commitment = None
+        self._reset_counts()
+
+    def take_retired_commitments(self) -> List[Any]:
+        """Returns and clears the commitments of the shoes retired since the last call."""
+        retired, self.retired_commitments = self.retired_commitments, []
+        return retired
+
+    def cut_card_reached(self) -> bool:
+        """True once the cut card has come out (the shoe is reshuffled before the next round)."""
+        return self._cursor >= self.cut_card_position
+
+    def start_round(self) -> bool:
+        """Call before dealing a round: reshuffles if the cut card is out. Returns True if it reshuffled."""
+        if self.cut_card_reached():
+            self.reshuffle()
+            return True
+        return False
+
+    def deal_codes(self, num_cards: int = 1) -> memoryview:
+        """Deals cards as integer codes (see Deck.deal_codes), updating the rank counts."""
+        if num_cards > len(self):
+            # Only possible with a very deep cut card: reshuffle mid-round rather than fail
+            self.reshuffle()
+        codes = super().deal_codes(num_cards)
+        rank_counts = self.rank_counts
+        for code in codes:
+            rank_counts[card_rank_index(code)] -= 1
+        return codes
+
+    def deal(self, num_cards: int = 1, face_down: bool = False) -> List[Card]:
+        """
+        Deals cards from the shoe (same contract as Deck.deal), updating the rank
+        counts. Cards dealt face_down stay unseen in rank_composition() until reveal().
+        """
+        if num_cards > len(self):
+            self.reshuffle()
+        cards = super().deal(num_cards)
+        rank_counts = self.rank_counts
+        for card in cards:
+            rank_counts[card_rank_index(card.code)] -= 1
+        if face_down:
+            self.face_down_codes.extend(card.code for card in cards)
+        return cards
+
+    def reveal(self, cards: List[Card]):
+        """Turns face-down cards over: from now on rank_composition() counts them as seen."""
+        for card in cards:
+            if card.code in self.face_down_codes: # Not if the shoe was reshuffled since (a new shoe has none)
+                self.face_down_codes.remove(card.code)
+
+    def rank_composition(self) -> Dict[str, int]:
+        """
+        Returns the number of cards per rank a player hasn't seen (e.g. {'2': 24, ..., 'A': 23}):
+        the undealt cards plus those dealt face down and not yet revealed. Hints use this.
+        """
+        unseen = list(self.rank_counts)
+        for code in self.face_down_codes:
+            unseen[card_rank_index(code)] += 1
+        return {rank: count for rank, count in zip(RANKS, unseen)}
+
+    def decks_remaining(self) -> float:
+        """Undealt cards, in decks (used e.g. to turn a running count into a true count)."""
+        return len(self) / 52
+
+
+if __name__ == '__main__':
+    shoe = Shoe(num_decks=6, penetration=0.75, rng=random.Random(1))
+    print(f"{len(shoe)} cards, cut card at {shoe.cut_card_position}")
+    rounds = 0
+    while not shoe.cut_card_reached():
+        shoe.start_round()
+        shoe.deal(5)
+        rounds += 1
+    print(f"Cut card out after {rounds} rounds ({len(shoe)} cards left, {shoe.decks_remaining():.2f} decks)")
+    print(f"Composition: {shoe.rank_composition()}")
+    print(f"Reshuffled at next round: {shoe.start_round()} ({len(shoe)} cards, {shoe.num_shuffles} shuffles)")
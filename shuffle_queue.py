@@ -0,0 +1,199 @@
+# /shuffle_queue.py
+"""
+Background pre-shuffled deck queue.
+
+A ShuffleQueue keeps a few shuffled permutations of one card set (a 52-card
+deck, a 53-card Joker Poker deck, a 6-deck shoe, ...) ready in a bounded queue,
+refilled by a daemon thread. Starting a round then pops a ready permutation
+instead of shuffling at the moment the player clicks DEAL.
+
+Each queue's worker is the only user of its own RNG stream (derived from the
+game's stream name and the card set), so the sequence of permutations depends
+only on the seed, never on thread timing: seeded sessions stay reproducible.
+
+The worker also computes each permutation's provably-fair commitment (see
+fairness.py), so it is ready to show before the round that will use it.
+
+A queue's position can be saved (getstate) and resumed (restore_shuffle_queues)
+for session snapshots: the next permutation itself, plus the state of the
+stream after drawing it, from which the worker draws all the following ones.
+"""
+import queue
+import threading
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+import config_rng as rng_cfg
+from deck import Deck, fresh_codes, shuffle_codes
+from fairness import Commitment, deck_payload
+from rng import RngService, get_rng_service
+
+class ShuffleQueue:
+    """A bounded queue of shuffled permutations of one card set, refilled in the background."""
+
+    def __init__(self, stream_name: str, num_decks: int = 1, num_jokers: int = 0,
+                 maxsize: int = rng_cfg.SHUFFLE_QUEUE_SIZE, service: Optional[RngService] = None,
+                 state: Optional[Tuple[array, Commitment, Any]] = None):
+        """`state` (from getstate()) resumes a saved queue instead of starting from the stream's seed."""
+        self.service = service or get_rng_service()
+        self.stream_name = stream_name
+        self.num_decks = num_decks
+        self.num_jokers = num_jokers
+        self._template = fresh_codes(num_decks, num_jokers)
+        # Dedicated stream: nothing else draws from it, so the permutation order is deterministic
+        self.rng_stream_name = f"{stream_name}/shuffles/{num_decks}x{num_jokers}"
+        self._rng = self.service.stream(self.rng_stream_name)
+        # Items are (codes, commitment, stream state after drawing them)
+        self._queue: "queue.Queue[Tuple[array, Commitment, Any]]" = queue.Queue(maxsize)
+        self._next: Optional[Tuple[array, Commitment, Any]] = None # Taken off the queue by peek()
+        if state is not None:
+            self._next = state
+            self._rng.setstate(state[2])
+        self._stop = threading.Event()
+        self._wake = threading.Event() # Set when the consumer is waiting: skips the worker's refill delay
+        self._thread = threading.Thread(target=self._fill, name=f"shuffle-{stream_name}", daemon=True)
+        self._thread.start()
+
+    def _fill(self):
+        """Worker: shuffles and commits permutations in order until stopped, blocking while the queue is full."""
+        while not self._stop.is_set():
+            codes = array('I', self._template)
+            shuffle_codes(codes, 0, self._rng)
+            secure = self.service.secure
+            draw_seed = self._rng.getrandbits(rng_cfg.SECURE_DRAW_SEED_BITS if secure else rng_cfg.DRAW_SEED_BITS)
+            # Secure streams have no state to save (secure sessions are never snapshotted)
+            rng_state = None if secure else self._rng.getstate()
+            payload = deck_payload(codes, self.num_decks, self.num_jokers, draw_seed, hash_draws=secure)
+            item = (codes, Commitment(payload), rng_state)
+            while not self._stop.is_set():
+                try:
+                    self._queue.put(item, timeout=0.5)
+                    break
+                except queue.Full:
+                    continue
+            # A put usually follows a get() on the main thread: yield briefly so the
+            # next shuffle does not compete for the GIL with the round being dealt
+            self._wake.wait(rng_cfg.SHUFFLE_REFILL_DELAY)
+            self._wake.clear()
+
+    def peek(self) -> Tuple[array, Commitment]:
+        """Returns the next permutation and its commitment without taking it (single consumer)."""
+        if self._next is None:
+            if self._queue.empty():
+                self._wake.set() # Nothing to yield to (e.g. a replay dealing at full speed)
+            self._next = self._queue.get()
+        return self._next[0], self._next[1]
+
+    def peek_commitment(self) -> Commitment:
+        """The commitment of the permutation the next get() will return."""
+        return self.peek()[1]
+
+    def get(self) -> Tuple[array, Commitment]:
+        """
+        Pops the next shuffled permutation and its commitment, waiting for the
+        worker only if none is ready yet.
+        """
+        item = self.peek()
+        self._next = None
+        return item
+
+    def next_deck(self) -> Deck:
+        """Returns a Deck dealing the next shuffled permutation, carrying its commitment."""
+        codes, commitment = self.get()
+        return Deck(self.num_jokers, codes=codes, commitment=commitment)
+
+    def getstate(self) -> Tuple[array, Commitment, Any]:
+        """
+        The queue's position: the next permutation, its commitment and the stream
+        state after it. A queue created with it deals the same permutations from there on.
+        Raises NotImplementedError in secure mode.
+        """
+        if self.service.secure:
+            raise NotImplementedError("Secure shuffle queues have no reproducible state.")
+        self.peek()
+        return self._next
+
+    def ready(self) -> int:
+        """Number of permutations waiting in the queue."""
+        return self._queue.qsize() + (self._next is not None)
+
+    def stop(self):
+        """Stops the worker thread (it exits within its put timeout)."""
+        self._stop.set()
+        self._wake.set()
+
+
+# --- Shared Queues ---
+_queues: Dict[Tuple[str, int, int], ShuffleQueue] = {}
+
+def get_shuffle_queue(stream_name: str, num_decks: int = 1, num_jokers: int = 0) -> ShuffleQueue:
+    """
+    Returns the shared queue for a game stream and card set, starting it on
+    first use. A queue created before the RNG service was reseeded (rng.seed_rng)
+    is replaced, so every permutation comes from the current seed.
+    """
+    key = (stream_name, num_decks, num_jokers)
+    shuffle_queue = _queues.get(key)
+    if shuffle_queue is None or shuffle_queue.service is not get_rng_service():
+        if shuffle_queue is not None:
+            shuffle_queue.stop()
+        shuffle_queue = ShuffleQueue(stream_name, num_decks, num_jokers)
+        _queues[key] = shuffle_queue
+    return shuffle_queue
+
+def get_shuffle_queue_states() -> Dict[Tuple[str, int, int], Tuple[array, Commitment, Any]]:
+    """Returns the position (see ShuffleQueue.getstate) of every shared queue."""
+    return {key: shuffle_queue.getstate() for key, shuffle_queue in _queues.items()}
+
+def get_shuffle_queue_stream_names() -> List[str]:
+    """Names of the RNG streams the shared queues' workers draw from (their positions replace their states)."""
+    return [shuffle_queue.rng_stream_name for shuffle_queue in _queues.values()]
+
+def restore_shuffle_queues(states: Dict[Tuple[str, int, int], Tuple[array, Commitment, Any]]):
+    """
+    Replaces the shared queues with ones resumed from get_shuffle_queue_states(),
+    on the current RNG service (seeded as when the states were saved).
+    """
+    stop_shuffle_queues()
+    for key, state in states.items():
+        stream_name, num_decks, num_jokers = key
+        _queues[key] = ShuffleQueue(stream_name, num_decks, num_jokers, state=state)
+
+def stop_shuffle_queues():
+    """Stops every shared queue's worker (e.g. at shutdown)."""
+    for shuffle_queue in _queues.values():
+        shuffle_queue.stop()
+    _queues.clear()
+
+
+if __name__ == '__main__':
+    import time
+    from rng import seed_rng
+
+    seed_rng(42)
+    poker_queue = get_shuffle_queue(rng_cfg.STREAM_POKER)
+    time.sleep(0.05) # Let the worker fill the queue
+    start = time.perf_counter()
+    hands = [poker_queue.next_deck().deal(5) for _ in range(poker_queue.ready())]
+    elapsed_us = (time.perf_counter() - start) * 1e6 / len(hands)
+    print(f"{len(hands)} ready decks, {elapsed_us:.1f} us per pop-and-deal")
+    print("first hand:", " ".join(f"{card.rank}{card.suit}" for card in hands[0]))
+    print("next commitment:", poker_queue.peek_commitment().digest)
+
+    # Reseeding replaces the queue, and the same seed gives the same permutations
+    seed_rng(42)
+    replayed = get_shuffle_queue(rng_cfg.STREAM_POKER).next_deck().deal(5)
+    print("replayed:  ", " ".join(f"{card.rank}{card.suit}" for card in replayed))
+
+    # Secure mode: the workers must keep dealing (their streams have no state to save)
+    seed_rng(secure=True)
+    secure_queues = [get_shuffle_queue(rng_cfg.STREAM_POKER), get_shuffle_queue(rng_cfg.STREAM_BLACKJACK, 6)]
+    deadline = time.perf_counter() + 2.0
+    while time.perf_counter() < deadline and not all(q.ready() for q in secure_queues):
+        time.sleep(0.01)
+    if not all(q.ready() for q in secure_queues):
+        raise SystemExit("secure mode: shuffle queue worker produced nothing")
+    secure_hand = secure_queues[0].next_deck().deal(5)
+    print("secure:    ", " ".join(f"{card.rank}{card.suit}" for card in secure_hand),
+          f"({len(secure_queues[1].next_deck())}-card shoe)")
+    stop_shuffle_queues()
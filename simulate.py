@@ -0,0 +1,310 @@
+# /simulate.py
+"""
+Parallel simulation farm for every game.
+
+Plays N rounds of a game with a fixed strategy through the headless engine
+(engine/, the round logic behind the game_functions round functions), split
+into jobs on a process pool. Each job plays with its own RNG service spawned
+from the simulation seed, so a run is reproducible for a given seed and job
+size, whatever the number of workers.
+
+A job returns a histogram of the money paid back per round. Histograms merge
+exactly, and the return to player (RTP), hit frequency (rounds paying anything
+back), variance per unit bet and a normal confidence interval for the RTP are
+computed from the merged histogram.
+
+Usage:  python simulate.py blackjack --rounds 1000000 [--strategy basic] [--seed 7]
+        python simulate.py draw_poker --variant bonus_poker --strategy simple
+        python simulate.py all --rounds 200000 [--report sim.json]
+"""
+import argparse
+import collections
+import json
+import math
+import time
+from multiprocessing import Pool, cpu_count
+from statistics import NormalDist
+from typing import Any, Callable, Counter, Dict, List, Optional, Sequence, Tuple
+
+import config_actions as actions
+import config_rng as rng_cfg
+from baccarat_rules import BET_BANKER, BET_PLAYER, BET_TIE, SHOE_NUM_DECKS as BACCARAT_SHOE_DECKS, SHOE_PENETRATION as BACCARAT_PENETRATION
+from blackjack_rules import SHOE_NUM_DECKS as BLACKJACK_SHOE_DECKS, SHOE_PENETRATION as BLACKJACK_PENETRATION
+from card import Card
+from deck import Deck
+from game_state import GameState
+from rng import RngService
+from shoe import Shoe
+from slots_rules import SLOTS_COST_PER_SPIN
+
+DEFAULT_JOB_SIZE = 50_000 # Rounds per job
+DEFAULT_CONFIDENCE = 0.95
+MULTI_POKER_HANDS = 3 # As config_layout_cards.NUM_MULTI_HANDS (that module needs pygame)
+_BANKROLL = 10 ** 15 # Never runs out; only the change per round is measured
+
+# --- Strategies ---
+def _hard_total(hand: Sequence[Card]) -> int:
+    return sum(1 if card.blackjack_value == 11 else card.blackjack_value for card in hand)
+
+def _blackjack_basic(player_hand: Sequence[Card], upcard: Card) -> bool:
+    """Basic strategy for a game with hit and stand only (no doubles or splits). True to hit."""
+    hard = _hard_total(player_hand)
+    up = upcard.blackjack_value # Ace counts 11
+    if hard <= 11 and any(card.blackjack_value == 11 for card in player_hand): # Soft total
+        soft = hard + 10
+        return soft <= 17 or (soft == 18 and up >= 9)
+    if hard <= 11:
+        return True
+    if hard == 12:
+        return not 4 <= up <= 6
+    if hard <= 16:
+        return up >= 7
+    return False
+
+def _blackjack_dealer(player_hand: Sequence[Card], upcard: Card) -> bool:
+    """Mimic the dealer: hit below 17."""
+    hard = _hard_total(player_hand)
+    total = hard + 10 if hard <= 11 and any(card.blackjack_value == 11 for card in player_hand) else hard
+    return total < 17
+
+def _blackjack_never_bust(player_hand: Sequence[Card], upcard: Card) -> bool:
+    """Hit only while no card can bust the hand."""
+    return _hard_total(player_hand) <= 11
+
+BLACKJACK_STRATEGIES: Dict[str, Callable[[Sequence[Card], Card], bool]] = {
+    "basic": _blackjack_basic,
+    "dealer": _blackjack_dealer,
+    "never_bust": _blackjack_never_bust,
+}
+
+def _poker_optimal(hand: Sequence[Card]) -> List[int]:
+    """The optimal Jacks or Better hold, from the offline strategy database."""
+    from poker_strategy import lookup_best_hold
+    result = lookup_best_hold(hand)
+    if result is None:
+        from poker_ev import best_hold # Not in the database: solve it on the spot (slow)
+        result = best_hold(hand)
+    return result[0]
+
+def _poker_simple(hand: Sequence[Card]) -> List[int]:
+    """Hold every paired rank; without a pair, hold the Jacks or better."""
+    counts = collections.Counter(card.rank for card in hand)
+    held = [i for i, card in enumerate(hand) if counts[card.rank] >= 2]
+    return held or [i for i, card in enumerate(hand) if card.rank in "JQKA"]
+
+POKER_STRATEGIES: Dict[str, Callable[[Sequence[Card]], List[int]]] = {
+    "optimal": _poker_optimal,
+    "simple": _poker_simple,
+}
+
+BACCARAT_STRATEGIES = {"banker": BET_BANKER, "player": BET_PLAYER, "tie": BET_TIE}
+ROULETTE_STRATEGIES = {"red": {"color_red": 1}, "straight_17": {"number_17": 1}, "dozen": {"dozen_2": 1}}
+
+# --- Round Loops (one per game) ---
+# Each plays `rounds` rounds and counts the money paid back per round in `returns`.
+
+def _run_poker(num_hands: int) -> Callable[..., None]:
+    def run(service: RngService, strategy: str, variant_key: str, rounds: int, returns: Counter[int]):
+        from engine import poker as poker_engine
+        from poker_variants import get_variant
+        if strategy == "optimal":
+            from poker_strategy import load_strategy_db
+            load_strategy_db()
+        choose_hold = POKER_STRATEGIES[strategy]
+        num_jokers = get_variant(variant_key).num_jokers
+        deck_rng, draw_rng = service.stream(rng_cfg.STREAM_POKER), service.stream(f"{rng_cfg.STREAM_POKER}/draw")
+        bankroll = GameState(_BANKROLL)
+        for _ in range(rounds):
+            money = bankroll.money
+            rnd, _ = poker_engine.new_round(bankroll, variant_key, num_hands, Deck(num_jokers, deck_rng))
+            for index in choose_hold(rnd.hand):
+                poker_engine.act(rnd, bankroll, actions.ACTION_HOLD_TOGGLE, index)
+            poker_engine.resolve(rnd, bankroll, draw_rng)
+            returns[bankroll.money - money + num_hands] += 1
+    return run
+
+def _run_blackjack(service: RngService, strategy: str, variant_key: str, rounds: int, returns: Counter[int]):
+    from engine import blackjack as blackjack_engine
+    hits = BLACKJACK_STRATEGIES[strategy]
+    shoe = Shoe(BLACKJACK_SHOE_DECKS, BLACKJACK_PENETRATION, rng=service.stream(rng_cfg.STREAM_BLACKJACK))
+    bankroll = GameState(_BANKROLL)
+    hit, stand = actions.ACTION_BLACKJACK_HIT, actions.ACTION_BLACKJACK_STAND
+    for _ in range(rounds):
+        money = bankroll.money
+        rnd, _ = blackjack_engine.new_round(bankroll, shoe)
+        upcard = rnd.dealer_hand[1] # The dealer's first card is the hole card
+        while not rnd.finished:
+            blackjack_engine.act(rnd, bankroll, hit if hits(rnd.player_hand, upcard) else stand)
+        returns[bankroll.money - money + rnd.bet] += 1
+
+def _run_baccarat(service: RngService, strategy: str, variant_key: str, rounds: int, returns: Counter[int]):
+    from engine import baccarat as baccarat_engine
+    bet_type = BACCARAT_STRATEGIES[strategy]
+    shoe = Shoe(BACCARAT_SHOE_DECKS, BACCARAT_PENETRATION, rng=service.stream(rng_cfg.STREAM_BACCARAT))
+    bankroll = GameState(_BANKROLL)
+    for _ in range(rounds):
+        money = bankroll.money
+        rnd, _ = baccarat_engine.new_round(bankroll, bet_type, 1, shoe)
+        baccarat_engine.resolve(rnd, bankroll)
+        returns[bankroll.money - money + 1] += 1
+
+def _run_roulette(service: RngService, strategy: str, variant_key: str, rounds: int, returns: Counter[int]):
+    from engine import roulette as roulette_engine
+    bets = ROULETTE_STRATEGIES[strategy]
+    total_bet = sum(bets.values())
+    rng = service.stream(rng_cfg.STREAM_ROULETTE)
+    bankroll = GameState(_BANKROLL)
+    for _ in range(rounds):
+        money = bankroll.money
+        rnd, _ = roulette_engine.new_round(bankroll, bets, rng)
+        roulette_engine.resolve(rnd, bankroll)
+        returns[bankroll.money - money + total_bet] += 1
+
+def _run_slots(service: RngService, strategy: str, variant_key: str, rounds: int, returns: Counter[int]):
+    from engine import slots as slots_engine
+    rng = service.stream(rng_cfg.STREAM_SLOTS)
+    bankroll = GameState(_BANKROLL)
+    for _ in range(rounds):
+        money = bankroll.money
+        rnd, _ = slots_engine.new_round(bankroll, SLOTS_COST_PER_SPIN, rng)
+        slots_engine.resolve(rnd, bankroll)
+        returns[bankroll.money - money + SLOTS_COST_PER_SPIN] += 1
+
+# Game name -> (round loop, bet per round, strategies, default strategy)
+GAMES: Dict[str, Tuple[Callable[..., None], int, Sequence[str], str]] = {
+    "draw_poker": (_run_poker(1), 1, tuple(POKER_STRATEGIES), "optimal"),
+    "multi_poker": (_run_poker(MULTI_POKER_HANDS), MULTI_POKER_HANDS, tuple(POKER_STRATEGIES), "optimal"),
+    "blackjack": (_run_blackjack, 1, tuple(BLACKJACK_STRATEGIES), "basic"),
+    "baccarat": (_run_baccarat, 1, tuple(BACCARAT_STRATEGIES), "banker"),
+    "roulette": (_run_roulette, 1, tuple(ROULETTE_STRATEGIES), "red"),
+    "slots": (_run_slots, SLOTS_COST_PER_SPIN, ("spin",), "spin"),
+}
+
+# --- Jobs and Aggregation ---
+def _simulate_job(task: Tuple[str, str, str, int, int]) -> Dict[str, Any]:
+    """Worker: plays `rounds` rounds of one game with its own spawned RNG service."""
+    game, strategy, variant_key, rounds, seed = task
+    returns: Counter[int] = collections.Counter()
+    GAMES[game][0](RngService(seed), strategy, variant_key, rounds, returns)
+    return {"game": game, "returns": returns}
+
+def summarize(returns: Counter[int], bet: int, confidence: float = DEFAULT_CONFIDENCE) -> Dict[str, Any]:
+    """
+    RTP, hit frequency and variance per unit bet from a histogram of the money
+    paid back per round, with a normal confidence interval for the RTP.
+    """
+    rounds = sum(returns.values())
+    total_return = sum(value * count for value, count in returns.items())
+    total_squares = sum(value * value * count for value, count in returns.items()) # Exact (Python ints)
+    rtp = total_return / (rounds * bet)
+    # Sample variance of the return per unit bet
+    variance = (total_squares - total_return * total_return / rounds) / (rounds - 1) / (bet * bet) if rounds > 1 else 0.0
+    half_width = NormalDist().inv_cdf(0.5 + confidence / 2) * math.sqrt(variance / rounds)
+    hits = sum(count for value, count in returns.items() if value > 0)
+    return {
+        "rounds": rounds,
+        "bet_per_round": bet,
+        "rtp": rtp,
+        "hit_frequency": hits / rounds,
+        "variance": variance,
+        "std_dev": math.sqrt(variance),
+        "confidence": confidence,
+        "rtp_low": rtp - half_width,
+        "rtp_high": rtp + half_width,
+        "max_return": max(returns),
+    }
+
+def run_simulation(games: Sequence[str], rounds: int, strategies: Optional[Dict[str, str]] = None,
+                   variant_key: Optional[str] = None, seed: Optional[int] = None, workers: Optional[int] = None,
+                   job_size: int = DEFAULT_JOB_SIZE, confidence: float = DEFAULT_CONFIDENCE) -> Dict[str, Any]:
+    """Simulates `rounds` rounds of each game on a process pool and returns the report as a dict."""
+    from poker_variants import DEFAULT_VARIANT
+    start = time.perf_counter()
+    strategies = strategies or {}
+    variant_key = variant_key or DEFAULT_VARIANT
+    service = RngService(seed)
+    tasks: List[Tuple[str, str, str, int, int]] = []
+    for game in games:
+        strategy = strategies.get(game, GAMES[game][3])
+        num_jobs = max(1, math.ceil(rounds / job_size))
+        for i, child in enumerate(service.spawn(num_jobs, f"simulate/{game}")):
+            tasks.append((game, strategy, variant_key, min(job_size, rounds - i * job_size), child.seed))
+
+    merged: Dict[str, Counter[int]] = {game: collections.Counter() for game in games}
+    with Pool(processes=workers or cpu_count()) as pool:
+        for done, job in enumerate(pool.imap_unordered(_simulate_job, tasks), 1):
+            merged[job["game"]].update(job["returns"])
+            if done % 20 == 0:
+                print(f"  {done}/{len(tasks)} jobs ({time.perf_counter() - start:.0f}s)")
+
+    results = {}
+    for game in games:
+        result = summarize(merged[game], GAMES[game][1], confidence)
+        result["strategy"] = strategies.get(game, GAMES[game][3])
+        if game.endswith("_poker"):
+            result["variant"] = variant_key
+        results[game] = result
+    return {"seed": service.seed, "job_size": job_size, "elapsed_seconds": time.perf_counter() - start, "results": results}
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [f"Simulation: seed {report['seed']}, {report['elapsed_seconds']:.1f}s"]
+    for game, result in report["results"].items():
+        strategy = result["strategy"] + (f", {result['variant']}" if "variant" in result else "")
+        lines.append(f"  {game:<12} {result['rounds']:>11,} rounds ({strategy})  RTP {result['rtp']:.4%} "
+                     f"[{result['rtp_low']:.4%}, {result['rtp_high']:.4%}] at {result['confidence']:.0%}  "
+                     f"hit {result['hit_frequency']:.2%}  var {result['variance']:.3f}  sd {result['std_dev']:.3f}")
+    return "\n".join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Simulate any game for N rounds with a fixed strategy.")
+    parser.add_argument("game", choices=list(GAMES) + ["all"], help="Game to simulate ('all': every game, default strategies).")
+    parser.add_argument("--rounds", type=int, default=1_000_000, help="Rounds per game.")
+    parser.add_argument("--strategy", default=None, help="Strategy (default: the game's first listed below).")
+    parser.add_argument("--variant", default=None, help="Video poker variant (poker_variants.VARIANTS key).")
+    parser.add_argument("--seed", type=int, default=None, help="Simulation seed (default: drawn from the OS).")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores).")
+    parser.add_argument("--job-size", type=int, default=DEFAULT_JOB_SIZE, help="Rounds per job.")
+    parser.add_argument("--confidence", type=float, default=DEFAULT_CONFIDENCE, help="Confidence level of the RTP interval.")
+    parser.add_argument("--report", default=None, help="Also write the report as JSON to this path.")
+    parser.epilog = "Strategies: " + "; ".join(f"{game}: {', '.join(spec[2])}" for game, spec in GAMES.items())
+    args = parser.parse_args()
+    if args.rounds < 1:
+        parser.error("--rounds must be positive")
+    if args.job_size < 1:
+        parser.error("--job-size must be positive")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be positive")
+    if not 0.0 < args.confidence < 1.0:
+        parser.error("--confidence must be between 0 and 1")
+
+    games = list(GAMES) if args.game == "all" else [args.game]
+    strategies: Dict[str, str] = {}
+    if args.strategy is not None:
+        if args.game == "all":
+            parser.error("--strategy needs a single game")
+        if args.strategy not in GAMES[args.game][2]:
+            parser.error(f"unknown strategy {args.strategy!r} for {args.game} (expected one of {', '.join(GAMES[args.game][2])})")
+        strategies[args.game] = args.strategy
+    if args.variant is not None:
+        from poker_variants import VARIANTS
+        if args.variant not in VARIANTS:
+            parser.error(f"unknown variant {args.variant!r} (expected one of {', '.join(VARIANTS)})")
+    for game in games:
+        if game.endswith("_poker") and strategies.get(game, GAMES[game][3]) == "optimal":
+            from poker_strategy import load_strategy_db
+            from poker_variants import DEFAULT_VARIANT
+            if (args.variant or DEFAULT_VARIANT) != DEFAULT_VARIANT:
+                if args.game == "all":
+                    strategies[game] = "simple" # The strategy database only covers Jacks or Better
+                else:
+                    parser.error("the optimal strategy covers Jacks or Better only; use --strategy simple")
+            elif not load_strategy_db():
+                parser.error("the optimal strategy needs the strategy database")
+
+    report = run_simulation(games, args.rounds, strategies, args.variant, args.seed, args.workers, args.job_size, args.confidence)
+    print(format_report(report))
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.report}")
@@ -1,8 +1,9 @@
 import random
-from typing import List, Tuple, Dict
+from typing import List, Optional, Tuple, Dict
 
 # --- Constants ---
-from config_layout_slots import NUM_REELS
+import config_rng as rng_cfg
+from rng import get_stream
 
 # Define the symbols present on each virtual reel strip
 # More frequent symbols appear more often
@@ -18,6 +19,7 @@ REEL_STRIPS: List[List[str]] = [
     ["cherry", "bell", "1bar", "7", "2bar", "bell", "3bar", "1bar", "cherry", "2bar",
      "bell", "1bar", "3bar", "7", "cherry", "bell", "1bar", "2bar", "3bar", "7"]
 ]
+NUM_REELS = len(REEL_STRIPS) # Number of reels
 
 # Define the single payline (middle row)
 # Indices correspond to the visible symbols on the reels (e.g., [reel1_symbol, reel2_symbol, reel3_symbol])
@@ -42,12 +44,15 @@ SLOTS_PAYOUTS: Dict[Tuple[str, ...], int] = {
 
 BAR_SYMBOLS = {"1bar", "2bar", "3bar"}
 
-def spin_reels() -> List[str]:
-    """Simulates spinning the reels and returns the result on the payline."""
+SLOTS_COST_PER_SPIN = 1 # Bet per spin
+
+def spin_reels(rng: Optional[random.Random] = None) -> List[str]:
+    """Simulates spinning the reels (with the "slots" stream by default) and returns the result on the payline."""
+    rng = rng or get_stream(rng_cfg.STREAM_SLOTS)
     result = []
     for strip in REEL_STRIPS:
         # Pick a random symbol from the strip for each reel
-        result.append(random.choice(strip))
+        result.append(rng.choice(strip))
     return result
 
 def calculate_winnings(payline_symbols: List[str], bet_amount: int) -> Tuple[int, str]: